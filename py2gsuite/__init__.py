@@ -1,7 +1,11 @@
-import pkg_resources
+from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Dict
 
-from .api import SheetsAPI, SlidesAPI
-from .utils import CredentialType, InsertType, ScopeType
+from .utils.lazy import lazy_attributes
+from .utils.types import CredentialType, InsertType, ScopeType
+
+if TYPE_CHECKING:
+    from .api import SheetsAPI, SlidesAPI
 
 __all__ = (
     "SheetsAPI",
@@ -22,7 +26,15 @@ __all__ = (
     "ScopeType",
 )
 
-__version__ = pkg_resources.get_distribution("py2gsuite").version
+try:
+    __version__ = version("py2gsuite")
+except PackageNotFoundError:  # pragma: no cover
+    __version__ = "unknown"
+
+# NOTE: Wrappers are imported on first access, because googleapiclient and google-auth take long to import.
+_LAZY_ATTRS: Dict[str, str] = {"SheetsAPI": ".api", "SlidesAPI": ".api"}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRS)
 
 
 # InsertType alias
@@ -1,4 +1,23 @@
-from .sheets import SheetsAPI
-from .slides import SlidesAPI
+from typing import TYPE_CHECKING, Dict
 
-__all__ = ("SheetsAPI", "SlidesAPI")
+from py2gsuite.utils.lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .sheets import ChunkReport, SheetsAPI
+    from .slides import BatchHandle, CellStyle, SlideElement, SlidesAPI, SlidesBatch
+
+__all__ = ("SheetsAPI", "SlidesAPI", "ChunkReport", "BatchHandle", "SlidesBatch", "CellStyle", "SlideElement")
+
+# NOTE: Wrappers are imported on first access, so that importing light submodules (e.g. `py2gsuite.api.metrics`)
+# does not import googleapiclient.
+_LAZY_ATTRS: Dict[str, str] = {
+    "SheetsAPI": ".sheets",
+    "ChunkReport": ".sheets",
+    "SlidesAPI": ".slides",
+    "BatchHandle": ".slides",
+    "SlidesBatch": ".slides",
+    "CellStyle": ".slides",
+    "SlideElement": ".slides",
+}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRS)
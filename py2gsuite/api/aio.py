@@ -0,0 +1,800 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from secrets import token_hex
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import quote, urlparse
+
+import httplib2
+from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import Request
+from googleapiclient.errors import HttpError
+
+from py2gsuite.utils import SlideLayout, get_logger
+from py2gsuite.utils.a1 import A1Range
+from py2gsuite.utils.chunk import iter_chunks
+from py2gsuite.utils.layout import EMU_PER_PT, PAGE_SIZE, SPACING, Box, layout
+
+from .base import _retry_after
+from .metrics import emit
+from .page_index import INDEX_FIELDS, PageIndex
+from .ratelimit import RateLimiter, get_default_limiter
+from .retry import CallRecord, RetryPolicy, get_default_retry_policy, is_idempotent
+from .sheets import ChunkReport
+from .slides import (
+    CellStyle,
+    add_image_requests,
+    add_text_requests,
+    create_slide_requests,
+    create_table_requests,
+    insert_table_requests,
+    style_table_requests,
+)
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover
+    aiohttp = None
+
+__all__ = ("AsyncClient", "AsyncSheetsAPI", "AsyncSlidesAPI")
+
+logger = get_logger()
+
+SHEETS_URL = "https://sheets.googleapis.com/v4/spreadsheets"
+SLIDES_URL = "https://slides.googleapis.com/v1/presentations"
+
+
+# Action of REST calls without custom verb, as in method IDs of discovery documents.
+_VERBS: Dict[str, str] = {"GET": "get", "PUT": "update", "POST": "create", "DELETE": "delete", "PATCH": "patch"}
+
+
+def _method_name(api: str, method: str, url: str) -> str:
+    """Returns the method ID of the call for metrics, e.g. 'sheets.spreadsheets.values.batchUpdate'."""
+    path, _, action = urlparse(url).path.partition(":")
+    # NOTE: Path is /{version}/{collection}/{id}/{collection}/{id}..., so collections are at odd positions.
+    collections: List[str] = path.strip("/").split("/")[1::2]
+    return ".".join([api, *collections, action or _VERBS.get(method, method.lower())])
+
+
+class AsyncClient:
+    """Asynchronous HTTP client authorized by credentials, built on aiohttp.
+
+    A client can be shared by many async API instances, then the number of in-flight requests
+    is bounded by `max_concurrency` in total.
+
+    Attributes:
+        creds (Credentials): Credentials instance.
+        max_concurrency (int): Max number of in-flight requests.
+        retry_policy (Optional[RetryPolicy]): Retry policy. If None, the default policy is used.
+    """
+
+    def __init__(self, creds: Credentials, max_concurrency: int = 10, session: Optional[Any] = None) -> None:
+        """
+        Args:
+            creds (Credentials): Credentials instance.
+            max_concurrency (int): Max number of in-flight requests. Defaults to 10.
+            session (Optional[aiohttp.ClientSession]): Session to send requests. If None, create new one
+                when the first request is sent. Defaults to None.
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncClient requires aiohttp. Please install with `pip install py2gsuite[aio]`")
+        self.creds: Credentials = creds
+        self.max_concurrency: int = max_concurrency
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._owns_session: bool = session is None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self.retry_policy: Optional[RetryPolicy] = None
+
+    async def _authorize(self, headers: Dict[str, str]) -> None:
+        if self.creds is None:
+            return
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            if not self.creds.valid:
+                # NOTE: Refresh is blocking, so run it in another thread.
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self.creds.refresh, Request(httplib2.Http()))
+        self.creds.apply(headers)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Sequence[Tuple[str, str]]] = None,
+        body: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Send a request and returns decoded JSON response.
+
+        Args:
+            method (str): HTTP method.
+            url (str): URL of the request.
+            params (Optional[Sequence[Tuple[str, str]]]): Query parameters. Defaults to None.
+            body (Optional[Dict[str, Any]]): JSON body. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: Response.
+
+        Raises:
+            HttpError: When the response status is not 2xx and it was not retried or all retries failed.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        limiter: Optional[RateLimiter] = get_default_limiter()
+        # NOTE: Name of API is the subdomain, e.g. 'sheets' of sheets.googleapis.com.
+        api: str = (urlparse(url).hostname or "").split(".")[0]
+        kind: str = "read" if method == "GET" else "write"
+
+        policy: Optional[RetryPolicy] = get_default_retry_policy() if self.retry_policy is None else self.retry_policy
+
+        # NOTE: Body is serialized once here, so that retries and metrics do not serialize it again.
+        data: Optional[bytes] = None if body is None else json.dumps(body).encode("utf-8")
+        name: str = _method_name(api, method, url)
+        idempotent: bool = is_idempotent(name, method)
+        received: int = 0
+        quota_errors: int = 0
+
+        start: float = time.monotonic()
+        attempt: int = 0
+        while True:
+            attempt += 1
+            if limiter is not None:
+                await limiter.acquire_async(api, kind)
+
+            headers: Dict[str, str] = {"accept": "application/json"}
+            if data is not None:
+                headers["content-type"] = "application/json"
+            status: int = 0
+            retry_after: Optional[float] = None
+            try:
+                async with self._semaphore:
+                    await self._authorize(headers)
+                    async with self._session.request(method, url, params=params, data=data, headers=headers) as resp:
+                        status = resp.status
+                        content: bytes = await resp.read()
+                        received += len(content)
+                        quota_errors += status == 429
+                        if limiter is not None:
+                            limiter.feedback(api, kind, status)
+                        if status < 300:
+                            emit(
+                                CallRecord(
+                                    name,
+                                    status,
+                                    attempt - 1,
+                                    time.monotonic() - start,
+                                    len(data or b"") * attempt,
+                                    received,
+                                    quota_errors,
+                                )
+                            )
+                            return json.loads(content) if content else {}
+                        info: Dict[str, Any] = dict(resp.headers)
+                        info.update(status=status, reason=resp.reason)
+                        error = HttpError(httplib2.Response(info), content, url)
+                        retry_after = _retry_after(error)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                error = err
+
+            elapsed: float = time.monotonic() - start
+            delay: Optional[float] = (
+                None if policy is None else policy.next_delay(status, attempt, elapsed, retry_after, idempotent)
+            )
+            if delay is None:
+                emit(CallRecord(name, status, attempt - 1, elapsed, len(data or b"") * attempt, received, quota_errors))
+                raise error
+            logger.warning(
+                "Retrying %s %s in %.2fs (%d/%d): %s", method, url, delay, attempt, policy.max_attempts, error
+            )
+            await asyncio.sleep(delay)
+
+    async def close(self) -> None:
+        if self._session is not None and self._owns_session:
+            await self._session.close()
+        self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class AsyncAPIBase:
+    def __init__(
+        self,
+        creds: Credentials,
+        file_id: str,
+        client: Optional[AsyncClient] = None,
+        max_concurrency: int = 10,
+    ) -> None:
+        self.creds: Credentials = creds
+        self.id: str = file_id
+        self._owns_client: bool = client is None
+        self.client: AsyncClient = AsyncClient(creds, max_concurrency) if client is None else client
+
+    async def close(self) -> None:
+        if self._owns_client:
+            await self.client.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+
+class AsyncSheetsAPI(AsyncAPIBase):
+    """[summary]
+    The asynchronous wrapper of Google Sheets API. It has the same methods as `SheetsAPI` as coroutines.
+
+    Attributes:
+        creds (Credentials): Credentials instance.
+        id (str): ID of spreadsheet.
+        client (AsyncClient): Client to send requests.
+    """
+
+    def __init__(
+        self,
+        creds: Credentials,
+        sheet_id: str,
+        client: Optional[AsyncClient] = None,
+        max_concurrency: int = 10,
+    ) -> None:
+        """
+        Args:
+            creds (Credentials): Credentials instance.
+            sheet_id (str): ID of spreadsheet.
+            client (Optional[AsyncClient]): Client to send requests. Share one client to bound concurrency
+                over many spreadsheets. Defaults to None.
+            max_concurrency (int): Max number of in-flight requests if `client` is None. Defaults to 10.
+        """
+        super().__init__(creds, sheet_id, client=client, max_concurrency=max_concurrency)
+
+    @classmethod
+    async def with_new(
+        cls,
+        creds: Credentials,
+        title: str,
+        client: Optional[AsyncClient] = None,
+    ) -> Optional[AsyncSheetsAPI]:
+        """Create instance with a new sheet.
+
+        Args:
+            creds (Credentials): The Credentials instance.
+            title (str): The title of a sheet.
+            client (Optional[AsyncClient]): Client to send requests. Defaults to None.
+
+        Returns:
+            Optional[AsyncSheetsAPI]: If failed to request, returns None.
+        """
+        api = cls(creds, "", client=client)
+        try:
+            body = {"properties": {"title": title}}
+            spreadsheet = await api.client.request("POST", SHEETS_URL, [("fields", "spreadsheetId")], body)
+            api.id = spreadsheet.get("spreadsheetId")
+            logger.info("Spreadsheet ID: %s", api.id)
+        except HttpError as err:
+            logger.error(err)
+            await api.close()
+            return None
+        return api
+
+    def _values_url(self, sheet_id: Optional[str], suffix: str) -> str:
+        return f"{SHEETS_URL}/{self.id if sheet_id is None else sheet_id}/values{suffix}"
+
+    async def add_values(
+        self,
+        values: List[List[str]],
+        range_name: str,
+        value_input_option: Optional[str] = None,
+        sheet_id: Optional[str] = None,
+    ) -> bool:
+        """Add values on the cells. If cells are already filled, the old ones are remained.
+
+        Args:
+            values (List[List[str]]): Values of cells, in shape (rows, cols)
+            range_name (str): Range of cells.
+            value_input_option (Optional[str]): Input option. Defaults to None.
+            sheet_id (Optional[str]): ID of sheet. Defaults to None.
+
+        Returns:
+            bool: Whether succeeded to add values.
+        """
+        if value_input_option is None:
+            value_input_option = "USER_ENTERED"
+
+        try:
+            result: Dict[str, Any] = await self.client.request(
+                "POST",
+                self._values_url(sheet_id, f"/{quote(range_name, safe='')}:append"),
+                [("valueInputOption", value_input_option)],
+                {"values": values},
+            )
+            logger.info("%s cells appended.", result.get("updates").get("updatedCells"))
+        except HttpError as err:
+            logger.error(err)
+            return False
+
+        return True
+
+    async def update_values(
+        self,
+        values: List[List[str]],
+        range_name: str,
+        value_input_option: Optional[str] = None,
+        sheet_id: Optional[str] = None,
+    ) -> bool:
+        """Add values on the cells. If cells are already filled, these will be overwritten.
+
+        Args:
+            values (List[List[str]]): Values of cells, in shape (rows, cols)
+            range_name (str): Range of cells.
+            value_input_option (Optional[str]): Input option. Defaults to None.
+            sheet_id (Optional[str]): ID of sheet. Defaults to None.
+
+        Returns:
+            bool: Whether succeeded to update values.
+        """
+        if value_input_option is None:
+            value_input_option = "USER_ENTERED"
+
+        try:
+            result: Dict[str, Any] = await self.client.request(
+                "PUT",
+                self._values_url(sheet_id, f"/{quote(range_name, safe='')}"),
+                [("valueInputOption", value_input_option)],
+                {"values": values},
+            )
+            logger.info("%s cells updated.", result.get("updatedCells"))
+        except HttpError as err:
+            logger.error(err)
+            return False
+
+        return True
+
+    async def batch_update_values(
+        self,
+        data: Iterable[Tuple[str, List[List[Any]]]],
+        value_input_option: Optional[str] = None,
+        sheet_id: Optional[str] = None,
+        max_ranges: int = 100,
+        max_bytes: Optional[int] = 2 * 1024 * 1024,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Update values on many ranges with `values.batchUpdate`. See `SheetsAPI.batch_update_values()`.
+
+        Args:
+            data (Iterable[Tuple[str, List[List[Any]]]]): Pairs of range and values.
+            value_input_option (Optional[str]): Input option. Defaults to None.
+            sheet_id (Optional[str]): ID of sheet. Defaults to None.
+            max_ranges (int): Max number of ranges in a request. Defaults to 100.
+            max_bytes (Optional[int]): Max size of values in a request in bytes. Defaults to 2MB.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Response for each range in order of `data`.
+        """
+        if value_input_option is None:
+            value_input_option = "USER_ENTERED"
+
+        results: List[Optional[Dict[str, Any]]] = []
+        value_ranges = ({"range": range_name, "values": values} for range_name, values in data)
+        for chunk, _ in iter_chunks(value_ranges, max_items=max_ranges, max_bytes=max_bytes):
+            try:
+                body: Dict[str, Any] = {"valueInputOption": value_input_option, "data": chunk}
+                result: Dict[str, Any] = await self.client.request(
+                    "POST", self._values_url(sheet_id, ":batchUpdate"), body=body
+                )
+                logger.info("%s cells updated in %d ranges.", result.get("totalUpdatedCells"), len(chunk))
+                responses: List[Dict[str, Any]] = result.get("responses", [])
+                results.extend(responses[i] if i < len(responses) else {} for i in range(len(chunk)))
+            except HttpError as err:
+                logger.error(err)
+                results.extend([None] * len(chunk))
+
+        return results
+
+    async def batch_get_values(
+        self,
+        ranges: Iterable[str],
+        value_render_option: Optional[str] = None,
+        sheet_id: Optional[str] = None,
+        max_ranges: int = 100,
+    ) -> List[Optional[List[List[Any]]]]:
+        """Get values on many ranges with `values.batchGet`. See `SheetsAPI.batch_get_values()`.
+
+        Args:
+            ranges (Iterable[str]): Ranges of cells.
+            value_render_option (Optional[str]): Render option. Defaults to None.
+            sheet_id (Optional[str]): ID of sheet. Defaults to None.
+            max_ranges (int): Max number of ranges in a request. Defaults to 100.
+
+        Returns:
+            List[Optional[List[List[Any]]]]: Values of each range in order of `ranges`.
+        """
+        if value_render_option is None:
+            value_render_option = "FORMATTED_VALUE"
+
+        results: List[Optional[List[List[Any]]]] = []
+        for chunk, _ in iter_chunks(ranges, max_items=max_ranges, size_fn=len):
+            params: List[Tuple[str, str]] = [("ranges", r) for r in chunk]
+            params.append(("valueRenderOption", value_render_option))
+            try:
+                result: Dict[str, Any] = await self.client.request(
+                    "GET", self._values_url(sheet_id, ":batchGet"), params
+                )
+                value_ranges: List[Dict[str, Any]] = result.get("valueRanges", [])
+                results.extend(
+                    value_ranges[i].get("values", []) if i < len(value_ranges) else None for i in range(len(chunk))
+                )
+            except HttpError as err:
+                logger.error(err)
+                results.extend([None] * len(chunk))
+
+        return results
+
+    async def is_empty(self, range_name: str) -> bool:
+        """Check whether specified cells are empty.
+        Args:
+            range_name (str): Range of cells.
+
+        Returns:
+            bool: Whether all cells are empty.
+        """
+        result = await self.client.request("GET", self._values_url(None, f"/{quote(range_name, safe='')}"))
+        values = result.get("values")
+
+        return values is None
+
+    async def write_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        start_range: str = "A1",
+        chunk_rows: int = 1000,
+        chunk_bytes: Optional[int] = 2 * 1024 * 1024,
+        value_input_option: Optional[str] = None,
+        sheet_id: Optional[str] = None,
+        callback: Optional[Callable[[ChunkReport], None]] = None,
+    ) -> bool:
+        """Write rows to the cells in chunks. See `SheetsAPI.write_rows()`.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): Rows of values.
+            start_range (str): Top-left cell to write from. Defaults to 'A1'.
+            chunk_rows (int): Max number of rows in a chunk. Defaults to 1000.
+            chunk_bytes (Optional[int]): Max size of a chunk in bytes. Defaults to 2MB.
+            value_input_option (Optional[str]): Input option. Defaults to None.
+            sheet_id (Optional[str]): ID of sheet. Defaults to None.
+            callback (Optional[Callable[[ChunkReport], None]]): Function called with the report of each chunk.
+                Defaults to None.
+
+        Returns:
+            bool: Whether succeeded to write all rows.
+        """
+        if value_input_option is None:
+            value_input_option = "USER_ENTERED"
+
+        cursor: A1Range = A1Range.parse(start_range).start
+
+        for index, (chunk, num_bytes) in enumerate(
+            iter_chunks((list(r) for r in rows), max_items=chunk_rows, max_bytes=chunk_bytes)
+        ):
+            num_cols: int = max(len(r) for r in chunk)
+            range_name: str = str(cursor.resize(len(chunk), num_cols))
+            start: float = time.perf_counter()
+            try:
+                await self.client.request(
+                    "PUT",
+                    self._values_url(sheet_id, f"/{quote(range_name, safe='')}"),
+                    [("valueInputOption", value_input_option)],
+                    {"values": chunk},
+                )
+            except HttpError as err:
+                logger.error(err)
+                return False
+
+            report = ChunkReport(index, range_name, len(chunk), num_bytes, time.perf_counter() - start)
+            logger.info(
+                "%d rows written to %s (%.1f rows/s, %.1f bytes/s).",
+                report.rows,
+                range_name,
+                report.rows_per_sec,
+                report.bytes_per_sec,
+            )
+            if callback is not None:
+                callback(report)
+            cursor = cursor.offset(len(chunk))
+
+        return True
+
+
+class AsyncSlidesAPI(AsyncAPIBase):
+    """The asynchronous wrapper of Google Slides API. It has the same methods as `SlidesAPI` as coroutines.
+
+    Attributes:
+        creds (Credentials): The Credentials instance.
+        id (str): The ID of presentation.
+        client (AsyncClient): Client to send requests.
+    """
+
+    def __init__(
+        self,
+        creds: Credentials,
+        presentation_id: str,
+        client: Optional[AsyncClient] = None,
+        max_concurrency: int = 10,
+    ) -> None:
+        """
+        Args:
+            creds (Credentials): Credentials instance.
+            presentation_id (str): ID of presentation.
+            client (Optional[AsyncClient]): Client to send requests. Share one client to bound concurrency
+                over many presentations. Defaults to None.
+            max_concurrency (int): Max number of in-flight requests if `client` is None. Defaults to 10.
+        """
+        super().__init__(creds, presentation_id, client=client, max_concurrency=max_concurrency)
+        self._index: Optional[PageIndex] = None
+
+    @classmethod
+    async def with_new(
+        cls,
+        creds: Credentials,
+        title: str,
+        client: Optional[AsyncClient] = None,
+    ) -> Optional[AsyncSlidesAPI]:
+        """[summary]
+        Create AsyncSlidesAPI instance with new presentation.
+
+        Args:
+            creds (Credentials): Credentials instance.
+            title (str): The title of presentation.
+            client (Optional[AsyncClient]): Client to send requests. Defaults to None.
+
+        Returns:
+            Optional[AsyncSlidesAPI]: AsyncSlidesAPI instance. If fail, returns None.
+        """
+        api = cls(creds, "", client=client)
+        try:
+            presentation = await api.client.request("POST", SLIDES_URL, body={"title": title})
+            api.id = presentation.get("presentationId")
+            logger.info("Created presentation with ID: %s", api.id)
+        except HttpError as err:
+            logger.error(err)
+            await api.close()
+            return None
+        return api
+
+    async def _post_update(self, requests: List[Any]) -> Optional[Dict[str, Any]]:
+        try:
+            response: Dict[str, Any] = await self.client.request(
+                "POST", f"{SLIDES_URL}/{self.id}:batchUpdate", body={"requests": requests}
+            )
+        except HttpError as err:
+            logger.error(err)
+            return None
+
+        if self._index is not None:
+            self._index.apply(requests, response.get("replies"))
+        return response
+
+    async def get_index(self, refresh: bool = False) -> Optional[PageIndex]:
+        """Returns the local index of slides and page elements. See `SlidesAPI.get_index()`.
+
+        Args:
+            refresh (bool): Whether to load the index again. Defaults to False.
+
+        Returns:
+            Optional[PageIndex]: The index. If failed to load, returns None.
+        """
+        if self._index is None or self._index.stale or refresh:
+            try:
+                presentation: Dict[str, Any] = await self.client.request(
+                    "GET", f"{SLIDES_URL}/{self.id}", [("fields", INDEX_FIELDS)]
+                )
+            except HttpError as err:
+                logger.error(err)
+                return None
+            if self._index is None:
+                self._index = PageIndex()
+            self._index.load(presentation)
+        return self._index
+
+    async def _first_page(self) -> Optional[str]:
+        index: Optional[PageIndex] = await self.get_index()
+        page_id: Optional[str] = None if index is None else index.first_slide
+        if page_id is None:
+            logger.error("No slide to add elements to.")
+        return page_id
+
+    async def _place(self, page_id: str, sizes: Sequence[Tuple[int, int]]) -> Optional[List[Box]]:
+        index: Optional[PageIndex] = await self.get_index()
+        page_size: Tuple[int, int] = PAGE_SIZE if index is None else index.page_size
+        occupied: List[Box] = [] if index is None else index.boxes(page_id)
+        try:
+            return layout(sizes, "pack", page_size, occupied, margin=SPACING, gap=SPACING)
+        except ValueError as err:
+            logger.warning(err)
+            return None
+
+    async def _submit(self, name: str, requests: List[Dict[str, Any]], reply_key: Optional[str] = None) -> bool:
+        response: Optional[Dict[str, Any]] = await self._post_update(requests)
+        if response is None:
+            return False
+        if reply_key is not None:
+            reply: Dict[str, Any] = response.get("replies")[0].get(reply_key)
+            logger.info("Created %s with ID: %s", name, reply.get("objectId"))
+        return True
+
+    async def exists_page(self, page_id: str) -> bool:
+        """Check if the page that has specified page_id exists.
+
+        Args:
+            page_id (str): ID of page.
+
+        Returns:
+            bool: Wether page exists.
+        """
+        try:
+            page: Dict[str, Any] = await self.client.request(
+                "GET", f"{SLIDES_URL}/{self.id}/pages/{page_id}", [("fields", "objectId")]
+            )
+        except HttpError as err:
+            logger.error(err)
+            return False
+
+        return page.get("objectId") == page_id
+
+    async def create_slide(
+        self,
+        page_id: str,
+        layout: SlideLayout = SlideLayout.BLANK,
+        insertion_index: Optional[int] = None,
+    ) -> bool:
+        """[summary]
+        Create new slide to the presentation.
+
+        Args:
+            page_id (str): ID of new page.
+            layout (SlideLayout): Defaults to SlideLayout.BLANK
+            insertion_index (Optional[int]): 0-based position of new slide. If None, append to the end.
+                Defaults to None.
+
+        Returns:
+            bool: Whether succeeded to create new slide.
+        """
+        return await self._submit("slide", create_slide_requests(page_id, layout, insertion_index), "createSlide")
+
+    async def add_text(self, text: str, page_id: Optional[str] = None, **kwargs) -> bool:
+        """[summary]
+        Add new text to specified slide.
+        If page_id is not specified, add text to the first slide.
+
+        Args:
+            text (str): text info to be inserted.
+            page_id (str): page ID to be inserted.
+
+        **kwargs:
+            element_id (str): the element ID of text. If None, create with random token.
+            magnitude (int): magnitude of textbox. Defaults to 100.
+
+        Returns:
+            bool: Whether succeeded to add text.
+        """
+        if page_id is None:
+            page_id = await self._first_page()
+            if page_id is None:
+                return False
+
+        element_id: str = kwargs.get("element_id", token_hex(16))
+        magnitude: int = kwargs.get("magnitude", 100)
+        boxes: Optional[List[Box]] = await self._place(page_id, [(magnitude * EMU_PER_PT, magnitude * EMU_PER_PT)])
+        requests: List[Dict[str, Any]] = add_text_requests(
+            text, page_id, element_id, magnitude, box=None if boxes is None else boxes[0]
+        )
+        return await self._submit("textbox", requests, "createShape")
+
+    async def add_image(self, img_url: str, page_id: Optional[str] = None, **kwargs) -> bool:
+        """[summary]
+        Add new image to specified slide.
+        If page_id is not specified, add image to the first slide.
+
+        Args:
+            img_url (str): URL of image.
+            page_id (Optional[str]): ID of page. Defaults to None.
+
+        **kwargs:
+            image_id (str): ID of image. If None, create with random token. Defaults to None.
+            magnitude (int): Size of image. Defaults to 4000.
+
+        Returns:
+            bool: Whether succeeded to add image.
+        """
+        if page_id is None:
+            page_id = await self._first_page()
+            if page_id is None:
+                return False
+
+        image_id: str = kwargs.get("image_id", token_hex(16))
+        magnitude: int = kwargs.get("magnitude", 4000)
+        boxes: Optional[List[Box]] = await self._place(page_id, [(magnitude, magnitude)])
+        requests: List[Dict[str, Any]] = add_image_requests(
+            img_url, page_id, image_id, magnitude, box=None if boxes is None else boxes[0]
+        )
+        return await self._submit("image", requests, "createImage")
+
+    async def create_empty_table(self, table_id: str, rows: int, cols: int, page_id: Optional[str] = None) -> bool:
+        """Create empty table.
+
+        Args:
+            table_id (str): The ID of table.
+            rows (int): The number of rows.
+            cols (int): The number of columns.
+            page_id (Optional[str]): The ID of page. If None, the table will be created on the first page.
+                Defaults to None.
+
+        Returns:
+            bool: Whether succeeded to create the table.
+        """
+        if page_id is None:
+            page_id = await self._first_page()
+            if page_id is None:
+                return False
+
+        return await self._submit("table", create_table_requests(table_id, rows, cols, page_id), "createTable")
+
+    async def add_table(
+        self,
+        values: List[List[str]],
+        table_id: Optional[str] = None,
+        page_id: Optional[str] = None,
+        styles: Optional[Sequence[CellStyle]] = None,
+        max_requests: int = 1000,
+        max_bytes: Optional[int] = 2 * 1024 * 1024,
+    ) -> bool:
+        """Add values to the table. See `SlidesAPI.add_table()` for details.
+
+        Args:
+            values (List[List[str]]): Values of elements, in shape (rows, cols).
+            table_id (Optional[str]): ID of table. If None, create new table. Defaults to None.
+            page_id (Optional[str]): ID of page. If None, create on the first page. Defaults to None.
+            styles (Optional[Sequence[CellStyle]]): Styles applied to ranges of cells. Defaults to None.
+            max_requests (int): Max number of requests in a batchUpdate call. Defaults to 1000.
+            max_bytes (Optional[int]): Max size of requests in a batchUpdate call in bytes. Defaults to 2MB.
+
+        Returns:
+            bool: Whether succeeded to add elements in the table.
+        """
+        assert isinstance(values, list)
+        assert all([isinstance(e, list) for e in values])
+
+        rows: int = len(values)
+        cols: int = len(values[0])
+        assert all([len(e) == cols for e in values])
+
+        requests: List[Dict[str, Any]] = []
+        reply_key: Optional[str] = None
+        # Create new empty table within the same request
+        if table_id is None:
+            if page_id is None:
+                page_id = await self._first_page()
+                if page_id is None:
+                    return False
+            table_id = token_hex(16)
+            requests.extend(create_table_requests(table_id, rows, cols, page_id))
+            reply_key = "createTable"
+
+        requests.extend(insert_table_requests(values, table_id))
+        if styles:
+            requests.extend(style_table_requests(styles, table_id, rows, cols))
+
+        # Chunks are posted in order, since later ones refer to the table created in the first one.
+        for chunk, _ in iter_chunks(requests, max_items=max_requests, max_bytes=max_bytes):
+            if not await self._submit("table", chunk, reply_key):
+                return False
+            reply_key = None
+        return True
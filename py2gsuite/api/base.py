@@ -1,27 +1,144 @@
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractclassmethod, abstractmethod
-from typing import Optional
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional
 
+import httplib2
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import Resource
+from googleapiclient.errors import HttpError
+from googleapiclient.http import HttpRequest
+
+from py2gsuite.utils import get_logger
+
+from .discovery import is_cached_service
+from .metrics import emit
+from .ratelimit import RateLimiter, get_default_limiter
+from .retry import CallRecord, RetryPolicy, get_default_retry_policy, is_idempotent
+
+logger = get_logger()
+
+
+def _retry_after(err: HttpError) -> Optional[float]:
+    value: Optional[str] = err.resp.get("retry-after")
+    try:
+        return None if value is None else float(value)
+    except ValueError:
+        return None
+
+
+def execute(
+    request: HttpRequest,
+    api: str,
+    policy: Optional[RetryPolicy] = None,
+    record: Optional[Callable[[CallRecord], None]] = None,
+) -> Any:
+    """Execute request under the process-wide rate limiter and retry policy.
+    The record of the call is passed to `record` and registered metrics sinks.
+
+    Args:
+        request (HttpRequest): Request to be executed.
+        api (str): Name of API, e.g. 'sheets'.
+        policy (Optional[RetryPolicy]): Retry policy. If None, the default policy is used. Defaults to None.
+        record (Optional[Callable[[CallRecord], None]]): Function called with the record of the call.
+            Defaults to None.
+
+    Returns:
+        Any: Response of the request.
+
+    Raises:
+        HttpError: When the request failed and it was not retried or all retries failed.
+    """
+    limiter: Optional[RateLimiter] = get_default_limiter()
+    if policy is None:
+        policy = get_default_retry_policy()
+
+    method: str = getattr(request, "methodId", None) or api
+    kind: str = "read" if request.method == "GET" else "write"
+    idempotent: bool = is_idempotent(method, request.method)
+    body: Optional[str] = getattr(request, "body", None)
+    body_size: int = len(body) if body else 0
+    received: List[int] = [0]
+
+    def on_response(resp: httplib2.Response) -> None:
+        received[0] += int(resp.get("content-length", 0))
+
+    if hasattr(request, "add_response_callback"):
+        request.add_response_callback(on_response)
+
+    def finish(status: int, attempt: int, quota_errors: int) -> None:
+        call = CallRecord(
+            method, status, attempt - 1, time.monotonic() - start, body_size * attempt, received[0], quota_errors
+        )
+        if record is not None:
+            record(call)
+        emit(call)
+
+    start: float = time.monotonic()
+    attempt: int = 0
+    quota_errors: int = 0
+    while True:
+        attempt += 1
+        if limiter is not None:
+            limiter.acquire(api, kind)
+        try:
+            response: Any = request.execute()
+        except (HttpError, OSError, httplib2.HttpLib2Error) as err:
+            status: int = err.resp.status if isinstance(err, HttpError) else 0
+            quota_errors += status == 429
+            if limiter is not None and status != 0:
+                limiter.feedback(api, kind, status)
+            elapsed: float = time.monotonic() - start
+            retry_after: Optional[float] = _retry_after(err) if isinstance(err, HttpError) else None
+            delay: Optional[float] = (
+                None if policy is None else policy.next_delay(status, attempt, elapsed, retry_after, idempotent)
+            )
+            if delay is None:
+                finish(status, attempt, quota_errors)
+                raise
+            logger.warning("Retrying %s in %.2fs (%d/%d): %s", method, delay, attempt, policy.max_attempts, err)
+            time.sleep(delay)
+            continue
+
+        if limiter is not None:
+            limiter.feedback(api, kind, 200)
+        finish(200, attempt, quota_errors)
+        return response
 
 
 class APIBase(ABC):
+    #: Name of API, used to share quotas among instances.
+    api_name: str
+
     @abstractmethod
     def __init__(self, creds: Credentials, file_id: str) -> None:
         super().__init__()
         self.creds: Credentials = creds
         self.id: str = file_id
         self.service: Resource
+        self.retry_policy: Optional[RetryPolicy] = None
+        self.calls: Deque[CallRecord] = deque(maxlen=1000)
 
     @classmethod
     @abstractclassmethod
     def with_new(cls, creds: Credentials, title: str) -> Optional[APIBase]:
         pass
 
+    @property
+    def last_call(self) -> Optional[CallRecord]:
+        """Returns the record of the last call, including the number of retries."""
+        return self.calls[-1] if self.calls else None
+
+    def _execute(self, request: HttpRequest) -> Any:
+        return execute(request, self.api_name, policy=self.retry_policy, record=self.calls.append)
+
     def close(self) -> None:
-        self.service.close()
+        # NOTE: Cached Resource is shared by other instances, so it is kept open.
+        service: Optional[Resource] = getattr(self, "service", None)
+        if service is not None and not is_cached_service(service):
+            service.close()
 
     def __del__(self):
         self.close()
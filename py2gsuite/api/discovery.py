@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import os
+import os.path as osp
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+import httplib2
+from googleapiclient.discovery import V2_DISCOVERY_URI, Resource, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
+from googleapiclient.errors import HttpError
+
+from py2gsuite.utils import get_logger
+
+from .transport import HttpPool, authorized_http
+
+__all__ = ("build_service", "get_collection", "get_document", "set_cache_dir", "clear_cache", "is_cached_service")
+
+logger = get_logger()
+
+# Directory to store discovery documents on disk. If None, documents are cached only in memory.
+_cache_dir: Optional[str] = os.environ.get("PY2GSUITE_DISCOVERY_CACHE")
+
+_lock = threading.RLock()
+_documents: Dict[Tuple[str, str], str] = {}
+# NOTE: Credentials are kept in values, so that its id() is never reused while cached.
+# Least recently used Resources are dropped beyond `_max_services`, so short-lived credentials are not kept forever.
+_services: OrderedDict[Tuple[str, str, int], Tuple[Any, Resource]] = OrderedDict()
+_max_services: int = 32
+_collections: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def set_cache_dir(cache_dir: Optional[str]) -> None:
+    """Set directory to store discovery documents on disk.
+
+    Args:
+        cache_dir (Optional[str]): Path of directory. If None, documents are cached only in memory.
+    """
+    global _cache_dir
+    _cache_dir = cache_dir
+
+
+def get_document(api: str, version: str) -> str:
+    """Returns discovery document of the API.
+
+    Documents are looked up in order of memory, disk cache, the static documents shipped with googleapiclient
+    and the discovery service. Only the last one makes a network fetch.
+
+    Args:
+        api (str): Name of API, e.g. 'sheets'.
+        version (str): Version of API, e.g. 'v4'.
+
+    Returns:
+        str: Discovery document as JSON string.
+
+    Raises:
+        HttpError: If the discovery service responded with an error.
+    """
+    key: Tuple[str, str] = (api, version)
+    with _lock:
+        document: Optional[str] = _documents.get(key)
+        if document is not None:
+            return document
+
+        filepath: Optional[str] = None if _cache_dir is None else osp.join(_cache_dir, f"{api}.{version}.json")
+        if filepath is not None and osp.exists(filepath):
+            with open(filepath, "r") as f:
+                document = f.read()
+
+        if document is None:
+            document = get_static_doc(api, version)
+
+        if document is None:
+            uri: str = V2_DISCOVERY_URI.format(api=api, apiVersion=version)
+            logger.info("Fetching discovery document: %s", uri)
+            resp, content = httplib2.Http().request(uri)
+            if resp.status != 200:
+                raise HttpError(resp, content, uri=uri)
+            document = content.decode("utf-8")
+
+        if filepath is not None and not osp.exists(filepath):
+            # NOTE: Written to a temporary file and renamed, so that other processes never read a partial document.
+            os.makedirs(_cache_dir, exist_ok=True)
+            tmp_path: str = f"{filepath}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                f.write(document)
+            os.replace(tmp_path, filepath)
+
+        _documents[key] = document
+        return document
+
+
+def build_service(
+    api: str,
+    version: str,
+    creds: Any,
+    cache: bool = True,
+    pool: Optional[HttpPool] = None,
+) -> Resource:
+    """Returns Resource instance of the API.
+
+    Requests of the Resource are sent through connections checked out from `pool`,
+    so the Resource can be shared by threads.
+
+    Args:
+        api (str): Name of API, e.g. 'sheets'.
+        version (str): Version of API, e.g. 'v4'.
+        creds (Any): Credentials instance.
+        cache (bool): Whether to reuse the Resource built for the same API, version and credentials.
+            Defaults to True.
+        pool (Optional[HttpPool]): The pool of connections. If None, the default pool is used. Defaults to None.
+
+    Returns:
+        Resource: Resource instance.
+    """
+    if not cache or pool is not None:
+        return build_from_document(get_document(api, version), http=authorized_http(creds, pool))
+
+    key: Tuple[str, str, int] = (api, version, id(creds))
+    with _lock:
+        cached: Optional[Tuple[Any, Resource]] = _services.get(key)
+        if cached is None:
+            service: Resource = build_from_document(get_document(api, version), http=authorized_http(creds))
+            _services[key] = (creds, service)
+            while len(_services) > _max_services:
+                _services.popitem(last=False)
+            return service
+        _services.move_to_end(key)
+        return cached[1]
+
+
+def get_collection(service: Resource, *names: str) -> Resource:
+    """Returns the nested collection of the Resource, e.g. `service.spreadsheets().values()`.
+
+    googleapiclient builds a new collection and the docs of its methods on every call,
+    so collections are cached for each Resource.
+
+    Args:
+        service (Resource): Resource instance.
+        *names (str): Names of nested collections, e.g. 'spreadsheets', 'values'.
+
+    Returns:
+        Resource: The collection.
+    """
+    with _lock:
+        try:
+            collections: Dict[Tuple[str, ...], Resource] = _collections.setdefault(service, {})
+        except TypeError:
+            # NOTE: Objects which are not weak-referenceable, e.g. mocks of Resource, are not cached.
+            collections = {}
+        collection: Optional[Resource] = collections.get(names)
+        if collection is None:
+            collection = service
+            for name in names:
+                collection = getattr(collection, name)()
+            collections[names] = collection
+        return collection
+
+
+def is_cached_service(service: Resource) -> bool:
+    """Returns whether the Resource is cached and shared by others.
+
+    Args:
+        service (Resource): Resource instance.
+
+    Returns:
+        bool: Whether the Resource is cached.
+    """
+    with _lock:
+        return any(cached is service for _, cached in _services.values())
+
+
+def clear_cache() -> None:
+    """Clear cached discovery documents and Resources in memory. Cached Resources are closed."""
+    with _lock:
+        for _, service in _services.values():
+            service.close()
+        _services.clear()
+        _documents.clear()
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional, Sequence
+
+from py2gsuite.utils import get_logger
+
+from .retry import CallRecord
+
+__all__ = (
+    "MetricsSink",
+    "MethodStats",
+    "InMemorySink",
+    "PrometheusSink",
+    "OpenTelemetrySink",
+    "add_sink",
+    "remove_sink",
+    "get_sinks",
+    "emit",
+)
+
+logger = get_logger()
+
+#: Upper bounds of latency histogram buckets in seconds.
+LATENCY_BUCKETS: Sequence[float] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class MetricsSink(ABC):
+    """Destination of records of API calls. Sinks are called from the thread which made the call."""
+
+    @abstractmethod
+    def record(self, record: CallRecord) -> None:
+        pass
+
+
+class MethodStats:
+    """Aggregated metrics of an API method.
+
+    Attributes:
+        count (int): The number of calls.
+        errors (int): The number of failed calls.
+        retries (int): The number of retries.
+        quota_errors (int): The number of attempts rejected with 429.
+        bytes_sent (int): Total size of request bodies.
+        bytes_received (int): Total size of response bodies.
+        latency_sum (float): Total seconds of calls including retries.
+        buckets (List[int]): The number of calls in each latency bucket, non-cumulative. The last one is +Inf.
+    """
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.bounds: Sequence[float] = bounds
+        self.count: int = 0
+        self.errors: int = 0
+        self.retries: int = 0
+        self.quota_errors: int = 0
+        self.bytes_sent: int = 0
+        self.bytes_received: int = 0
+        self.latency_sum: float = 0.0
+        self.buckets: List[int] = [0] * (len(bounds) + 1)
+
+    def add(self, record: CallRecord) -> None:
+        self.count += 1
+        self.errors += 0 if 200 <= record.status < 300 else 1
+        self.retries += record.retries
+        self.quota_errors += record.quota_errors
+        self.bytes_sent += record.bytes_sent
+        self.bytes_received += record.bytes_received
+        self.latency_sum += record.elapsed
+        index: int = next((i for i, bound in enumerate(self.bounds) if record.elapsed <= bound), len(self.bounds))
+        self.buckets[index] += 1
+
+    def quantile(self, q: float) -> float:
+        """Returns the upper bound of the bucket which contains the q-quantile of latency.
+
+        Args:
+            q (float): Quantile in [0, 1].
+
+        Returns:
+            float: Seconds. If the quantile is in the last bucket, returns inf.
+        """
+        rank: float = q * self.count
+        total: int = 0
+        for bound, n in zip(list(self.bounds) + [float("inf")], self.buckets):
+            total += n
+            if total >= rank and total > 0:
+                return bound
+        return 0.0
+
+    def __repr__(self) -> str:
+        mean: float = self.latency_sum / self.count if self.count else 0.0
+        return (
+            f"MethodStats(count={self.count}, errors={self.errors}, retries={self.retries}, "
+            f"quota_errors={self.quota_errors}, mean={mean:.3f}s, sent={self.bytes_sent}B, "
+            f"received={self.bytes_received}B)"
+        )
+
+
+class InMemorySink(MetricsSink):
+    """Sink which aggregates metrics per method in memory."""
+
+    def __init__(self, bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.bounds: Sequence[float] = bounds
+        self._stats: Dict[str, MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, record: CallRecord) -> None:
+        with self._lock:
+            stats: Optional[MethodStats] = self._stats.get(record.method)
+            if stats is None:
+                stats = self._stats[record.method] = MethodStats(self.bounds)
+            stats.add(record)
+
+    def stats(self) -> Dict[str, MethodStats]:
+        """Returns metrics per method, e.g. {'sheets.spreadsheets.values.update': MethodStats(...)}."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats = {}
+
+
+class PrometheusSink(InMemorySink):
+    """Sink which aggregates metrics in memory and renders them in Prometheus text exposition format.
+
+    Examples:
+        >>> sink = PrometheusSink()
+        >>> add_sink(sink)
+        >>> print(sink.render())  # e.g. serve it on /metrics
+    """
+
+    def __init__(self, prefix: str = "py2gsuite", bounds: Sequence[float] = LATENCY_BUCKETS) -> None:
+        super().__init__(bounds)
+        self.prefix: str = prefix
+
+    def render(self) -> str:
+        """Returns metrics in Prometheus text format.
+
+        Returns:
+            str: Metrics.
+        """
+        stats: Dict[str, MethodStats] = self.stats()
+        name: str = f"{self.prefix}_request_duration_seconds"
+        lines: List[str] = [
+            f"# HELP {name} Latency of API calls including retries.",
+            f"# TYPE {name} histogram",
+        ]
+        for method, s in sorted(stats.items()):
+            cumulative: int = 0
+            for bound, n in zip(list(s.bounds) + [float("inf")], s.buckets):
+                cumulative += n
+                le: str = "+Inf" if bound == float("inf") else repr(float(bound))
+                lines.append(f'{name}_bucket{{method="{method}",le="{le}"}} {cumulative}')
+            lines.append(f'{name}_sum{{method="{method}"}} {s.latency_sum}')
+            lines.append(f'{name}_count{{method="{method}"}} {s.count}')
+
+        counters = (
+            ("requests_total", "The number of API calls.", "count"),
+            ("errors_total", "The number of failed API calls.", "errors"),
+            ("retries_total", "The number of retries.", "retries"),
+            ("quota_errors_total", "The number of attempts rejected by quota.", "quota_errors"),
+            ("sent_bytes_total", "Total size of request bodies.", "bytes_sent"),
+            ("received_bytes_total", "Total size of response bodies.", "bytes_received"),
+        )
+        for suffix, help_text, attr in counters:
+            lines.append(f"# HELP {self.prefix}_{suffix} {help_text}")
+            lines.append(f"# TYPE {self.prefix}_{suffix} counter")
+            for method, s in sorted(stats.items()):
+                lines.append(f'{self.prefix}_{suffix}{{method="{method}"}} {getattr(s, attr)}')
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetrySink(MetricsSink):
+    """Sink which exports each call as an OpenTelemetry span. Requires `opentelemetry-api`."""
+
+    def __init__(self, tracer: Optional[Any] = None) -> None:
+        """
+        Args:
+            tracer (Optional[opentelemetry.trace.Tracer]): Tracer. If None, a tracer of the global provider is used.
+        """
+        if tracer is None:
+            # NOTE: Imported here, so that importing the API wrappers does not load opentelemetry.
+            try:
+                from opentelemetry import trace
+            except ImportError:
+                raise ImportError("OpenTelemetrySink requires opentelemetry-api. Please install opentelemetry-api")
+            tracer = trace.get_tracer("py2gsuite")
+        self.tracer = tracer
+
+    def record(self, record: CallRecord) -> None:
+        end: int = time.time_ns()
+        span = self.tracer.start_span(record.method, start_time=end - int(record.elapsed * 1e9))
+        span.set_attribute("http.status_code", record.status)
+        span.set_attribute("py2gsuite.retries", record.retries)
+        span.set_attribute("py2gsuite.quota_errors", record.quota_errors)
+        span.set_attribute("py2gsuite.bytes_sent", record.bytes_sent)
+        span.set_attribute("py2gsuite.bytes_received", record.bytes_received)
+        span.end(end_time=end)
+
+
+_lock = threading.Lock()
+_sinks: List[MetricsSink] = []
+
+
+def add_sink(sink: MetricsSink) -> None:
+    """Register a sink which receives records of all API calls in the process.
+
+    Args:
+        sink (MetricsSink): Sink.
+    """
+    global _sinks
+    with _lock:
+        _sinks = _sinks + [sink]
+
+
+def remove_sink(sink: MetricsSink) -> None:
+    """Unregister a sink.
+
+    Args:
+        sink (MetricsSink): Sink.
+    """
+    global _sinks
+    with _lock:
+        _sinks = [s for s in _sinks if s is not sink]
+
+
+def get_sinks() -> List[MetricsSink]:
+    """Returns registered sinks."""
+    return list(_sinks)
+
+
+def emit(record: CallRecord) -> None:
+    """Pass the record to registered sinks. Errors of sinks are logged and never raised to the caller.
+
+    Args:
+        record (CallRecord): Record of an API call.
+    """
+    # NOTE: The list is replaced instead of mutated on registration, so it is read without lock.
+    for sink in _sinks:
+        try:
+            sink.record(record)
+        except Exception as err:
+            logger.warning("Metrics sink %r failed: %s", sink, err)
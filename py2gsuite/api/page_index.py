@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from py2gsuite.utils.layout import PAGE_SIZE, Box, element_box
+
+__all__ = ("PageIndex", "ElementInfo")
+
+#: Field mask of `presentations.get` to load the index.
+INDEX_FIELDS: str = (
+    "pageSize,slides(objectId,pageElements(objectId,size,transform,shape/shapeType,image/sourceUrl,table/rows,"
+    "line/lineType,video/id,sheetsChart/chartId,elementGroup/children/objectId,wordArt/renderedText))"
+)
+
+# Kinds of page elements, keyed by the field in PageElement.
+_KINDS: Sequence[str] = ("shape", "image", "table", "line", "video", "sheetsChart", "elementGroup", "wordArt")
+
+# Create requests which add a page element, keyed by request type.
+_CREATE_ELEMENTS: Dict[str, str] = {
+    "createShape": "shape",
+    "createImage": "image",
+    "createTable": "table",
+    "createLine": "line",
+    "createVideo": "video",
+    "createSheetsChart": "sheetsChart",
+}
+
+# Requests which never change pages and page elements in the index.
+_NEUTRAL_REQUESTS = frozenset(
+    {
+        "insertText",
+        "deleteText",
+        "replaceAllText",
+        "updateTextStyle",
+        "updateParagraphStyle",
+        "createParagraphBullets",
+        "deleteParagraphBullets",
+        "updateShapeProperties",
+        "updateImageProperties",
+        "updateLineProperties",
+        "updatePageProperties",
+        "updateSlideProperties",
+        "updateTableCellProperties",
+        "updateTableBorderProperties",
+        "updateTableColumnProperties",
+        "updateTableRowProperties",
+    }
+)
+
+
+class ElementInfo(NamedTuple):
+    """Page element in the index.
+
+    Attributes:
+        object_id (str): ID of the element.
+        page_id (str): ID of the page which has the element.
+        kind (str): Kind of the element, e.g. 'shape', 'image', 'table'.
+        size (Optional[Dict[str, Any]]): Size of the element.
+        transform (Optional[Dict[str, Any]]): Transform of the element.
+    """
+
+    object_id: str
+    page_id: str
+    kind: str
+    size: Optional[Dict[str, Any]] = None
+    transform: Optional[Dict[str, Any]] = None
+
+
+class PageIndex:
+    """Local index of slides and page elements of a presentation.
+
+    The index is loaded from a `presentations.get` response and updated from posted requests and their replies,
+    so lookups cost no round trip. If a request whose effect cannot be known locally is applied, e.g. duplicating
+    a slide with unknown element IDs, the index is marked as stale and should be loaded again.
+
+    Attributes:
+        slides (List[str]): IDs of slides in order.
+        elements (Dict[str, ElementInfo]): Page elements keyed by ID.
+        stale (bool): Whether the index may differ from the presentation.
+        page_size (Tuple[int, int]): (width, height) of pages in EMU.
+    """
+
+    def __init__(self) -> None:
+        self.page_size: Tuple[int, int] = PAGE_SIZE
+        self.slides: List[str] = []
+        self.elements: Dict[str, ElementInfo] = {}
+        self.stale: bool = False
+
+    def __contains__(self, object_id: str) -> bool:
+        return object_id in self.elements or object_id in self.slides
+
+    @property
+    def first_slide(self) -> Optional[str]:
+        """Returns ID of the first slide. If there is no slide, returns None."""
+        return self.slides[0] if self.slides else None
+
+    def load(self, presentation: Dict[str, Any]) -> None:
+        """Load the index from a presentation resource, fetched with `INDEX_FIELDS`.
+
+        Args:
+            presentation (Dict[str, Any]): Response of `presentations.get`.
+        """
+        self.slides = []
+        self.elements = {}
+        page_size: Optional[Box] = element_box(presentation.get("pageSize"), None)
+        if page_size is not None:
+            self.page_size = (page_size.width, page_size.height)
+        for slide in presentation.get("slides", []):
+            page_id: str = slide["objectId"]
+            self.slides.append(page_id)
+            for element in slide.get("pageElements", []):
+                kind: str = next((k for k in _KINDS if k in element), "unknown")
+                self.elements[element["objectId"]] = ElementInfo(
+                    element["objectId"], page_id, kind, element.get("size"), element.get("transform")
+                )
+        self.stale = False
+
+    def page_elements(self, page_id: str) -> List[ElementInfo]:
+        """Returns page elements on the page.
+
+        Args:
+            page_id (str): ID of page.
+
+        Returns:
+            List[ElementInfo]: Page elements.
+        """
+        return [element for element in self.elements.values() if element.page_id == page_id]
+
+    def boxes(self, page_id: str) -> List[Box]:
+        """Returns bounding boxes of page elements on the page.
+
+        Args:
+            page_id (str): ID of page.
+
+        Returns:
+            List[Box]: Bounding boxes in EMU.
+        """
+        boxes = (element_box(element.size, element.transform) for element in self.page_elements(page_id))
+        return [box for box in boxes if box is not None]
+
+    def apply(self, requests: Sequence[Dict[str, Any]], replies: Optional[Sequence[Dict[str, Any]]] = None) -> None:
+        """Update the index with requests posted by batchUpdate and their replies.
+
+        Args:
+            requests (Sequence[Dict[str, Any]]): Posted requests.
+            replies (Optional[Sequence[Dict[str, Any]]]): Replies for requests. Defaults to None.
+        """
+        if replies is None:
+            replies = [{}] * len(requests)
+
+        for request, reply in zip(requests, replies):
+            kind, body = next(iter(request.items()))
+            if kind in _NEUTRAL_REQUESTS:
+                continue
+            object_id: Optional[str] = body.get("objectId") or (reply.get(kind) or {}).get("objectId")
+
+            if kind == "createSlide" and object_id is not None:
+                index: Optional[int] = body.get("insertionIndex")
+                self.slides.insert(len(self.slides) if index is None else int(index), object_id)
+            elif kind in _CREATE_ELEMENTS and object_id is not None:
+                properties: Dict[str, Any] = body.get("elementProperties", {})
+                self.elements[object_id] = ElementInfo(
+                    object_id,
+                    properties.get("pageObjectId"),
+                    _CREATE_ELEMENTS[kind],
+                    properties.get("size"),
+                    properties.get("transform"),
+                )
+            elif kind == "deleteObject":
+                self.__delete(body["objectId"])
+            elif kind == "updateSlidesPosition":
+                self.__move(body["slideObjectIds"], int(body.get("insertionIndex", 0)))
+            elif kind == "updatePageElementTransform" and body["objectId"] in self.elements:
+                if body.get("applyMode") == "ABSOLUTE":
+                    element: ElementInfo = self.elements[body["objectId"]]
+                    self.elements[element.object_id] = element._replace(transform=body["transform"])
+                else:
+                    self.stale = True
+            elif kind == "duplicateObject" and body["objectId"] in self.slides:
+                new_id: Optional[str] = (reply.get(kind) or {}).get("objectId") or body.get("objectIds", {}).get(
+                    body["objectId"]
+                )
+                if new_id is not None:
+                    self.slides.insert(self.slides.index(body["objectId"]) + 1, new_id)
+                # NOTE: IDs of duplicated elements are not known unless all of them are specified.
+                self.stale = True
+            else:
+                self.stale = True
+
+    def __delete(self, object_id: str) -> None:
+        if object_id in self.slides:
+            self.slides.remove(object_id)
+            self.elements = {k: v for k, v in self.elements.items() if v.page_id != object_id}
+        else:
+            self.elements.pop(object_id, None)
+
+    def __move(self, slide_ids: Sequence[str], insertion_index: int) -> None:
+        # NOTE: insertionIndex is based on the arrangement before the move.
+        moved = set(slide_ids)
+        insertion_index -= sum(1 for page_id in self.slides[:insertion_index] if page_id in moved)
+        rest: List[str] = [page_id for page_id in self.slides if page_id not in moved]
+        self.slides = rest[:insertion_index] + list(slide_ids) + rest[insertion_index:]
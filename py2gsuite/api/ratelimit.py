@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from py2gsuite.utils import get_logger
+
+__all__ = ("TokenBucket", "RateLimiter", "DEFAULT_QUOTAS", "get_default_limiter", "set_default_limiter")
+
+logger = get_logger()
+
+# Default quotas per minute per user, as (read, write).
+# See https://developers.google.com/sheets/api/limits and https://developers.google.com/slides/api/limits
+DEFAULT_QUOTAS: Dict[str, Tuple[float, float]] = {
+    "sheets": (60.0, 60.0),
+    "slides": (600.0, 60.0),
+}
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose rate can be changed adaptively.
+
+    Attributes:
+        max_rate (float): The configured rate in tokens per second.
+        rate (float): The current rate in tokens per second.
+        capacity (float): Max number of tokens, i.e. the size of a burst.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, min_rate: Optional[float] = None) -> None:
+        """
+        Args:
+            rate (float): The rate in tokens per second.
+            capacity (Optional[float]): Max number of tokens. If None, same as `rate`. Defaults to None.
+            min_rate (Optional[float]): The lower bound of the rate when slowed down. If None, 1/20 of `rate`.
+                Defaults to None.
+        """
+        if rate <= 0:
+            raise ValueError(f"`rate` must be > 0, but got {rate}")
+        self.max_rate: float = rate
+        self.rate: float = rate
+        self.min_rate: float = rate / 20 if min_rate is None else min_rate
+        self.capacity: float = max(1.0, rate if capacity is None else capacity)
+        self._tokens: float = self.capacity
+        self._last: float = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+        self._last = now
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Reserve tokens and returns seconds to wait until they are available.
+        Callers must wait for the returned seconds before sending a request.
+
+        Args:
+            tokens (float): The number of tokens. Defaults to 1.0.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self._tokens -= tokens
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def slow_down(self, factor: float = 0.5) -> None:
+        """Decrease the rate multiplicatively and drop remaining tokens.
+
+        Args:
+            factor (float): Multiplier of the rate. Defaults to 0.5.
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = max(self.min_rate, self.rate * factor)
+            self._tokens = min(self._tokens, 0.0)
+
+    def speed_up(self, step: float = 0.05) -> None:
+        """Increase the rate additively up to `max_rate`.
+
+        Args:
+            step (float): Increment as a ratio of `max_rate`. Defaults to 0.05.
+        """
+        if self.rate >= self.max_rate:
+            return
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.max_rate * step)
+
+
+class RateLimiter:
+    """Client-side rate limiter with read/write token buckets per API.
+
+    When a request is rejected with 429, the rate of its bucket is halved, then it recovers gradually
+    on successful responses, so that throughput stays at the quota ceiling.
+
+    Attributes:
+        quotas (Dict[str, Tuple[float, float]]): Quotas per minute as (read, write), keyed by API name.
+    """
+
+    def __init__(
+        self,
+        quotas: Optional[Dict[str, Tuple[float, float]]] = None,
+        burst_seconds: float = 10.0,
+    ) -> None:
+        """
+        Args:
+            quotas (Optional[Dict[str, Tuple[float, float]]]): Quotas per minute as (read, write), keyed by
+                API name, e.g. {'sheets': (300, 300)}. Missing APIs use DEFAULT_QUOTAS. Defaults to None.
+            burst_seconds (float): Size of a burst as seconds of quota. Defaults to 10.0.
+        """
+        self.quotas: Dict[str, Tuple[float, float]] = dict(DEFAULT_QUOTAS)
+        if quotas is not None:
+            self.quotas.update(quotas)
+        self._burst_seconds: float = burst_seconds
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, api: str, kind: str) -> Optional[TokenBucket]:
+        """Returns the bucket of API.
+
+        Args:
+            api (str): Name of API, e.g. 'sheets'.
+            kind (str): 'read' or 'write'.
+
+        Returns:
+            Optional[TokenBucket]: The bucket. If no quota is configured for the API, returns None.
+        """
+        key: Tuple[str, str] = (api, kind)
+        bucket: Optional[TokenBucket] = self._buckets.get(key)
+        if bucket is None and api in self.quotas:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    per_minute: float = self.quotas[api][0 if kind == "read" else 1]
+                    rate: float = per_minute / 60.0
+                    bucket = TokenBucket(rate, capacity=rate * self._burst_seconds)
+                    self._buckets[key] = bucket
+        return bucket
+
+    def acquire(self, api: str, kind: str) -> float:
+        """Block until a request is allowed.
+
+        Args:
+            api (str): Name of API, e.g. 'sheets'.
+            kind (str): 'read' or 'write'.
+
+        Returns:
+            float: Waited seconds.
+        """
+        bucket: Optional[TokenBucket] = self.bucket(api, kind)
+        delay: float = 0.0 if bucket is None else bucket.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, api: str, kind: str) -> float:
+        """Wait until a request is allowed without blocking the event loop.
+
+        Args:
+            api (str): Name of API, e.g. 'sheets'.
+            kind (str): 'read' or 'write'.
+
+        Returns:
+            float: Waited seconds.
+        """
+        bucket: Optional[TokenBucket] = self.bucket(api, kind)
+        delay: float = 0.0 if bucket is None else bucket.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def feedback(self, api: str, kind: str, status: int) -> None:
+        """Adapt the rate to the status of response.
+
+        Args:
+            api (str): Name of API, e.g. 'sheets'.
+            kind (str): 'read' or 'write'.
+            status (int): HTTP status of response.
+        """
+        bucket: Optional[TokenBucket] = self.bucket(api, kind)
+        if bucket is None:
+            return
+        if status == 429:
+            bucket.slow_down()
+            logger.warning("Quota exceeded on %s %s, slowing down to %.1f requests/min.", api, kind, bucket.rate * 60)
+        elif status < 400:
+            bucket.speed_up()
+
+
+_default_limiter: Optional[RateLimiter] = None
+
+
+def get_default_limiter() -> Optional[RateLimiter]:
+    """Returns the process-wide rate limiter shared by all API instances.
+
+    Returns:
+        Optional[RateLimiter]: The rate limiter. If None, requests are not limited.
+    """
+    return _default_limiter
+
+
+def set_default_limiter(limiter: Optional[RateLimiter]) -> None:
+    """Set the process-wide rate limiter shared by all API instances.
+
+    Args:
+        limiter (Optional[RateLimiter]): The rate limiter. If None, requests are not limited.
+
+    Examples:
+        >>> set_default_limiter(RateLimiter({"sheets": (300, 300)}))
+    """
+    global _default_limiter
+    _default_limiter = limiter
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import random
+from typing import FrozenSet, NamedTuple, Optional
+
+__all__ = (
+    "RetryPolicy",
+    "CallRecord",
+    "IDEMPOTENT_METHODS",
+    "is_idempotent",
+    "get_default_retry_policy",
+    "set_default_retry_policy",
+)
+
+#: Methods other than GET which give the same result when they are applied twice.
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset(
+    {
+        "sheets.spreadsheets.values.update",
+        "sheets.spreadsheets.values.batchUpdate",
+        "sheets.spreadsheets.values.clear",
+        "sheets.spreadsheets.values.batchClear",
+    }
+)
+
+
+def is_idempotent(method: str, http_method: str) -> bool:
+    """Returns whether the call is safe to be sent again after it may have been applied.
+
+    Args:
+        method (str): ID of API method, e.g. 'sheets.spreadsheets.values.append'.
+        http_method (str): HTTP method, e.g. 'POST'.
+
+    Returns:
+        bool: True for GET and `IDEMPOTENT_METHODS`.
+    """
+    return http_method in ("GET", "HEAD") or method in IDEMPOTENT_METHODS
+
+
+class CallRecord(NamedTuple):
+    """Record of an API call.
+
+    Attributes:
+        method (str): ID of API method, e.g. 'sheets.spreadsheets.values.update'.
+        status (int): HTTP status of the last attempt. 0 if the request did not get a response.
+        retries (int): The number of retries.
+        elapsed (float): Elapsed time including retries in seconds.
+        bytes_sent (int): Total size of request bodies of all attempts.
+        bytes_received (int): Total size of response bodies of all attempts.
+        quota_errors (int): The number of attempts rejected with 429.
+    """
+
+    method: str
+    status: int
+    retries: int
+    elapsed: float
+    bytes_sent: int = 0
+    bytes_received: int = 0
+    quota_errors: int = 0
+
+
+class RetryPolicy:
+    """Policy to retry transient errors with exponential backoff and jitter.
+
+    Attributes:
+        max_attempts (int): Max number of attempts including the first one.
+        backoff_base (float): Base seconds of backoff. n-th retry waits up to `backoff_base * 2 ** (n - 1)`.
+        backoff_max (float): Max seconds of a backoff.
+        jitter (bool): Whether to randomize backoff in [0, backoff] (full jitter).
+        retry_statuses (FrozenSet[int]): HTTP statuses to be retried.
+        deadline (Optional[float]): Max seconds of a call including retries. If None, no limit.
+        retry_non_idempotent (bool): Whether to retry non-idempotent calls, e.g. `values.append`, `create` and
+            `batchUpdate` of spreadsheets/presentations. A failed attempt may have been applied, so retrying them
+            can write rows twice or create duplicate files.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 32.0,
+        jitter: bool = True,
+        retry_statuses: FrozenSet[int] = frozenset({408, 429, 500, 502, 503, 504}),
+        deadline: Optional[float] = None,
+        retry_non_idempotent: bool = False,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError(f"`max_attempts` must be >= 1, but got {max_attempts}")
+        self.max_attempts: int = max_attempts
+        self.backoff_base: float = backoff_base
+        self.backoff_max: float = backoff_max
+        self.jitter: bool = jitter
+        self.retry_statuses: FrozenSet[int] = frozenset(retry_statuses)
+        self.deadline: Optional[float] = deadline
+        self.retry_non_idempotent: bool = retry_non_idempotent
+
+    def backoff(self, retry: int, retry_after: Optional[float] = None) -> float:
+        """Returns seconds to wait before the retry.
+
+        Args:
+            retry (int): 1-based index of retry.
+            retry_after (Optional[float]): Seconds specified by Retry-After header. Defaults to None.
+
+        Returns:
+            float: Seconds to wait.
+        """
+        delay: float = min(self.backoff_max, self.backoff_base * 2 ** (retry - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+    def next_delay(
+        self,
+        status: int,
+        attempt: int,
+        elapsed: float,
+        retry_after: Optional[float] = None,
+        idempotent: bool = True,
+    ) -> Optional[float]:
+        """Returns seconds to wait before the next attempt, or None if it should not be retried.
+
+        Args:
+            status (int): HTTP status of the failed attempt. 0 for connection errors.
+            attempt (int): The number of attempts so far.
+            elapsed (float): Elapsed seconds since the first attempt.
+            retry_after (Optional[float]): Seconds specified by Retry-After header. Defaults to None.
+            idempotent (bool): Whether the call is idempotent. See `is_idempotent()`. Defaults to True.
+
+        Returns:
+            Optional[float]: Seconds to wait.
+        """
+        if not (idempotent or self.retry_non_idempotent):
+            return None
+        if attempt >= self.max_attempts or (status != 0 and status not in self.retry_statuses):
+            return None
+        delay: float = self.backoff(attempt, retry_after)
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+
+_default_policy: Optional[RetryPolicy] = RetryPolicy()
+
+
+def get_default_retry_policy() -> Optional[RetryPolicy]:
+    """Returns the process-wide retry policy used by all API instances.
+
+    Returns:
+        Optional[RetryPolicy]: The retry policy. If None, requests are never retried.
+    """
+    return _default_policy
+
+
+def set_default_retry_policy(policy: Optional[RetryPolicy]) -> None:
+    """Set the process-wide retry policy used by all API instances.
+
+    Args:
+        policy (Optional[RetryPolicy]): The retry policy. If None, requests are never retried.
+    """
+    global _default_policy
+    _default_policy = policy
@@ -1,20 +1,62 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import Resource, build
+from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
 
 from py2gsuite.utils import get_logger
+from py2gsuite.utils.a1 import A1Range, column_to_letter, split_sheet
+from py2gsuite.utils.chunk import iter_chunks
+from py2gsuite.utils.flatten import RecordFlattener
+from py2gsuite.utils.snapshot import Snapshot
 
-from .base import APIBase
+from .base import APIBase, execute
+from .discovery import build_service, get_collection
 
-__all__ = ["SheetsAPI"]
+__all__ = ["SheetsAPI", "ChunkReport"]
 
 logger = get_logger()
 
 
+class ChunkReport(NamedTuple):
+    """Throughput report of a chunk written by `SheetsAPI.write_rows()`.
+
+    Attributes:
+        index (int): Index of chunk.
+        range_name (str): Range of cells the chunk was written to.
+        rows (int): The number of rows in the chunk.
+        bytes (int): The size of values in the chunk in bytes.
+        elapsed (float): Elapsed time to send the chunk in seconds.
+    """
+
+    index: int
+    range_name: str
+    rows: int
+    bytes: int
+    elapsed: float
+
+    @property
+    def rows_per_sec(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else float("inf")
+
+    @property
+    def bytes_per_sec(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed > 0 else float("inf")
+
+
 class SheetsAPI(APIBase):
     """[summary]
     The wrapper of Google Sheets API.
@@ -25,6 +67,8 @@ class SheetsAPI(APIBase):
         service (Resource): Resource instance to connect to spreadsheet.
     """
 
+    api_name: str = "sheets"
+
     def __init__(
         self,
         creds: Credentials,
@@ -40,11 +84,15 @@ class SheetsAPI(APIBase):
         """
         super().__init__(creds=creds, file_id=sheet_id)
         if service is None:
-            self.service: Resource = build("sheets", "v4", credentials=creds)
+            self.service: Resource = build_service("sheets", "v4", creds)
         else:
             assert hasattr(service, "spreadsheets")
             self.service: Resource = service
 
+    @property
+    def _values(self) -> Resource:
+        return get_collection(self.service, "spreadsheets", "values")
+
     @classmethod
     def with_new(cls, creds: Credentials, title: str) -> Optional[SheetsAPI]:
         """Create instance with a new sheet.
@@ -57,11 +105,11 @@ class SheetsAPI(APIBase):
             Optional[SheetsAPI]: If failed to request, returns None.
         """
         try:
-            service: Resource = build("sheets", "v4", credentials=creds)
+            service: Resource = build_service("sheets", "v4", creds)
             body = {"properties": {"title": title}}
-            spreadsheet = service.spreadsheets().create(body=body, fields="spreadsheetId").execute()
+            spreadsheet = execute(service.spreadsheets().create(body=body, fields="spreadsheetId"), "sheets")
             sheet_id: str = spreadsheet.get("spreadsheetId")
-            logger.info(f"Spreadsheet ID: {sheet_id}")
+            logger.info("Spreadsheet ID: %s", sheet_id)
         except HttpError as err:
             logger.error(err)
             return None
@@ -94,18 +142,15 @@ class SheetsAPI(APIBase):
 
         try:
             body: Dict[str, List[Any]] = {"values": values}
-            result: Dict[str, Any] = (
-                self.service.spreadsheets()
-                .values()
-                .append(
+            result: Dict[str, Any] = self._execute(
+                self._values.append(
                     spreadsheetId=sheet_id,
                     range=range_name,
                     valueInputOption=value_input_option,
                     body=body,
                 )
-                .execute()
             )
-            logger.info(f"{(result.get('updates').get('updatedCells'))} cells appended.")
+            logger.info("%s cells appended.", result.get("updates").get("updatedCells"))
         except HttpError as err:
             logger.error(err)
             return False
@@ -139,24 +184,299 @@ class SheetsAPI(APIBase):
 
         try:
             body: Dict[str, List[Any]] = {"values": values}
-            result: Dict[str, Any] = (
-                self.service.spreadsheets()
-                .values()
-                .update(
+            result: Dict[str, Any] = self._execute(
+                self._values.update(
                     spreadsheetId=sheet_id,
                     range=range_name,
                     valueInputOption=value_input_option,
                     body=body,
                 )
-                .execute()
             )
-            logger.info(f"{result.get('updatedCells')} cells updated.")
+            logger.info("%s cells updated.", result.get("updatedCells"))
         except HttpError as err:
             logger.error(err)
             return False
 
         return True
 
+    def batch_update_values(
+        self,
+        data: Iterable[Tuple[str, List[List[Any]]]],
+        value_input_option: Optional[str] = None,
+        sheet_id: Optional[str] = None,
+        max_ranges: int = 100,
+        max_bytes: Optional[int] = 2 * 1024 * 1024,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Update values on many ranges with `values.batchUpdate`.
+        If cells are already filled, these will be overwritten.
+
+        Ranges are packed into as few requests as possible, bounded by `max_ranges` and `max_bytes`.
+
+        Args:
+            data (Iterable[Tuple[str, List[List[Any]]]]): Pairs of range and values, e.g. [('A1:B2', [[1, 2], [3, 4]])].
+            value_input_option (Optional[str]): Input option. Defaults to None.
+            sheet_id (Optional[str]): ID of sheet. Defaults to None.
+            max_ranges (int): Max number of ranges in a request. Defaults to 100.
+            max_bytes (Optional[int]): Max size of values in a request in bytes. Defaults to 2MB.
+
+        Returns:
+            List[Optional[Dict[str, Any]]]: Response for each range in order of `data`.
+                If the request including the range failed, the element is None.
+        """
+        if value_input_option is None:
+            value_input_option = "USER_ENTERED"
+
+        if sheet_id is None:
+            sheet_id = self.id
+
+        results: List[Optional[Dict[str, Any]]] = []
+        value_ranges = ({"range": range_name, "values": values} for range_name, values in data)
+        for chunk, _ in iter_chunks(value_ranges, max_items=max_ranges, max_bytes=max_bytes):
+            try:
+                body: Dict[str, Any] = {"valueInputOption": value_input_option, "data": chunk}
+                result: Dict[str, Any] = self._execute(self._values.batchUpdate(spreadsheetId=sheet_id, body=body))
+                logger.info("%s cells updated in %d ranges.", result.get("totalUpdatedCells"), len(chunk))
+                responses: List[Dict[str, Any]] = result.get("responses", [])
+                results.extend(responses[i] if i < len(responses) else {} for i in range(len(chunk)))
+            except HttpError as err:
+                logger.error(err)
+                results.extend([None] * len(chunk))
+
+        return results
+
+    def batch_get_values(
+        self,
+        ranges: Iterable[str],
+        value_render_option: Optional[str] = None,
+        sheet_id: Optional[str] = None,
+        max_ranges: int = 100,
+        date_time_render_option: Optional[str] = None,
+    ) -> List[Optional[List[List[Any]]]]:
+        """Get values on many ranges with `values.batchGet`.
+
+        Args:
+            ranges (Iterable[str]): Ranges of cells.
+            value_render_option (Optional[str]): Render option. Defaults to None.
+            sheet_id (Optional[str]): ID of sheet. Defaults to None.
+            max_ranges (int): Max number of ranges in a request. Defaults to 100.
+            date_time_render_option (Optional[str]): Render option of dates, used with UNFORMATTED_VALUE.
+                Defaults to None.
+
+        Returns:
+            List[Optional[List[List[Any]]]]: Values of each range in order of `ranges`.
+                Empty range results in an empty list. If the request including the range failed or the response
+                lacks the range, the element is None.
+        """
+        if value_render_option is None:
+            value_render_option = "FORMATTED_VALUE"
+
+        if sheet_id is None:
+            sheet_id = self.id
+
+        options: Dict[str, str] = {"valueRenderOption": value_render_option}
+        if date_time_render_option is not None:
+            options["dateTimeRenderOption"] = date_time_render_option
+
+        results: List[Optional[List[List[Any]]]] = []
+        for chunk, _ in iter_chunks(ranges, max_items=max_ranges, size_fn=len):
+            try:
+                result: Dict[str, Any] = self._execute(
+                    self._values.batchGet(spreadsheetId=sheet_id, ranges=chunk, **options)
+                )
+                # NOTE: Responses are mapped by index, so that results are aligned with `ranges` even if some are missing.
+                value_ranges: List[Dict[str, Any]] = result.get("valueRanges", [])
+                results.extend(
+                    value_ranges[i].get("values", []) if i < len(value_ranges) else None for i in range(len(chunk))
+                )
+            except HttpError as err:
+                logger.error(err)
+                results.extend([None] * len(chunk))
+
+        return results
+
+    def _grid_size(self, sheet: Optional[str], sheet_id: str) -> Optional[Tuple[int, int]]:
+        """Returns the number of rows and columns of the sheet. If sheet is None, the first sheet is used."""
+        try:
+            request = get_collection(self.service, "spreadsheets").get(
+                spreadsheetId=sheet_id,
+                ranges=[] if sheet is None else [sheet],
+                fields="sheets(properties(gridProperties(rowCount,columnCount)))",
+            )
+            result: Dict[str, Any] = self._execute(request)
+        except HttpError as err:
+            logger.error(err)
+            return None
+
+        grid: Dict[str, Any] = result["sheets"][0]["properties"]["gridProperties"]
+        return grid["rowCount"], grid["columnCount"]
+
+    def read_columns(
+        self,
+        range_name: str,
+        header: bool = True,
+        page_rows: int = 10000,
+        value_render_option: Optional[str] = None,
+        date_time_render_option: Optional[str] = None,
+        sheet_id: Optional[str] = None,
+    ) -> Optional[Dict[str, List[Any]]]:
+        """Read values in the range as columns.
+
+        The range is fetched with a `values.batchGet` call per page of `page_rows` rows, and each page is appended
+        to columns as it arrives, so memory is bounded by the page size. Ragged rows are padded with None.
+        If the bottom row is not specified, e.g. 'A1:F', the size of sheet is fetched to bound the range.
+
+        Args:
+            range_name (str): Range of cells, e.g. 'Sheet1!A1:F'.
+            header (bool): Whether the first row is column names. If False, column letters are used.
+                Defaults to True.
+            page_rows (int): The number of rows in a page. Defaults to 10000.
+            value_render_option (Optional[str]): Render option. Defaults to 'UNFORMATTED_VALUE'.
+            date_time_render_option (Optional[str]): Render option of dates. Defaults to 'FORMATTED_STRING'.
+            sheet_id (Optional[str]): ID of sheet. Defaults to None.
+
+        Returns:
+            Optional[Dict[str, List[Any]]]: Values of each column, keyed by column name. If failed, returns None.
+        """
+        if value_render_option is None:
+            value_render_option = "UNFORMATTED_VALUE"
+
+        if date_time_render_option is None:
+            date_time_render_option = "FORMATTED_STRING"
+
+        if sheet_id is None:
+            sheet_id = self.id
+
+        bounds: A1Range = A1Range.parse(range_name)
+        if bounds.end_row is None:
+            grid: Optional[Tuple[int, int]] = self._grid_size(split_sheet(range_name)[0], sheet_id)
+            if grid is None:
+                return None
+            bounds = bounds._replace(end_row=grid[0])
+        column: int = bounds.column
+        num_cols: int = bounds.num_cols
+
+        # NOTE: Pages are fetched one by one and appended to columns, so only a page of response is held at once.
+        columns: List[List[Any]] = []
+        num_rows: int = 0
+        # Empty rows are added only when a non-empty row follows, so trailing empty rows are dropped.
+        empty_rows: int = 0
+        for page in bounds.split(max_rows=page_rows):
+            results: List[Optional[List[List[Any]]]] = self.batch_get_values(
+                [str(page)],
+                value_render_option=value_render_option,
+                sheet_id=sheet_id,
+                date_time_render_option=date_time_render_option,
+            )
+            values: Optional[List[List[Any]]] = results[0]
+            if values is None:
+                return None
+
+            for row in values:
+                if not row:
+                    empty_rows += 1
+                    continue
+                if empty_rows > 0:
+                    for col in columns:
+                        col.extend([None] * empty_rows)
+                    num_rows += empty_rows
+                    empty_rows = 0
+                columns.extend([None] * num_rows for _ in range(len(row) - len(columns)))
+                for j, col in enumerate(columns):
+                    col.append(row[j] if j < len(row) else None)
+                num_rows += 1
+            # NOTE: Trailing empty rows are omitted in response, so they are counted to keep later pages aligned.
+            empty_rows += page.num_rows - len(values)
+        columns.extend([None] * num_rows for _ in range(num_cols - len(columns)))
+
+        letters: List[str] = [column_to_letter(column + j) for j in range(len(columns))]
+        if header and num_rows > 0:
+            names: List[str] = [
+                letter if name in (None, "") else str(name)
+                for name, letter in zip((col[0] for col in columns), letters)
+            ]
+            for col in columns:
+                del col[0]
+        else:
+            names = letters
+
+        data: Dict[str, List[Any]] = {}
+        for name, col in zip(names, columns):
+            key, n = name, 0
+            while key in data:
+                n += 1
+                key = f"{name}.{n}"
+            data[key] = col
+        logger.info("%d rows read from %s.", num_rows, range_name)
+        return data
+
+    def read_frame(self, range_name: str, header: bool = True, **kwargs) -> Optional[Any]:
+        """Read values in the range as pandas.DataFrame. See `read_columns()` for details.
+
+        Empty cells are decoded as NaN, and dtype of each column is inferred from values.
+
+        Args:
+            range_name (str): Range of cells, e.g. 'Sheet1!A1:F'.
+            header (bool): Whether the first row is column names. Defaults to True.
+            **kwargs: Keyword arguments passed to `read_columns()`.
+
+        Returns:
+            Optional[pandas.DataFrame]: DataFrame. If failed, returns None.
+        """
+        # NOTE: pandas is optional and slow to import, so it is imported only when used.
+        import numpy as np
+        import pandas as pd
+
+        data: Optional[Dict[str, List[Any]]] = self.read_columns(range_name, header=header, **kwargs)
+        if data is None:
+            return None
+        return pd.DataFrame(data).replace("", np.nan).infer_objects()
+
+    def sync_values(
+        self,
+        values: List[List[Any]],
+        snapshot_path: str,
+        start_range: str = "A1",
+        value_input_option: Optional[str] = None,
+        sheet_id: Optional[str] = None,
+        block_cols: int = 16,
+    ) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """Write values, sending only cells changed since the last sync.
+
+        Hashes of written values are persisted in `snapshot_path`, and new values are compared with them.
+        Changed rectangles are sent with `batch_update_values()`, and cells no longer in values are cleared.
+        The snapshot is updated only if all ranges were written.
+
+        Args:
+            values (List[List[Any]]): Rows of cell values.
+            snapshot_path (str): Path to JSON file of snapshot.
+            start_range (str): Top-left cell, e.g. 'Sheet1!A1'. Defaults to 'A1'.
+            value_input_option (Optional[str]): Input option. Defaults to None.
+            sheet_id (Optional[str]): ID of sheet. Defaults to None.
+            block_cols (int): The number of columns compared at once. Defaults to 16.
+
+        Returns:
+            Optional[List[Optional[Dict[str, Any]]]]: Response for each changed range. If failed, returns None.
+        """
+        if sheet_id is None:
+            sheet_id = self.id
+
+        start: A1Range = A1Range.parse(start_range).start
+        snapshot: Snapshot = Snapshot.load(snapshot_path, f"{sheet_id}:{start_range}", block_cols=block_cols)
+        new_snapshot, blocks = snapshot.diff(values)
+
+        data: List[Tuple[str, List[List[Any]]]] = [
+            (str(start.offset(i, j).resize(len(block), len(block[0]))), block) for i, j, block in blocks
+        ]
+        logger.info("%d cells changed in %d ranges.", sum(len(b) * len(b[0]) for _, b in data), len(data))
+        results: List[Optional[Dict[str, Any]]] = (
+            self.batch_update_values(data, value_input_option=value_input_option, sheet_id=sheet_id) if data else []
+        )
+        if any(result is None for result in results):
+            return None
+
+        new_snapshot.save(snapshot_path)
+        return results
+
     def is_empty(self, range_name: str) -> bool:
         """Check whether specified cells are empty.
         Args:
@@ -165,7 +485,170 @@ class SheetsAPI(APIBase):
         Returns:
             bool: Whether all cells are empty.
         """
-        result = self.service.spreadsheets().values().get(spreadsheetId=self.id, range=range_name).execute()
+        result = self._execute(self._values.get(spreadsheetId=self.id, range=range_name))
         values = result.get("values")
 
         return values is None
+
+    def write_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        start_range: str = "A1",
+        chunk_rows: int = 1000,
+        chunk_bytes: Optional[int] = 2 * 1024 * 1024,
+        value_input_option: Optional[str] = None,
+        sheet_id: Optional[str] = None,
+        callback: Optional[Callable[[ChunkReport], None]] = None,
+    ) -> bool:
+        """Write rows to the cells in chunks. If cells are already filled, these will be overwritten.
+
+        Rows are pulled lazily from the iterable, so it can be a generator of any length.
+        Each chunk is written to the range next to the previous one with a single request.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): Rows of values.
+            start_range (str): Top-left cell to write from, e.g. 'Sheet1!B2'. If range like 'B2:D' is specified,
+                its top-left cell is used. Defaults to 'A1'.
+            chunk_rows (int): Max number of rows in a chunk. Defaults to 1000.
+            chunk_bytes (Optional[int]): Max size of a chunk in bytes. Defaults to 2MB.
+            value_input_option (Optional[str]): Input option. Defaults to None.
+            sheet_id (Optional[str]): ID of sheet. Defaults to None.
+            callback (Optional[Callable[[ChunkReport], None]]): Function called with the report of each chunk.
+                Defaults to None.
+
+        Returns:
+            bool: Whether succeeded to write all rows. Writing stops at the first failed chunk.
+        """
+        if value_input_option is None:
+            value_input_option = "USER_ENTERED"
+
+        if sheet_id is None:
+            sheet_id = self.id
+
+        cursor: A1Range = A1Range.parse(start_range).start
+
+        for index, (chunk, num_bytes) in enumerate(
+            iter_chunks((list(r) for r in rows), max_items=chunk_rows, max_bytes=chunk_bytes)
+        ):
+            num_cols: int = max(len(r) for r in chunk)
+            range_name: str = str(cursor.resize(len(chunk), num_cols))
+            start: float = time.perf_counter()
+            try:
+                body: Dict[str, List[Any]] = {"values": chunk}
+                self._execute(
+                    self._values.update(
+                        spreadsheetId=sheet_id,
+                        range=range_name,
+                        valueInputOption=value_input_option,
+                        body=body,
+                    )
+                )
+            except HttpError as err:
+                logger.error(err)
+                return False
+
+            report = ChunkReport(index, range_name, len(chunk), num_bytes, time.perf_counter() - start)
+            logger.info(
+                "%d rows written to %s (%.1f rows/s, %.1f bytes/s).",
+                report.rows,
+                range_name,
+                report.rows_per_sec,
+                report.bytes_per_sec,
+            )
+            if callback is not None:
+                callback(report)
+            cursor = cursor.offset(len(chunk))
+
+        return True
+
+    def write_dataframe(
+        self,
+        df: Any,
+        start_range: str = "A1",
+        header: bool = True,
+        index: bool = False,
+        **kwargs,
+    ) -> bool:
+        """Write pandas.DataFrame to the cells in chunks. See `write_rows()` for details.
+
+        Columns are serialized in vectorized form: numbers are sent as numbers, datetimes as text,
+        and NaN/NaT/None as empty cells.
+
+        Args:
+            df (pandas.DataFrame): DataFrame to be written.
+            start_range (str): Top-left cell to write from. Defaults to 'A1'.
+            header (bool): Whether to write column names as the first row. Defaults to True.
+            index (bool): Whether to write index as the first column. Defaults to False.
+            **kwargs: Keyword arguments passed to `write_rows()`.
+
+        Returns:
+            bool: Whether succeeded to write all rows.
+        """
+        # NOTE: pandas is optional and slow to import, so it is imported only when used.
+        from py2gsuite.utils.frame import dataframe_to_rows
+
+        return self.write_rows(dataframe_to_rows(df, header=header, index=index), start_range, **kwargs)
+
+    def write_array(
+        self,
+        array: Any,
+        start_range: str = "A1",
+        header: Optional[Sequence[str]] = None,
+        **kwargs,
+    ) -> bool:
+        """Write numpy.ndarray to the cells in chunks. See `write_rows()` for details.
+
+        Args:
+            array (numpy.ndarray): 2-D array to be written, in shape (rows, cols).
+            start_range (str): Top-left cell to write from. Defaults to 'A1'.
+            header (Optional[Sequence[str]]): Header row. Defaults to None.
+            **kwargs: Keyword arguments passed to `write_rows()`.
+
+        Returns:
+            bool: Whether succeeded to write all rows.
+        """
+        from py2gsuite.utils.frame import array_to_rows
+
+        return self.write_rows(array_to_rows(array, header=header), start_range, **kwargs)
+
+    def write_records(
+        self,
+        records: Iterable[Any],
+        start_range: str = "A1",
+        header: bool = True,
+        columns: Optional[Sequence[str]] = None,
+        sample: int = 100,
+        sep: str = ".",
+        **kwargs,
+    ) -> bool:
+        """Write dicts or objects to the cells as rows in chunks. See `write_rows()` for details.
+
+        Records are flattened lazily, and nested keys become dotted column names like 'user.name'.
+        Columns are inferred from the first `sample` records. If later records have new keys, they are appended
+        as columns and the header row is rewritten after all rows are written.
+
+        Args:
+            records (Iterable[Any]): Dicts or objects. It can be a generator of any length.
+            start_range (str): Top-left cell to write from. Defaults to 'A1'.
+            header (bool): Whether to write column names as the first row. Defaults to True.
+            columns (Optional[Sequence[str]]): Column names. If None, inferred from records. Defaults to None.
+            sample (int): The number of records to infer columns from. Defaults to 100.
+            sep (str): Separator of nested keys. Defaults to '.'.
+            **kwargs: Keyword arguments passed to `write_rows()`.
+
+        Returns:
+            bool: Whether succeeded to write all rows.
+        """
+        flattener = RecordFlattener(columns, sample=sample, sep=sep)
+        if not self.write_rows(flattener.rows(records, header=header), start_range, **kwargs):
+            return False
+
+        if flattener.header is not None and len(flattener.header) < len(flattener.columns):
+            range_name: str = str(A1Range.parse(start_range).start.resize(1, len(flattener.columns)))
+            return self.update_values(
+                [flattener.columns],
+                range_name,
+                kwargs.get("value_input_option"),
+                kwargs.get("sheet_id"),
+            )
+        return True
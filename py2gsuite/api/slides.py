@@ -1,21 +1,197 @@
 from __future__ import annotations
 
+from contextlib import contextmanager
 from secrets import token_hex
-from typing import Any, Dict, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import Resource, build
+from googleapiclient.discovery import Resource
 from googleapiclient.errors import HttpError
 
 from py2gsuite.utils import SlideLayout, get_logger
+from py2gsuite.utils.chunk import iter_chunks, json_size
+from py2gsuite.utils.layout import EMU_PER_PT, PAGE_SIZE, SPACING, Box, layout
 
-from .base import APIBase
+from .base import APIBase, execute
+from .discovery import build_service, get_collection
+from .page_index import INDEX_FIELDS, PageIndex
 
-__all__ = ["SlidesAPI"]
+__all__ = ["SlidesAPI", "SlidesBatch", "BatchHandle", "CellStyle", "SlideElement"]
 
 logger = get_logger()
 
 
+class CellStyle(NamedTuple):
+    """Properties applied to a rectangular range of table cells with one `updateTableCellProperties` request.
+
+    Attributes:
+        properties (Dict[str, Any]): TableCellProperties, e.g. {'contentAlignment': 'MIDDLE'}.
+        row (int): 0-based top row. Defaults to 0.
+        col (int): 0-based left column. Defaults to 0.
+        row_span (Optional[int]): The number of rows. If None, to the last row. Defaults to None.
+        col_span (Optional[int]): The number of columns. If None, to the last column. Defaults to None.
+        fields (Optional[str]): Field mask. If None, top-level keys of properties are used. Defaults to None.
+    """
+
+    properties: Dict[str, Any]
+    row: int = 0
+    col: int = 0
+    row_span: Optional[int] = None
+    col_span: Optional[int] = None
+    fields: Optional[str] = None
+
+
+class SlideElement(NamedTuple):
+    """Element placed by `SlidesAPI.add_elements()`.
+
+    Attributes:
+        kind (str): 'text' or 'image'.
+        content (str): Text, or URL of image.
+        size (Tuple[int, int]): (width, height) in EMU. Defaults to 100pt square.
+        object_id (Optional[str]): ID of the element. If None, create with random token. Defaults to None.
+    """
+
+    kind: str
+    content: str
+    size: Tuple[int, int] = (100 * EMU_PER_PT, 100 * EMU_PER_PT)
+    object_id: Optional[str] = None
+
+
+class BatchHandle:
+    """Handle of an operation queued in `SlidesAPI.batch()`.
+
+    Attributes:
+        name (str): Name of the operation, e.g. 'slide'.
+        requests (List[Dict[str, Any]]): Requests of the operation.
+        reply_key (Optional[str]): Key of the reply that contains the ID of created object.
+        replies (Optional[List[Dict[str, Any]]]): Replies for `requests`, available after flushed.
+        ok (Optional[bool]): Whether the operation succeeded. None until flushed.
+    """
+
+    def __init__(self, name: str, requests: List[Dict[str, Any]], reply_key: Optional[str] = None) -> None:
+        self.name: str = name
+        self.requests: List[Dict[str, Any]] = requests
+        self.reply_key: Optional[str] = reply_key
+        self.replies: Optional[List[Dict[str, Any]]] = None
+        self.ok: Optional[bool] = None
+
+    @property
+    def done(self) -> bool:
+        return self.ok is not None
+
+    @property
+    def object_id(self) -> Optional[str]:
+        """Returns the ID of created object. If it has not been flushed or failed, returns None."""
+        if not self.replies or self.reply_key is None:
+            return None
+        return self.replies[0].get(self.reply_key, {}).get("objectId")
+
+    def __repr__(self) -> str:
+        return f"BatchHandle(name={self.name!r}, requests={len(self.requests)}, ok={self.ok})"
+
+
+class SlidesBatch:
+    """Queue of operations to be posted with the fewest `presentations.batchUpdate` calls.
+
+    Attributes:
+        handles (List[BatchHandle]): Handles of queued operations, in order of calls.
+        max_requests (int): Max number of requests in a batchUpdate call.
+        max_bytes (Optional[int]): Max size of requests in a batchUpdate call in bytes.
+    """
+
+    def __init__(
+        self,
+        post: Callable[[List[Any]], Optional[Dict[str, Any]]],
+        max_requests: int = 1000,
+        max_bytes: Optional[int] = 2 * 1024 * 1024,
+    ) -> None:
+        """
+        Args:
+            post (Callable[[List[Any]], Optional[Dict[str, Any]]]): Function to post requests.
+            max_requests (int): Max number of requests in a batchUpdate call. Defaults to 1000.
+            max_bytes (Optional[int]): Max size of requests in a batchUpdate call in bytes. Defaults to 2MB.
+        """
+        self._post = post
+        self.max_requests: int = max_requests
+        self.max_bytes: Optional[int] = max_bytes
+        self.handles: List[BatchHandle] = []
+        self._pending: List[BatchHandle] = []
+
+    def add(self, name: str, requests: List[Dict[str, Any]], reply_key: Optional[str] = None) -> BatchHandle:
+        """Queue requests of an operation.
+
+        Args:
+            name (str): Name of the operation.
+            requests (List[Dict[str, Any]]): Requests of the operation.
+            reply_key (Optional[str]): Key of the reply that contains the ID of created object. Defaults to None.
+
+        Returns:
+            BatchHandle: Handle of the operation.
+        """
+        handle = BatchHandle(name, requests, reply_key)
+        self.handles.append(handle)
+        self._pending.append(handle)
+        return handle
+
+    def flush(self) -> bool:
+        """Post all queued requests.
+        Requests of an operation are never split into different calls.
+
+        Returns:
+            bool: Whether all calls succeeded.
+        """
+        success: bool = True
+        group: List[BatchHandle] = []
+        num_requests: int = 0
+        num_bytes: int = 0
+        for handle in self._pending:
+            handle_bytes: int = json_size(handle.requests) if self.max_bytes is not None else 0
+            if group and (
+                num_requests + len(handle.requests) > self.max_requests
+                or (self.max_bytes is not None and num_bytes + handle_bytes > self.max_bytes)
+            ):
+                success &= self.__post_group(group)
+                group, num_requests, num_bytes = [], 0, 0
+            group.append(handle)
+            num_requests += len(handle.requests)
+            num_bytes += handle_bytes
+
+        if group:
+            success &= self.__post_group(group)
+        self._pending = []
+        return success
+
+    def __post_group(self, group: List[BatchHandle]) -> bool:
+        requests: List[Dict[str, Any]] = [request for handle in group for request in handle.requests]
+        response: Optional[Dict[str, Any]] = self._post(requests)
+        if response is None:
+            for handle in group:
+                handle.ok = False
+            return False
+
+        replies: List[Dict[str, Any]] = response.get("replies", [{}] * len(requests))
+        offset: int = 0
+        for handle in group:
+            handle.replies = replies[offset : offset + len(handle.requests)]
+            handle.ok = True
+            offset += len(handle.requests)
+            if handle.reply_key is not None:
+                logger.info("Created %s with ID: %s", handle.name, handle.object_id)
+        logger.info("Posted %d requests of %d operations.", len(requests), len(group))
+        return True
+
+
 class SlidesAPI(APIBase):
     """The wrapper of Google Slides API.
 
@@ -25,6 +201,8 @@ class SlidesAPI(APIBase):
         service (Resource): The Resource instance.
     """
 
+    api_name: str = "slides"
+
     def __init__(
         self,
         creds: Credentials,
@@ -40,10 +218,22 @@ class SlidesAPI(APIBase):
         """
         super().__init__(creds=creds, file_id=presentation_id)
         if service is None:
-            self.service: Resource = build("slides", "v1", credentials=self.creds)
+            self.service: Resource = build_service("slides", "v1", self.creds)
         else:
             assert hasattr(service, "presentations")
             self.service: Resource = service
+        self.__presentations: Optional[Resource] = None
+        self._batch: Optional[SlidesBatch] = None
+        self._index: Optional[PageIndex] = None
+        # Boxes placed by queued operations in batch mode, which are not in the index yet.
+        self._placed: Dict[str, List[Box]] = {}
+
+    @property
+    def _presentations(self) -> Resource:
+        # NOTE: googleapiclient builds a new collection and its docs on every call, so it is cached.
+        if self.__presentations is None:
+            self.__presentations = get_collection(self.service, "presentations")
+        return self.__presentations
 
     @classmethod
     def with_new(cls, creds: Credentials, title: str) -> Optional[SlidesAPI]:
@@ -58,11 +248,11 @@ class SlidesAPI(APIBase):
             Optional[SlidesAPI]: SlidesAPI instance. If fail, returns None.
         """
         try:
-            service = build("slides", "v1", credentials=creds)
+            service = build_service("slides", "v1", creds)
             body = {"title": title}
-            presentation = service.presentations().create(body=body).execute()
+            presentation = execute(service.presentations().create(body=body), "slides")
             presentation_id: str = presentation.get("presentationId")
-            logger.info(f"Created presentation with ID:" f"{presentation_id}")
+            logger.info("Created presentation with ID: %s", presentation_id)
         except HttpError as err:
             logger.error(err)
             return None
@@ -81,48 +271,159 @@ class SlidesAPI(APIBase):
         """
         try:
             body: Dict[str, List[Any]] = {"requests": requests}
-            response: Dict[str, Any] = (
-                self.service.presentations()
-                .batchUpdate(
+            response: Dict[str, Any] = self._execute(
+                self._presentations.batchUpdate(
                     presentationId=self.id,
                     body=body,
                 )
-                .execute()
             )
         except HttpError as err:
             logger.error(err)
             return None
 
+        if self._index is not None:
+            self._index.apply(requests, response.get("replies"))
         return response
 
-    def exists_page(self, page_id: str) -> bool:
-        """Check if the page that has specified page_id exists.
+    def get_index(self, refresh: bool = False) -> Optional[PageIndex]:
+        """Returns the local index of slides and page elements.
+        The index is loaded with a `presentations.get` call at the first time or when it is stale,
+        and updated from posted requests after that. Operations queued in `batch()` are reflected after flushed.
 
         Args:
-            page_id (str): ID of page.
+            refresh (bool): Whether to load the index again. Defaults to False.
 
         Returns:
-            bool: Wether page exists.
+            Optional[PageIndex]: The index. If failed to load, returns None.
         """
-        try:
-            response_id: Optional[str] = (
-                self.service.presentations()
-                .pages()
-                .get(
-                    presentationId=self.id,
-                    pageObjectId=page_id,
+        if self._index is None or self._index.stale or refresh:
+            try:
+                presentation: Dict[str, Any] = self._execute(
+                    self._presentations.get(presentationId=self.id, fields=INDEX_FIELDS)
                 )
-            )
-        except HttpError as err:
-            logger.error(err)
+            except HttpError as err:
+                logger.error(err)
+                return None
+            if self._index is None:
+                self._index = PageIndex()
+            self._index.load(presentation)
+        return self._index
+
+    def __first_page(self) -> Optional[str]:
+        index: Optional[PageIndex] = self.get_index()
+        page_id: Optional[str] = None if index is None else index.first_slide
+        if page_id is None:
+            logger.error("No slide to add elements to.")
+        return page_id
+
+    def __place(
+        self,
+        page_id: str,
+        sizes: Sequence[Tuple[int, int]],
+        mode: str = "pack",
+        margin: int = SPACING,
+        gap: int = SPACING,
+    ) -> Optional[List[Box]]:
+        """Compute boxes of new elements not overlapping elements on the page, using the local index.
+
+        Returns:
+            Optional[List[Box]]: Boxes of elements. If elements do not fit in the page, returns None.
+        """
+        index: Optional[PageIndex] = self.get_index()
+        page_size: Tuple[int, int] = PAGE_SIZE if index is None else index.page_size
+        occupied: List[Box] = ([] if index is None else index.boxes(page_id)) + self._placed.get(page_id, [])
+        try:
+            boxes: List[Box] = layout(sizes, mode, page_size, occupied, margin=margin, gap=gap)
+        except ValueError as err:
+            logger.warning(err)
+            return None
+
+        if self._batch is not None:
+            self._placed.setdefault(page_id, []).extend(boxes)
+        return boxes
+
+    def __submit(
+        self,
+        name: str,
+        requests: List[Dict[str, Any]],
+        reply_key: Optional[str] = None,
+    ) -> bool:
+        """[summary]
+        Post requests of an operation. In batch mode, the requests are queued instead.
+
+        Args:
+            name (str): Name of the operation.
+            requests (List[Dict[str, Any]]): Requests to be posted.
+            reply_key (Optional[str]): Key of the reply that contains the ID of created object. Defaults to None.
+
+        Returns:
+            bool: Whether succeeded to post (or queue) requests.
+        """
+        if self._batch is not None:
+            self._batch.add(name, requests, reply_key)
+            return True
+
+        response: Optional[Dict[str, Any]] = self.__post_update(requests)
+        if response is None:
             return False
+        if reply_key is not None:
+            reply: Dict[str, Any] = response.get("replies")[0].get(reply_key)
+            logger.info("Created %s with ID: %s", name, reply.get("objectId"))
+        return True
+
+    @contextmanager
+    def batch(self, max_requests: int = 1000, max_bytes: Optional[int] = 2 * 1024 * 1024) -> Iterator[SlidesBatch]:
+        """Queue operations in the context and post them with the fewest batchUpdate calls on exit.
+        While in the context, methods return True when the operation is queued.
+        Results are available via `SlidesBatch.handles` after exit. If any call failed, it is logged
+        and handles of its operations have `ok` False.
+
+        Args:
+            max_requests (int): Max number of requests in a batchUpdate call. Defaults to 1000.
+            max_bytes (Optional[int]): Max size of requests in a batchUpdate call in bytes. Defaults to 2MB.
+
+        Yields:
+            SlidesBatch: The queue of operations. If already in batch mode, yields the current one.
+
+        Examples:
+            >>> with api.batch() as batch:
+            ...     api.create_slide("page1")
+            ...     api.add_text("Hello", page_id="page1")
+            >>> batch.handles[0].object_id
+            'page1'
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        self._batch = SlidesBatch(self.__post_update, max_requests=max_requests, max_bytes=max_bytes)
+        batch: SlidesBatch = self._batch
+        try:
+            yield batch
+        finally:
+            self._batch = None
+            self._placed = {}
+        if not batch.flush():
+            failed: List[BatchHandle] = [handle for handle in batch.handles if handle.ok is False]
+            logger.error("%d of %d queued operations failed to be posted.", len(failed), len(batch.handles))
 
-        return True if response_id == page_id else False
+    def exists_page(self, page_id: str) -> bool:
+        """Check if the page that has specified page_id exists, using the local index.
+
+        Args:
+            page_id (str): ID of page.
+
+        Returns:
+            bool: Wether page exists.
+        """
+        index: Optional[PageIndex] = self.get_index()
+        return index is not None and page_id in index.slides
 
     def create_slide(
         self,
         page_id: str,
         layout: SlideLayout = SlideLayout.BLANK,
+        insertion_index: Optional[int] = None,
     ) -> bool:
         """[summary]
         Create new slide to the presentation.
@@ -130,29 +431,14 @@ class SlidesAPI(APIBase):
         Args:
             page_id (str): ID of new page.
             layout (SlideLayout): Defaults to SlideLayout.BLANK
+            insertion_index (Optional[int]): 0-based position of new slide. If None, append to the end.
+                Defaults to None.
 
         Returns:
             bool: Whether succeeded to create new slide.
         """
-        # if self.exists_page(page_id):
-        #     return True
-        requests = [
-            {
-                "createSlide": {
-                    "objectId": page_id,
-                    "insertionIndex": "1",
-                    "slideLayoutReference": {
-                        "predefinedLayout": layout.value,
-                    },
-                }
-            }
-        ]
-        response = self.__post_update(requests)
-        if response is not None:
-            create_slide_response = response.get("replies")[0].get("createSlide")
-            logger.info(f"Created slide with ID:" f"{(create_slide_response.get('objectId'))}")
-            return True
-        return False
+        requests: List[Dict[str, Any]] = create_slide_requests(page_id, layout, insertion_index)
+        return self.__submit("slide", requests, "createSlide")
 
     def add_text(self, text: str, page_id: Optional[str] = None, **kwargs) -> bool:
         """[summary]
@@ -172,32 +458,17 @@ class SlidesAPI(APIBase):
             bool: Whether succeeded to add text.
         """
         if page_id is None:
-            page_id = "p"
+            page_id = self.__first_page()
+            if page_id is None:
+                return False
 
         element_id: str = kwargs.get("element_id", token_hex(16))
-        pt: Dict[str, Any] = {"magnitude": kwargs.get("magnitude", 100), "unit": "PT"}
-
-        requests: List[Dict[str, Any]] = [
-            {
-                "createShape": {
-                    "objectId": element_id,
-                    "shapeType": "TEXT_BOX",
-                    "elementProperties": {
-                        "pageObjectId": page_id,
-                        "size": {"height": pt, "width": pt},
-                        "transform": {"scaleX": 1, "scaleY": 1, "translateX": 350, "translateY": 100, "unit": "PT"},
-                    },
-                }
-            },
-            # Insert text into the box, using the supplied element ID.
-            {"insertText": {"objectId": element_id, "insertionIndex": 0, "text": text}},
-        ]
-        response = self.__post_update(requests)
-        if response is not None:
-            create_shape_response = response.get("replies")[0].get("createShape")
-            logger.info(f"Created textbox with ID: {create_shape_response.get('objectId')}")
-            return True
-        return False
+        magnitude: int = kwargs.get("magnitude", 100)
+        boxes: Optional[List[Box]] = self.__place(page_id, [(magnitude * EMU_PER_PT, magnitude * EMU_PER_PT)])
+        requests: List[Dict[str, Any]] = add_text_requests(
+            text, page_id, element_id, magnitude, box=None if boxes is None else boxes[0]
+        )
+        return self.__submit("textbox", requests, "createShape")
 
     def add_image(self, img_url: str, page_id: Optional[str] = None, **kwargs) -> bool:
         """[summary]
@@ -216,35 +487,59 @@ class SlidesAPI(APIBase):
             bool: Whether succeeded to add image.
         """
         if page_id is None:
-            page_id = "p"
+            page_id = self.__first_page()
+            if page_id is None:
+                return False
 
         image_id: str = kwargs.get("image_id", token_hex(16))
-        emu: Dict[str, Any] = {"magnitude": kwargs.get("magnitude", 4000), "unit": "EMU"}
-        requests: List[Dict[str, Any]] = [
-            {
-                "createImage": {
-                    "objectId": image_id,
-                    "url": img_url,
-                    "elementProperties": {
-                        "pageObjectId": page_id,
-                        "size": {"height": emu, "width": emu},
-                        "transform": {
-                            "scaleX": 1,
-                            "scaleY": 1,
-                            "translateX": 100000,
-                            "translateY": 100000,
-                            "unit": "EMU",
-                        },
-                    },
-                }
-            }
-        ]
-        response: Optional[Dict[str, Any]] = self.__post_update(requests)
-        if response is not None:
-            create_image_response = response.get("replies")[0].get("createImage")
-            logger.info(f"Created image with ID: {create_image_response.get('objectId')}")
-            return True
-        return False
+        magnitude: int = kwargs.get("magnitude", 4000)
+        boxes: Optional[List[Box]] = self.__place(page_id, [(magnitude, magnitude)])
+        requests: List[Dict[str, Any]] = add_image_requests(
+            img_url, page_id, image_id, magnitude, box=None if boxes is None else boxes[0]
+        )
+        return self.__submit("image", requests, "createImage")
+
+    def add_elements(
+        self,
+        elements: Sequence[SlideElement],
+        page_id: Optional[str] = None,
+        mode: str = "pack",
+        margin: int = SPACING,
+        gap: int = SPACING,
+    ) -> bool:
+        """Add many texts and images to the slide without overlap, in a batchUpdate call.
+        Positions are computed from the local index, so no extra read is needed.
+
+        Args:
+            elements (Sequence[SlideElement]): Elements to be added.
+            page_id (Optional[str]): ID of page. If None, add to the first slide. Defaults to None.
+            mode (str): Layout mode, 'grid', 'flow' or 'pack'. In grid mode, elements are resized to cells.
+                Defaults to 'pack'.
+            margin (int): Margin of the page in EMU. Defaults to 0.25 inch.
+            gap (int): Gap between elements in EMU. Defaults to 0.25 inch.
+
+        Returns:
+            bool: Whether succeeded to add elements. If elements do not fit in the page, returns False.
+        """
+        if page_id is None:
+            page_id = self.__first_page()
+            if page_id is None:
+                return False
+
+        boxes: Optional[List[Box]] = self.__place(page_id, [e.size for e in elements], mode, margin, gap)
+        if boxes is None:
+            return False
+
+        requests: List[Dict[str, Any]] = []
+        for element, box in zip(elements, boxes):
+            object_id: str = element.object_id or token_hex(16)
+            if element.kind == "text":
+                requests.extend(add_text_requests(element.content, page_id, object_id, box=box))
+            elif element.kind == "image":
+                requests.extend(add_image_requests(element.content, page_id, object_id, box=box))
+            else:
+                raise ValueError(f"Unknown kind of element: {element.kind}")
+        return self.__submit("elements", requests)
 
     def create_empty_table(self, table_id: str, rows: int, cols: int, page_id: Optional[str] = None) -> bool:
         """Create empty table.
@@ -260,39 +555,33 @@ class SlidesAPI(APIBase):
             bool: Whether succeeded to create the table.
         """
         if page_id is None:
-            page_id = "p"
+            page_id = self.__first_page()
+            if page_id is None:
+                return False
 
-        requests: List[Dict[str, Any]] = [
-            {
-                "createTable": {
-                    "objectId": table_id,
-                    "elementProperties": {
-                        "pageObjectId": page_id,
-                    },
-                    "rows": rows,
-                    "cols": cols,
-                }
-            }
-        ]
-        response: Optional[Dict[str, Any]] = self.__post_update(requests)
-        if response is not None:
-            create_table_response = response.get("replies")[0].get("createTable")
-            logger.info(f"Created table with ID: {create_table_response.get('objectId')}")
-            return True
-        return False
+        requests: List[Dict[str, Any]] = create_table_requests(table_id, rows, cols, page_id)
+        return self.__submit("table", requests, "createTable")
 
     def add_table(
         self,
         values: List[List[str]],
         table_id: Optional[str] = None,
         page_id: Optional[str] = None,
+        styles: Optional[Sequence[CellStyle]] = None,
+        max_requests: int = 1000,
+        max_bytes: Optional[int] = 2 * 1024 * 1024,
     ) -> bool:
         """Add values to the table.
+        Creation of the table, insertion of values and styles are posted together with as few batchUpdate calls
+        as possible. Large tables are split into calls bounded by `max_requests` and `max_bytes`.
 
         Args:
             values (List[List[str]]): Values of elements, in shape (rows, cols).
             table_id (Optional[str]): ID of table. If None, create new table. Defaults to None.
             page_id (Optional[str]): ID of page. If None, create on the first page. Defaults to None.
+            styles (Optional[Sequence[CellStyle]]): Styles applied to ranges of cells. Defaults to None.
+            max_requests (int): Max number of requests in a batchUpdate call. Defaults to 1000.
+            max_bytes (Optional[int]): Max size of requests in a batchUpdate call in bytes. Defaults to 2MB.
 
         Returns:
             bool: Whether succeeded to add elements in the table.
@@ -304,36 +593,358 @@ class SlidesAPI(APIBase):
         cols: int = len(values[0])
         assert all([len(e) == cols for e in values])
 
-        # Create new empty table
+        requests: List[Dict[str, Any]] = []
+        reply_key: Optional[str] = None
         if table_id is None:
-            table_id: str = token_hex(16)
-            assert self.create_empty_table(
-                table_id=table_id,
-                rows=rows,
-                cols=cols,
-                page_id=page_id,
+            if page_id is None:
+                page_id = self.__first_page()
+                if page_id is None:
+                    return False
+            table_id = token_hex(16)
+            requests.extend(create_table_requests(table_id, rows, cols, page_id))
+            reply_key = "createTable"
+
+        requests.extend(insert_table_requests(values, table_id))
+        if styles:
+            requests.extend(style_table_requests(styles, table_id, rows, cols))
+
+        # NOTE: createTable is always in the first chunk, so later chunks can refer to the table.
+        for chunk, _ in iter_chunks(requests, max_items=max_requests, max_bytes=max_bytes):
+            if not self.__submit("table", chunk, reply_key):
+                return False
+            reply_key = None
+        return True
+
+    def render_template(
+        self,
+        template_page_id: str,
+        records: Iterable[Dict[str, Any]],
+        image_keys: Sequence[str] = (),
+        pattern: str = "{{%s}}",
+        delete_template: bool = False,
+        max_requests: int = 1000,
+        max_bytes: Optional[int] = 2 * 1024 * 1024,
+    ) -> Optional[List[str]]:
+        """Render a slide per record by duplicating the template slide and replacing its placeholders.
+
+        For each record, the template is duplicated and placeholders like '{{name}}' are replaced with values
+        (`replaceAllText`) or images (`replaceAllShapesWithImage` for `image_keys`) only on the new slide.
+        Requests of many records are packed into batchUpdate calls bounded by `max_requests` and `max_bytes`,
+        and each call ends with `updateSlidesPosition` to keep new slides in order of records after the template.
+
+        Args:
+            template_page_id (str): ID of template slide.
+            records (Iterable[Dict[str, Any]]): Values of placeholders for each slide. Read lazily.
+            image_keys (Sequence[str]): Keys whose values are URLs of images. Defaults to ().
+            pattern (str): Format of placeholders. Defaults to '{{%s}}'.
+            delete_template (bool): Whether to delete the template slide after rendering. Defaults to False.
+            max_requests (int): Max number of requests in a batchUpdate call. Defaults to 1000.
+            max_bytes (Optional[int]): Max size of requests in a batchUpdate call in bytes. Defaults to 2MB.
+
+        Returns:
+            Optional[List[str]]: IDs of created slides in order of records. If failed, returns None.
+        """
+        # NOTE: Queued operations may create the template, so they are posted first.
+        if self._batch is not None and not self._batch.flush():
+            return None
+
+        index: Optional[PageIndex] = self.get_index()
+        if index is None:
+            return None
+        if template_page_id not in index.slides:
+            logger.error("Template slide not found: %s", template_page_id)
+            return None
+        insertion_index: int = index.slides.index(template_page_id) + 1
+
+        created: List[str] = []
+        group: List[List[Dict[str, Any]]] = []
+        group_ids: List[str] = []
+        num_requests: int = 0
+        num_bytes: int = 0
+
+        def post() -> bool:
+            # Each duplicate is inserted right after the template, so records are posted in reverse order to
+            # leave new slides in order of records. Then they are in presentation order as updateSlidesPosition
+            # requires, and are moved after the slides created by previous calls.
+            requests: List[Dict[str, Any]] = [
+                request for record_requests in reversed(group) for request in record_requests
+            ]
+            move: Dict[str, Any] = {
+                "updateSlidesPosition": {
+                    "slideObjectIds": group_ids,
+                    "insertionIndex": insertion_index + len(created) + len(group_ids),
+                }
+            }
+            if self.__post_update(requests + [move]) is None:
+                return False
+            created.extend(group_ids)
+            logger.info("Rendered %d slides.", len(created))
+            return True
+
+        for record in records:
+            page_id: str = token_hex(16)
+            requests: List[Dict[str, Any]] = template_requests(template_page_id, page_id, record, image_keys, pattern)
+            record_bytes: int = json_size(requests) if max_bytes is not None else 0
+            if group and (
+                num_requests + len(requests) + 1 > max_requests
+                or (max_bytes is not None and num_bytes + record_bytes > max_bytes)
+            ):
+                if not post():
+                    return None
+                group, group_ids, num_requests, num_bytes = [], [], 0, 0
+            group.append(requests)
+            group_ids.append(page_id)
+            num_requests += len(requests)
+            num_bytes += record_bytes
+
+        if group and not post():
+            return None
+
+        if delete_template and self.__post_update([{"deleteObject": {"objectId": template_page_id}}]) is None:
+            return None
+        return created
+
+
+def create_slide_requests(
+    page_id: str,
+    layout: SlideLayout = SlideLayout.BLANK,
+    insertion_index: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Returns requests to create new slide.
+
+    Args:
+        page_id (str): ID of new page.
+        layout (SlideLayout): Defaults to SlideLayout.BLANK
+        insertion_index (Optional[int]): 0-based position of new slide. If None, append to the end.
+            Defaults to None.
+
+    Returns:
+        List[Dict[str, Any]]: Requests for batchUpdate.
+    """
+    request: Dict[str, Any] = {
+        "objectId": page_id,
+        "slideLayoutReference": {
+            "predefinedLayout": layout.value,
+        },
+    }
+    if insertion_index is not None:
+        request["insertionIndex"] = insertion_index
+    return [{"createSlide": request}]
+
+
+def _box_properties(page_id: str, box: Box) -> Dict[str, Any]:
+    return {
+        "pageObjectId": page_id,
+        "size": {
+            "width": {"magnitude": box.width, "unit": "EMU"},
+            "height": {"magnitude": box.height, "unit": "EMU"},
+        },
+        "transform": {"scaleX": 1, "scaleY": 1, "translateX": box.x, "translateY": box.y, "unit": "EMU"},
+    }
+
+
+def add_text_requests(
+    text: str,
+    page_id: str,
+    element_id: str,
+    magnitude: int = 100,
+    box: Optional[Box] = None,
+) -> List[Dict[str, Any]]:
+    """Returns requests to add new text box.
+
+    Args:
+        text (str): text info to be inserted.
+        page_id (str): page ID to be inserted.
+        element_id (str): the element ID of text.
+        magnitude (int): magnitude of textbox. Defaults to 100.
+        box (Optional[Box]): Position and size in EMU. If given, magnitude is ignored. Defaults to None.
+
+    Returns:
+        List[Dict[str, Any]]: Requests for batchUpdate.
+    """
+    pt: Dict[str, Any] = {"magnitude": magnitude, "unit": "PT"}
+    properties: Dict[str, Any] = {
+        "pageObjectId": page_id,
+        "size": {"height": pt, "width": pt},
+        "transform": {"scaleX": 1, "scaleY": 1, "translateX": 350, "translateY": 100, "unit": "PT"},
+    }
+    return [
+        {
+            "createShape": {
+                "objectId": element_id,
+                "shapeType": "TEXT_BOX",
+                "elementProperties": properties if box is None else _box_properties(page_id, box),
+            }
+        },
+        # Insert text into the box, using the supplied element ID.
+        {"insertText": {"objectId": element_id, "insertionIndex": 0, "text": text}},
+    ]
+
+
+def add_image_requests(
+    img_url: str,
+    page_id: str,
+    image_id: str,
+    magnitude: int = 4000,
+    box: Optional[Box] = None,
+) -> List[Dict[str, Any]]:
+    """Returns requests to add new image.
+
+    Args:
+        img_url (str): URL of image.
+        page_id (str): ID of page.
+        image_id (str): ID of image.
+        magnitude (int): Size of image. Defaults to 4000.
+        box (Optional[Box]): Position and size in EMU. If given, magnitude is ignored. Defaults to None.
+
+    Returns:
+        List[Dict[str, Any]]: Requests for batchUpdate.
+    """
+    if box is None:
+        box = Box(100000, 100000, magnitude, magnitude)
+    return [
+        {
+            "createImage": {
+                "objectId": image_id,
+                "url": img_url,
+                "elementProperties": _box_properties(page_id, box),
+            }
+        }
+    ]
+
+
+def create_table_requests(table_id: str, rows: int, cols: int, page_id: str) -> List[Dict[str, Any]]:
+    """Returns requests to create empty table.
+
+    Args:
+        table_id (str): The ID of table.
+        rows (int): The number of rows.
+        cols (int): The number of columns.
+        page_id (str): The ID of page.
+
+    Returns:
+        List[Dict[str, Any]]: Requests for batchUpdate.
+    """
+    return [
+        {
+            "createTable": {
+                "objectId": table_id,
+                "elementProperties": {
+                    "pageObjectId": page_id,
+                },
+                "rows": rows,
+                "cols": cols,
+            }
+        }
+    ]
+
+
+def insert_table_requests(values: List[List[str]], table_id: str) -> List[Dict[str, Any]]:
+    """Returns requests to insert values to the table.
+
+    Args:
+        values (List[List[str]]): Values of elements, in shape (rows, cols).
+        table_id (str): ID of table.
+
+    Returns:
+        List[Dict[str, Any]]: Requests for batchUpdate.
+    """
+    requests: List[Dict[str, Any]] = []
+    for i, v_rows in enumerate(values):
+        for j, v in enumerate(v_rows):
+            # NOTE: insertText with empty text is rejected, and the cell is already empty.
+            if v is None or v == "":
+                continue
+            requests.append(
+                {
+                    "insertText": {
+                        "objectId": table_id,
+                        "cellLocation": {
+                            "rowIndex": i,
+                            "columnIndex": j,
+                        },
+                        "text": str(v),
+                        "insertionIndex": 0,
+                    }
+                }
             )
+    return requests
 
-        # Insert to table
-        requests: List[Dict[str, Any]] = []
-        # cnt: int = 0
-        for i, v_rows in enumerate(values):
-            for j, v in enumerate(v_rows):
-                requests.append(
-                    {
-                        "insertText": {
-                            "objectId": table_id,
-                            "cellLocation": {
-                                "rowindex": i,
-                                "columnIndex": j,
-                            },
-                            "text": str(v),
-                            "insertionIndex": 0,  # cnt
-                        }
+
+def style_table_requests(styles: Sequence[CellStyle], table_id: str, rows: int, cols: int) -> List[Dict[str, Any]]:
+    """Returns requests to apply styles to ranges of table cells, one request per range.
+
+    Args:
+        styles (Sequence[CellStyle]): Styles applied to ranges of cells.
+        table_id (str): ID of table.
+        rows (int): The number of rows of the table.
+        cols (int): The number of columns of the table.
+
+    Returns:
+        List[Dict[str, Any]]: Requests for batchUpdate.
+    """
+    requests: List[Dict[str, Any]] = []
+    for style in styles:
+        requests.append(
+            {
+                "updateTableCellProperties": {
+                    "objectId": table_id,
+                    "tableRange": {
+                        "location": {"rowIndex": style.row, "columnIndex": style.col},
+                        "rowSpan": style.row_span if style.row_span is not None else rows - style.row,
+                        "columnSpan": style.col_span if style.col_span is not None else cols - style.col,
+                    },
+                    "tableCellProperties": style.properties,
+                    "fields": style.fields if style.fields is not None else ",".join(style.properties),
+                }
+            }
+        )
+    return requests
+
+
+def template_requests(
+    template_page_id: str,
+    page_id: str,
+    record: Dict[str, Any],
+    image_keys: Sequence[str] = (),
+    pattern: str = "{{%s}}",
+) -> List[Dict[str, Any]]:
+    """Returns requests to duplicate the template slide and replace its placeholders with values of record.
+
+    Args:
+        template_page_id (str): ID of template slide.
+        page_id (str): ID of new slide.
+        record (Dict[str, Any]): Values of placeholders.
+        image_keys (Sequence[str]): Keys whose values are URLs of images. Defaults to ().
+        pattern (str): Format of placeholders. Defaults to '{{%s}}'.
+
+    Returns:
+        List[Dict[str, Any]]: Requests for batchUpdate.
+    """
+    requests: List[Dict[str, Any]] = [
+        {"duplicateObject": {"objectId": template_page_id, "objectIds": {template_page_id: page_id}}}
+    ]
+    for key, value in record.items():
+        contains_text: Dict[str, Any] = {"text": pattern % key, "matchCase": True}
+        if key in image_keys and value:
+            requests.append(
+                {
+                    "replaceAllShapesWithImage": {
+                        "imageUrl": value,
+                        "imageReplaceMethod": "CENTER_INSIDE",
+                        "containsText": contains_text,
+                        "pageObjectIds": [page_id],
                     }
-                )
-                # cnt += 1
-        response: Optional[Dict[str, Any]] = self.__post_update(requests)
-        if response is not None:
-            return True
-        return False
+                }
+            )
+        else:
+            requests.append(
+                {
+                    "replaceAllText": {
+                        "containsText": contains_text,
+                        "replaceText": "" if value is None else str(value),
+                        "pageObjectIds": [page_id],
+                    }
+                }
+            )
+    return requests
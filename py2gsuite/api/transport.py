@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Tuple
+
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.http import build_http
+
+__all__ = ("HttpPool", "PooledHttp", "authorized_http", "get_default_pool", "set_default_pool")
+
+
+class HttpPool:
+    """Thread-safe bounded pool of httplib2.Http instances.
+
+    Each httplib2.Http keeps its connections alive per host, so reusing them across requests and API wrappers
+    avoids a new TCP/TLS handshake per request. Idle instances are reused in LIFO order to prefer warm connections.
+
+    Attributes:
+        max_size (int): Max number of httplib2.Http instances.
+        timeout (Optional[float]): Max seconds to wait for an instance to be checked in. If None, waits forever.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10,
+        timeout: Optional[float] = None,
+        factory: Callable[[], httplib2.Http] = build_http,
+    ) -> None:
+        """
+        Args:
+            max_size (int): Max number of httplib2.Http instances. Defaults to 10.
+            timeout (Optional[float]): Max seconds to wait for an instance to be checked in. Defaults to None.
+            factory (Callable[[], httplib2.Http]): Function to create a new instance. Defaults to build_http.
+        """
+        if max_size < 1:
+            raise ValueError(f"`max_size` must be >= 1, but got {max_size}")
+        self.max_size: int = max_size
+        self.timeout: Optional[float] = timeout
+        self._factory = factory
+        self._idle: queue.LifoQueue = queue.LifoQueue(maxsize=max_size)
+        self._lock = threading.Lock()
+        self._created: int = 0
+
+    @property
+    def size(self) -> int:
+        """Returns the number of instances created so far."""
+        return self._created
+
+    @contextmanager
+    def checkout(self) -> Iterator[httplib2.Http]:
+        """Check out an instance from the pool, then check it in after used.
+
+        Yields:
+            httplib2.Http: Instance only used by the caller until checked in.
+
+        Raises:
+            TimeoutError: When no instance is checked in within `timeout`.
+        """
+        http: Optional[httplib2.Http] = None
+        try:
+            http = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._created < self.max_size:
+                    self._created += 1
+                    http = self._factory()
+        if http is None:
+            try:
+                http = self._idle.get(timeout=self.timeout)
+            except queue.Empty:
+                raise TimeoutError(f"No connection is available in {self.timeout} seconds")
+
+        try:
+            yield http
+        except Exception:
+            # NOTE: The state of connections is unknown, so they are discarded.
+            http.close()
+            raise
+        finally:
+            self._idle.put_nowait(http)
+
+    def close(self) -> None:
+        """Close connections of all idle instances. Instances can be reused after closed."""
+        idle: List[httplib2.Http] = []
+        while True:
+            try:
+                idle.append(self._idle.get_nowait())
+            except queue.Empty:
+                break
+        for http in idle:
+            http.close()
+            self._idle.put_nowait(http)
+
+
+class PooledHttp:
+    """httplib2.Http compatible transport which checks out an instance from `HttpPool` per request.
+    It can be shared by many Resources and threads.
+    """
+
+    def __init__(self, pool: Optional[HttpPool] = None) -> None:
+        """
+        Args:
+            pool (Optional[HttpPool]): The pool of instances. If None, the default pool is used. Defaults to None.
+        """
+        self.pool: HttpPool = get_default_pool() if pool is None else pool
+        self.timeout: Optional[float] = None
+        self.follow_redirects: bool = True
+        self.redirect_codes = set(httplib2.REDIRECT_CODES) - {308}
+        self.connections: dict = {}
+
+    def request(self, uri: str, method: str = "GET", *args, **kwargs) -> Tuple[httplib2.Response, bytes]:
+        with self.pool.checkout() as http:
+            return http.request(uri, method, *args, **kwargs)
+
+    def add_certificate(self, *args, **kwargs) -> None:
+        raise NotImplementedError("Client certificates are not supported by PooledHttp")
+
+    def close(self) -> None:
+        # NOTE: Connections are owned by the pool.
+        pass
+
+
+_default_pool: Optional[HttpPool] = None
+_default_lock = threading.Lock()
+
+
+def get_default_pool() -> HttpPool:
+    """Returns the process-wide default pool.
+
+    Returns:
+        HttpPool: The default pool.
+    """
+    global _default_pool
+    with _default_lock:
+        if _default_pool is None:
+            _default_pool = HttpPool()
+        return _default_pool
+
+
+def set_default_pool(pool: Optional[HttpPool]) -> None:
+    """Set the process-wide default pool. It is used by Resources built after this.
+
+    Args:
+        pool (Optional[HttpPool]): The pool. If None, a new pool is created when needed.
+    """
+    global _default_pool
+    with _default_lock:
+        old: Optional[HttpPool] = _default_pool
+        _default_pool = pool
+    if old is not None and old is not pool:
+        old.close()
+
+
+def authorized_http(creds: Any, pool: Optional[HttpPool] = None) -> Any:
+    """Returns pooled transport authorized by credentials.
+
+    Args:
+        creds (Any): Credentials instance. If None, requests are not authorized.
+        pool (Optional[HttpPool]): The pool of instances. Defaults to None.
+
+    Returns:
+        Any: AuthorizedHttp instance, or PooledHttp if creds is None.
+    """
+    http = PooledHttp(pool)
+    if creds is None:
+        return http
+    return AuthorizedHttp(creds, http=http)
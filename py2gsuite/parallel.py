@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type, TypeVar
+
+from google.oauth2.credentials import Credentials
+from googleapiclient.discovery import Resource
+
+from py2gsuite.api import SheetsAPI, SlidesAPI
+from py2gsuite.api.base import APIBase
+from py2gsuite.api.discovery import build_service
+from py2gsuite.api.transport import HttpPool
+from py2gsuite.utils import get_logger
+
+__all__ = ("ParallelResult", "map_apis", "map_sheets", "map_slides")
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+
+class ParallelResult:
+    """Aggregated result of `map_apis()`.
+
+    Attributes:
+        successes (Dict[str, Any]): Returned values of succeeded documents, keyed by document ID.
+        failures (Dict[str, Any]): Raised exceptions (or False/None) of failed documents, keyed by document ID.
+        elapsed (float): Elapsed time in seconds.
+    """
+
+    def __init__(self) -> None:
+        self.successes: Dict[str, Any] = {}
+        self.failures: Dict[str, Any] = {}
+        self.elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return len(self.failures) == 0
+
+    @property
+    def throughput(self) -> float:
+        """Returns the number of processed documents per second."""
+        total: int = len(self.successes) + len(self.failures)
+        return total / self.elapsed if self.elapsed > 0 else float("inf")
+
+    def __repr__(self) -> str:
+        return (
+            f"ParallelResult(successes={len(self.successes)}, failures={len(self.failures)}, "
+            f"elapsed={self.elapsed:.2f}s)"
+        )
+
+
+def map_apis(
+    api_cls: Type[APIBase],
+    func: Callable[[APIBase], T],
+    creds: Credentials,
+    ids: Iterable[str],
+    workers: int = 8,
+    progress: Optional[Callable[[int, int], None]] = None,
+    log_every: int = 100,
+    pool: Optional[HttpPool] = None,
+) -> ParallelResult:
+    """Apply function to API instances of many documents in parallel threads.
+
+    All workers share a Resource whose requests are sent through a pool of `workers` connections,
+    so each request is sent on a connection used only by its thread.
+
+    Args:
+        api_cls (Type[APIBase]): API class, SheetsAPI or SlidesAPI.
+        func (Callable[[APIBase], T]): Function to apply. If it raises or returns False or None, the document
+            is failed, as methods of API classes return them on failure.
+        creds (Credentials): Credentials instance.
+        ids (Iterable[str]): IDs of documents.
+        workers (int): The number of threads. Defaults to 8.
+        progress (Optional[Callable[[int, int], None]]): Function called with the number of processed
+            and all documents on each completion. Defaults to None.
+        log_every (int): Log progress every this number of documents. Defaults to 100.
+        pool (Optional[HttpPool]): The pool of connections. If None, create new one with `workers` connections,
+            which is closed on return. Defaults to None.
+
+    Returns:
+        ParallelResult: Aggregated result.
+    """
+    api, version = ("sheets", "v4") if issubclass(api_cls, SheetsAPI) else ("slides", "v1")
+    own_pool: bool = pool is None
+    if own_pool:
+        pool = HttpPool(max_size=workers)
+    service: Resource = build_service(api, version, creds, pool=pool)
+    doc_ids: List[str] = list(ids)
+    total: int = len(doc_ids)
+
+    result = ParallelResult()
+    start: float = time.perf_counter()
+
+    def run(doc_id: str) -> T:
+        with api_cls(creds, doc_id, service) as api_obj:
+            return func(api_obj)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run, doc_id): doc_id for doc_id in doc_ids}
+            for done, future in enumerate(as_completed(futures), start=1):
+                doc_id: str = futures[future]
+                try:
+                    value = future.result()
+                except Exception as err:
+                    logger.error("%s: %r", doc_id, err)
+                    value, failed = err, True
+                else:
+                    failed = value is None or value is False
+                (result.failures if failed else result.successes)[doc_id] = value
+
+                if progress is not None:
+                    progress(done, total)
+                if done % log_every == 0 or done == total:
+                    elapsed: float = time.perf_counter() - start
+                    logger.info("%d/%d documents processed (%.1f docs/s).", done, total, done / elapsed)
+    finally:
+        if own_pool:
+            pool.close()
+
+    result.elapsed = time.perf_counter() - start
+    logger.info("%d succeeded, %d failed in %.2fs.", len(result.successes), len(result.failures), result.elapsed)
+    return result
+
+
+def map_sheets(
+    func: Callable[[SheetsAPI], T],
+    creds: Credentials,
+    ids: Iterable[str],
+    workers: int = 8,
+    **kwargs,
+) -> ParallelResult:
+    """Apply function to SheetsAPI instances of many spreadsheets in parallel threads.
+    See `map_apis()` for details.
+
+    Args:
+        func (Callable[[SheetsAPI], T]): Function to apply.
+        creds (Credentials): Credentials instance.
+        ids (Iterable[str]): IDs of spreadsheets.
+        workers (int): The number of threads. Defaults to 8.
+
+    Returns:
+        ParallelResult: Aggregated result.
+
+    Examples:
+        >>> result = map_sheets(lambda api: api.update_values([["OK"]], "A1"), creds, sheet_ids, workers=16)
+        >>> result.failures
+        {}
+    """
+    return map_apis(SheetsAPI, func, creds, ids, workers=workers, **kwargs)
+
+
+def map_slides(
+    func: Callable[[SlidesAPI], T],
+    creds: Credentials,
+    ids: Iterable[str],
+    workers: int = 8,
+    **kwargs,
+) -> ParallelResult:
+    """Apply function to SlidesAPI instances of many presentations in parallel threads.
+    See `map_apis()` for details.
+
+    Args:
+        func (Callable[[SlidesAPI], T]): Function to apply.
+        creds (Credentials): Credentials instance.
+        ids (Iterable[str]): IDs of presentations.
+        workers (int): The number of threads. Defaults to 8.
+
+    Returns:
+        ParallelResult: Aggregated result.
+    """
+    return map_apis(SlidesAPI, func, creds, ids, workers=workers, **kwargs)
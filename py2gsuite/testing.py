@@ -0,0 +1,643 @@
+"""In-process fake of Google Sheets/Slides API for tests and benchmarks.
+
+`FakeBackend` keeps spreadsheets and presentations in memory and serves the REST endpoints used by py2gsuite
+through `FakeHttp`, an httplib2-compatible transport. Resources are built from the bundled discovery documents,
+so requests go through the same googleapiclient code path as real ones, without network or credentials.
+
+Examples:
+    >>> backend = FakeBackend(latency=0.01)
+    >>> api = backend.sheets_api()
+    >>> _ = api.update_values([["a", "b"]], "A1:B1")
+    >>> backend.values(api.id, "A1:B1")
+    [['a', 'b']]
+"""
+
+from __future__ import annotations
+
+import copy
+import http.client
+import json
+import random
+import re
+import threading
+import time
+from collections import deque
+from secrets import token_hex
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import httplib2
+from google.auth.credentials import AnonymousCredentials
+from googleapiclient.discovery import Resource, build_from_document
+
+from py2gsuite.api.discovery import get_document
+from py2gsuite.api.sheets import SheetsAPI
+from py2gsuite.api.slides import SlidesAPI
+from py2gsuite.utils.a1 import format_range, parse_range
+
+__all__ = ("FakeBackend", "FakeHttp", "FakeError")
+
+GRID_SIZE: Tuple[int, int] = (1000, 26)
+PAGE_SIZE: Dict[str, Any] = {
+    "width": {"magnitude": 9144000, "unit": "EMU"},
+    "height": {"magnitude": 5143500, "unit": "EMU"},
+}
+
+_SHEETS_ROUTES: List[Tuple[str, "re.Pattern[str]"]] = [
+    ("create_spreadsheet", re.compile(r"^/v4/spreadsheets$")),
+    ("get_spreadsheet", re.compile(r"^/v4/spreadsheets/([^/:]+)$")),
+    ("batch_get", re.compile(r"^/v4/spreadsheets/([^/]+)/values:batchGet$")),
+    ("batch_update", re.compile(r"^/v4/spreadsheets/([^/]+)/values:batchUpdate$")),
+    ("append", re.compile(r"^/v4/spreadsheets/([^/]+)/values/([^/]+):append$")),
+    ("values", re.compile(r"^/v4/spreadsheets/([^/]+)/values/([^/:]+)$")),
+]
+_SLIDES_ROUTES: List[Tuple[str, "re.Pattern[str]"]] = [
+    ("create_presentation", re.compile(r"^/v1/presentations$")),
+    ("get_presentation", re.compile(r"^/v1/presentations/([^/:]+)$")),
+    ("get_page", re.compile(r"^/v1/presentations/([^/]+)/pages/([^/]+)$")),
+    ("batch_update_presentation", re.compile(r"^/v1/presentations/([^/]+):batchUpdate$")),
+]
+
+
+class FakeError(Exception):
+    """Error returned as an HTTP error response by `FakeBackend`."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status: int = status
+        self.message: str = message
+
+
+def _text(content: str) -> Dict[str, Any]:
+    return {"textElements": [{"textRun": {"content": content}}]} if content else {"textElements": []}
+
+
+def _content(text: Optional[Dict[str, Any]]) -> str:
+    if not text:
+        return ""
+    return "".join(e.get("textRun", {}).get("content", "") for e in text.get("textElements", []))
+
+
+class FakeBackend:
+    """In-memory state of spreadsheets and presentations, with simulated latency, errors and quota.
+
+    Attributes:
+        latency (float): Seconds to sleep on every request.
+        error_rate (float): Probability that a request fails with `error_status`.
+        error_status (int): HTTP status of random errors.
+        quota (Optional[Tuple[int, float]]): Max number of requests in a window of seconds. Exceeding requests
+            fail with 429.
+        calls (List[Tuple[str, str]]): (HTTP method, path) of received requests.
+        bytes_received (int): Total size of request bodies.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        quota: Optional[Tuple[int, float]] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency: float = latency
+        self.error_rate: float = error_rate
+        self.error_status: int = error_status
+        self.quota: Optional[Tuple[int, float]] = quota
+        self.calls: List[Tuple[str, str]] = []
+        self.bytes_received: int = 0
+        self.spreadsheets: Dict[str, Dict[str, Any]] = {}
+        self.presentations: Dict[str, Dict[str, Any]] = {}
+        self._random = random.Random(seed)
+        self._failures: Deque[int] = deque()
+        self._window: Deque[float] = deque()
+        self._lock = threading.RLock()
+
+    # ---- Setup ----
+
+    def fail_next(self, status: int, count: int = 1) -> None:
+        """Make the next `count` requests fail with the status.
+
+        Args:
+            status (int): HTTP status.
+            count (int): The number of requests. Defaults to 1.
+        """
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def service(self, api: str, version: str) -> Resource:
+        """Returns a Resource whose requests are served by the backend.
+
+        Args:
+            api (str): Name of API, 'sheets' or 'slides'.
+            version (str): Version of API, e.g. 'v4'.
+
+        Returns:
+            Resource: Resource instance.
+        """
+        return build_from_document(get_document(api, version), http=FakeHttp(self))
+
+    def sheets_api(self, spreadsheet_id: Optional[str] = None) -> SheetsAPI:
+        """Returns SheetsAPI connected to the backend. If the spreadsheet does not exist, it is created.
+
+        Args:
+            spreadsheet_id (Optional[str]): ID of spreadsheet. Defaults to None.
+
+        Returns:
+            SheetsAPI: SheetsAPI instance.
+        """
+        with self._lock:
+            spreadsheet_id = self.create_spreadsheet({}, spreadsheet_id)["spreadsheetId"]
+        return SheetsAPI(AnonymousCredentials(), spreadsheet_id, service=self.service("sheets", "v4"))
+
+    def slides_api(self, presentation_id: Optional[str] = None, slides: int = 1) -> SlidesAPI:
+        """Returns SlidesAPI connected to the backend. If the presentation does not exist, it is created.
+
+        Args:
+            presentation_id (Optional[str]): ID of presentation. Defaults to None.
+            slides (int): The number of blank slides in new presentation. Defaults to 1.
+
+        Returns:
+            SlidesAPI: SlidesAPI instance.
+        """
+        with self._lock:
+            if presentation_id not in self.presentations:
+                presentation_id = self.create_presentation({}, presentation_id, slides)["presentationId"]
+        return SlidesAPI(AnonymousCredentials(), presentation_id, service=self.service("slides", "v1"))
+
+    # ---- Inspection ----
+
+    def values(self, spreadsheet_id: str, range_name: str) -> List[List[Any]]:
+        """Returns values in the range as stored, with trailing empty cells trimmed.
+
+        Args:
+            spreadsheet_id (str): ID of spreadsheet.
+            range_name (str): Range of cells.
+
+        Returns:
+            List[List[Any]]: Rows of values.
+        """
+        with self._lock:
+            return self.__read(self.spreadsheets[spreadsheet_id], range_name, formatted=False)
+
+    # ---- HTTP ----
+
+    def handle(self, uri: str, method: str, body: Optional[str]) -> Tuple[int, Dict[str, str], Any]:
+        """Handle an HTTP request.
+
+        Args:
+            uri (str): Request URI.
+            method (str): HTTP method.
+            body (Optional[str]): Request body.
+
+        Returns:
+            Tuple[int, Dict[str, str], Any]: HTTP status, headers and JSON response.
+        """
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+        url = urlsplit(uri)
+        with self._lock:
+            self.calls.append((method, url.path))
+            self.bytes_received += len(body or "")
+
+            if self.quota is not None:
+                limit, window = self.quota
+                now: float = time.monotonic()
+                while self._window and self._window[0] <= now - window:
+                    self._window.popleft()
+                if len(self._window) >= limit:
+                    retry_after: float = self._window[0] + window - now
+                    return 429, {"retry-after": f"{retry_after:.3f}"}, _error(429, "Quota exceeded")
+                self._window.append(now)
+
+            status: Optional[int] = self._failures.popleft() if self._failures else None
+            if status is None and self.error_rate > 0 and self._random.random() < self.error_rate:
+                status = self.error_status
+            if status is not None:
+                return status, {}, _error(status, "Injected error")
+
+            query: Dict[str, List[str]] = parse_qs(url.query)
+            data: Dict[str, Any] = json.loads(body) if body else {}
+            routes = _SHEETS_ROUTES if url.netloc.startswith("sheets") else _SLIDES_ROUTES
+            for name, pattern in routes:
+                match = pattern.match(url.path)
+                if match is None:
+                    continue
+                try:
+                    args = [unquote(g) for g in match.groups()]
+                    return 200, {}, getattr(self, f"_FakeBackend__{name}")(method, query, data, *args)
+                except FakeError as err:
+                    return err.status, {}, _error(err.status, err.message)
+                except (KeyError, ValueError) as err:
+                    return 400, {}, _error(400, f"Invalid request: {err}")
+            return 404, {}, _error(404, f"Not found: {url.path}")
+
+    # ---- Sheets ----
+
+    def create_spreadsheet(self, data: Dict[str, Any], spreadsheet_id: Optional[str] = None) -> Dict[str, Any]:
+        if spreadsheet_id is None:
+            spreadsheet_id = token_hex(16)
+        if spreadsheet_id not in self.spreadsheets:
+            self.spreadsheets[spreadsheet_id] = {
+                "spreadsheetId": spreadsheet_id,
+                "properties": data.get("properties", {"title": "Untitled"}),
+                "sheets": {"Sheet1": {"grid": list(GRID_SIZE), "cells": {}}},
+            }
+        return self.__spreadsheet_resource(self.spreadsheets[spreadsheet_id])
+
+    def __create_spreadsheet(self, method: str, query: Dict[str, List[str]], data: Dict[str, Any]) -> Any:
+        return self.create_spreadsheet(data)
+
+    def __spreadsheet_resource(self, spreadsheet: Dict[str, Any], titles: Optional[List[str]] = None) -> Any:
+        sheets: List[Dict[str, Any]] = []
+        for i, (title, sheet) in enumerate(spreadsheet["sheets"].items()):
+            if titles and title not in titles:
+                continue
+            grid: Dict[str, int] = {"rowCount": sheet["grid"][0], "columnCount": sheet["grid"][1]}
+            sheets.append({"properties": {"sheetId": i, "title": title, "gridProperties": grid}})
+        return {
+            "spreadsheetId": spreadsheet["spreadsheetId"],
+            "properties": spreadsheet["properties"],
+            "sheets": sheets,
+        }
+
+    def __get_spreadsheet(self, method: str, query: Dict[str, List[str]], data: Dict[str, Any], sid: str) -> Any:
+        spreadsheet: Dict[str, Any] = self.__find_spreadsheet(sid)
+        titles: List[str] = [self.__sheet(spreadsheet, r)[0] for r in query.get("ranges", [])]
+        return self.__spreadsheet_resource(spreadsheet, titles)
+
+    def __find_spreadsheet(self, sid: str) -> Dict[str, Any]:
+        if sid not in self.spreadsheets:
+            raise FakeError(404, f"Requested entity was not found: {sid}")
+        return self.spreadsheets[sid]
+
+    def __sheet(self, spreadsheet: Dict[str, Any], range_name: str) -> Tuple[str, Dict[str, Any]]:
+        sheet_name: str = range_name.rsplit("!", 1)[0] if "!" in range_name else range_name
+        sheet_name = sheet_name.strip("'").replace("''", "'")
+        if sheet_name in spreadsheet["sheets"]:
+            return sheet_name, spreadsheet["sheets"][sheet_name]
+        if "!" in range_name:
+            raise FakeError(400, f"Unable to parse range: {range_name}")
+        title: str = next(iter(spreadsheet["sheets"]))
+        return title, spreadsheet["sheets"][title]
+
+    def __bounds(self, spreadsheet: Dict[str, Any], range_name: str) -> Tuple[int, int, int, int]:
+        _, sheet = self.__sheet(spreadsheet, range_name)
+        if "!" not in range_name and range_name.strip("'").replace("''", "'") in spreadsheet["sheets"]:
+            # Range of whole sheet, e.g. 'Sheet1'.
+            return 1, 1, sheet["grid"][0], sheet["grid"][1]
+        _, row, col, end_row, end_col = parse_range(range_name)
+        return row, col, end_row if end_row is not None else sheet["grid"][0], end_col
+
+    def __read(self, spreadsheet: Dict[str, Any], range_name: str, formatted: bool) -> List[List[Any]]:
+        _, sheet = self.__sheet(spreadsheet, range_name)
+        row, col, end_row, end_col = self.__bounds(spreadsheet, range_name)
+        cells: Dict[Tuple[int, int], Any] = sheet["cells"]
+        rows: List[List[Any]] = []
+        for r in range(row, end_row + 1):
+            values: List[Any] = [cells.get((r, c), "") for c in range(col, end_col + 1)]
+            while values and values[-1] == "":
+                values.pop()
+            if formatted:
+                values = [v if isinstance(v, str) else json.dumps(v) if isinstance(v, bool) else str(v) for v in values]
+            rows.append(values)
+        while rows and not rows[-1]:
+            rows.pop()
+        return rows
+
+    def __write(self, spreadsheet: Dict[str, Any], range_name: str, values: List[List[Any]]) -> Dict[str, Any]:
+        title, sheet = self.__sheet(spreadsheet, range_name)
+        row, col, _, _ = self.__bounds(spreadsheet, range_name)
+        cells: Dict[Tuple[int, int], Any] = sheet["cells"]
+        num_cols: int = 0
+        for i, values_row in enumerate(values):
+            num_cols = max(num_cols, len(values_row))
+            for j, value in enumerate(values_row):
+                if value is None:
+                    continue
+                if value == "":
+                    cells.pop((row + i, col + j), None)
+                else:
+                    cells[(row + i, col + j)] = value
+        sheet["grid"][0] = max(sheet["grid"][0], row + len(values) - 1)
+        sheet["grid"][1] = max(sheet["grid"][1], col + num_cols - 1)
+        return {
+            "spreadsheetId": spreadsheet["spreadsheetId"],
+            "updatedRange": format_range(row, col, len(values), num_cols, sheet=title),
+            "updatedRows": len(values),
+            "updatedColumns": num_cols,
+            "updatedCells": sum(len(r) for r in values),
+        }
+
+    def __values(
+        self, method: str, query: Dict[str, List[str]], data: Dict[str, Any], sid: str, range_name: str
+    ) -> Any:
+        spreadsheet: Dict[str, Any] = self.__find_spreadsheet(sid)
+        if method == "GET":
+            formatted: bool = query.get("valueRenderOption", ["FORMATTED_VALUE"])[0] == "FORMATTED_VALUE"
+            values: List[List[Any]] = self.__read(spreadsheet, range_name, formatted)
+            result: Dict[str, Any] = {"range": range_name, "majorDimension": "ROWS"}
+            if values:
+                result["values"] = values
+            return result
+        return self.__write(spreadsheet, range_name, data.get("values", []))
+
+    def __append(
+        self, method: str, query: Dict[str, List[str]], data: Dict[str, Any], sid: str, range_name: str
+    ) -> Any:
+        spreadsheet: Dict[str, Any] = self.__find_spreadsheet(sid)
+        title, sheet = self.__sheet(spreadsheet, range_name)
+        row, col, _, end_col = self.__bounds(spreadsheet, range_name)
+        last: int = max((r for r, c in sheet["cells"] if r >= row and col <= c <= end_col), default=row - 1)
+        start: str = format_range(last + 1, col, 1, 1, sheet=title)
+        return {"spreadsheetId": sid, "updates": self.__write(spreadsheet, start, data.get("values", []))}
+
+    def __batch_get(self, method: str, query: Dict[str, List[str]], data: Dict[str, Any], sid: str) -> Any:
+        spreadsheet: Dict[str, Any] = self.__find_spreadsheet(sid)
+        formatted: bool = query.get("valueRenderOption", ["FORMATTED_VALUE"])[0] == "FORMATTED_VALUE"
+        value_ranges: List[Dict[str, Any]] = []
+        for range_name in query.get("ranges", []):
+            values: List[List[Any]] = self.__read(spreadsheet, range_name, formatted)
+            value_range: Dict[str, Any] = {"range": range_name, "majorDimension": "ROWS"}
+            if values:
+                value_range["values"] = values
+            value_ranges.append(value_range)
+        return {"spreadsheetId": sid, "valueRanges": value_ranges}
+
+    def __batch_update(self, method: str, query: Dict[str, List[str]], data: Dict[str, Any], sid: str) -> Any:
+        spreadsheet: Dict[str, Any] = self.__find_spreadsheet(sid)
+        responses: List[Dict[str, Any]] = [self.__write(spreadsheet, d["range"], d["values"]) for d in data["data"]]
+        return {
+            "spreadsheetId": sid,
+            "totalUpdatedCells": sum(r["updatedCells"] for r in responses),
+            "responses": responses,
+        }
+
+    # ---- Slides ----
+
+    def create_presentation(
+        self, data: Dict[str, Any], presentation_id: Optional[str] = None, slides: int = 1
+    ) -> Dict[str, Any]:
+        if presentation_id is None:
+            presentation_id = token_hex(16)
+        self.presentations[presentation_id] = {
+            "presentationId": presentation_id,
+            "title": data.get("title", "Untitled"),
+            "pageSize": copy.deepcopy(PAGE_SIZE),
+            "slides": [{"objectId": f"p{i}" if i else "p", "pageElements": []} for i in range(slides)],
+        }
+        return self.presentations[presentation_id]
+
+    def __create_presentation(self, method: str, query: Dict[str, List[str]], data: Dict[str, Any]) -> Any:
+        return self.create_presentation(data)
+
+    def __find_presentation(self, pid: str) -> Dict[str, Any]:
+        if pid not in self.presentations:
+            raise FakeError(404, f"Requested entity was not found: {pid}")
+        return self.presentations[pid]
+
+    def __get_presentation(self, method: str, query: Dict[str, List[str]], data: Dict[str, Any], pid: str) -> Any:
+        return copy.deepcopy(self.__find_presentation(pid))
+
+    def __get_page(self, method: str, query: Dict[str, List[str]], data: Dict[str, Any], pid: str, page_id: str) -> Any:
+        presentation: Dict[str, Any] = self.__find_presentation(pid)
+        for slide in presentation["slides"]:
+            if slide["objectId"] == page_id:
+                return copy.deepcopy(slide)
+        raise FakeError(404, f"Requested entity was not found: {page_id}")
+
+    def __batch_update_presentation(
+        self, method: str, query: Dict[str, List[str]], data: Dict[str, Any], pid: str
+    ) -> Any:
+        presentation: Dict[str, Any] = self.__find_presentation(pid)
+        # NOTE: batchUpdate is atomic, so requests are applied to a copy and committed only if all succeeded.
+        state: Dict[str, Any] = copy.deepcopy(presentation)
+        replies: List[Dict[str, Any]] = []
+        for i, request in enumerate(data.get("requests", [])):
+            kind, body = next(iter(request.items()))
+            try:
+                replies.append(_SlidesState(state).apply(kind, body))
+            except FakeError as err:
+                raise FakeError(err.status, f"Invalid requests[{i}].{kind}: {err.message}")
+        self.presentations[pid] = state
+        return {"presentationId": pid, "replies": replies}
+
+
+class _SlidesState:
+    """Applies batchUpdate requests to a presentation resource."""
+
+    def __init__(self, presentation: Dict[str, Any]) -> None:
+        self.presentation: Dict[str, Any] = presentation
+        self.slides: List[Dict[str, Any]] = presentation["slides"]
+
+    def ids(self) -> set:
+        ids = {slide["objectId"] for slide in self.slides}
+        ids.update(e["objectId"] for slide in self.slides for e in slide["pageElements"])
+        return ids
+
+    def slide(self, page_id: str) -> Dict[str, Any]:
+        for slide in self.slides:
+            if slide["objectId"] == page_id:
+                return slide
+        raise FakeError(400, f"The object ({page_id}) could not be found.")
+
+    def element(self, object_id: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        for slide in self.slides:
+            for element in slide["pageElements"]:
+                if element["objectId"] == object_id:
+                    return slide, element
+        raise FakeError(400, f"The object ({object_id}) could not be found.")
+
+    def new_id(self, object_id: Optional[str]) -> str:
+        if object_id is None:
+            return token_hex(8)
+        if object_id in self.ids():
+            raise FakeError(400, f"The object ID ({object_id}) should be unique among all pages and page elements.")
+        return object_id
+
+    def pages(self, body: Dict[str, Any]) -> List[Dict[str, Any]]:
+        page_ids: Optional[List[str]] = body.get("pageObjectIds")
+        return self.slides if not page_ids else [self.slide(page_id) for page_id in page_ids]
+
+    def apply(self, kind: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        handler = getattr(self, kind, None)
+        if handler is None:
+            # Requests which only change styles are accepted without effect.
+            return {}
+        return handler(body)
+
+    def add_element(self, kind: str, body: Dict[str, Any], content: Dict[str, Any]) -> Dict[str, Any]:
+        properties: Dict[str, Any] = body["elementProperties"]
+        slide: Dict[str, Any] = self.slide(properties["pageObjectId"])
+        object_id: str = self.new_id(body.get("objectId"))
+        element: Dict[str, Any] = {"objectId": object_id, kind: content}
+        for key in ("size", "transform"):
+            if key in properties:
+                element[key] = properties[key]
+        slide["pageElements"].append(element)
+        return {f"create{kind[0].upper()}{kind[1:]}": {"objectId": object_id}}
+
+    def createSlide(self, body: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        object_id: str = self.new_id(body.get("objectId"))
+        index: int = int(body.get("insertionIndex", len(self.slides)))
+        if not 0 <= index <= len(self.slides):
+            raise FakeError(400, f"insertionIndex out of range: {index}")
+        self.slides.insert(index, {"objectId": object_id, "pageElements": []})
+        return {"createSlide": {"objectId": object_id}}
+
+    def createShape(self, body: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        return self.add_element("shape", body, {"shapeType": body.get("shapeType", "TEXT_BOX"), "text": _text("")})
+
+    def createImage(self, body: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        return self.add_element("image", body, {"sourceUrl": body["url"], "contentUrl": body["url"]})
+
+    def createTable(self, body: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        rows, cols = int(body["rows"]), int(body["cols"])
+        table_rows = [{"tableCells": [{"text": _text("")} for _ in range(cols)]} for _ in range(rows)]
+        return self.add_element("table", body, {"rows": rows, "columns": cols, "tableRows": table_rows})
+
+    def insertText(self, body: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        if not body.get("text"):
+            raise FakeError(400, "Text must not be empty.")
+        _, element = self.element(body["objectId"])
+        if "cellLocation" in body:
+            if "table" not in element:
+                raise FakeError(400, "cellLocation is only for tables.")
+            location: Dict[str, int] = body["cellLocation"]
+            row, col = location.get("rowIndex", 0), location.get("columnIndex", 0)
+            table: Dict[str, Any] = element["table"]
+            if not (0 <= row < table["rows"] and 0 <= col < table["columns"]):
+                raise FakeError(400, f"Invalid cell location: {location}")
+            holder: Dict[str, Any] = table["tableRows"][row]["tableCells"][col]
+        elif "shape" in element:
+            holder = element["shape"]
+        else:
+            raise FakeError(400, "The object does not allow text editing.")
+        content: str = _content(holder.get("text"))
+        index: int = int(body.get("insertionIndex", 0))
+        holder["text"] = _text(content[:index] + body["text"] + content[index:])
+        return {}
+
+    def updateTableCellProperties(self, body: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        _, element = self.element(body["objectId"])
+        if "table" not in element:
+            raise FakeError(400, "The object is not a table.")
+        table_range: Dict[str, Any] = body.get("tableRange", {})
+        location: Dict[str, int] = table_range.get("location", {})
+        row, col = location.get("rowIndex", 0), location.get("columnIndex", 0)
+        if (
+            row + table_range.get("rowSpan", 1) > element["table"]["rows"]
+            or col + table_range.get("columnSpan", 1) > element["table"]["columns"]
+        ):
+            raise FakeError(400, f"Invalid table range: {table_range}")
+        return {}
+
+    def deleteObject(self, body: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        object_id: str = body["objectId"]
+        for slide in self.slides:
+            if slide["objectId"] == object_id:
+                self.slides.remove(slide)
+                return {}
+        slide, element = self.element(object_id)
+        slide["pageElements"].remove(element)
+        return {}
+
+    def duplicateObject(self, body: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        object_id: str = body["objectId"]
+        mapping: Dict[str, str] = body.get("objectIds", {})
+        if any(object_id == s["objectId"] for s in self.slides):
+            slide: Dict[str, Any] = copy.deepcopy(self.slide(object_id))
+            slide["objectId"] = self.new_id(mapping.get(object_id))
+            for element in slide["pageElements"]:
+                element["objectId"] = self.new_id(mapping.get(element["objectId"]))
+            self.slides.insert(self.slides.index(self.slide(object_id)) + 1, slide)
+            return {"duplicateObject": {"objectId": slide["objectId"]}}
+
+        page, element = self.element(object_id)
+        element = copy.deepcopy(element)
+        element["objectId"] = self.new_id(mapping.get(object_id))
+        page["pageElements"].append(element)
+        return {"duplicateObject": {"objectId": element["objectId"]}}
+
+    def updateSlidesPosition(self, body: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        moved: List[Dict[str, Any]] = [self.slide(page_id) for page_id in body["slideObjectIds"]]
+        positions: List[int] = [next(i for i, slide in enumerate(self.slides) if slide is m) for m in moved]
+        if positions != sorted(set(positions)):
+            raise FakeError(400, "slideObjectIds must be in existing presentation order without duplicates")
+        index: int = int(body.get("insertionIndex", 0))
+        if not 0 <= index <= len(self.slides):
+            raise FakeError(400, f"insertionIndex out of range: {index}")
+        index -= sum(1 for slide in self.slides[:index] if slide in moved)
+        rest: List[Dict[str, Any]] = [slide for slide in self.slides if slide not in moved]
+        self.slides[:] = rest[:index] + moved + rest[index:]
+        return {}
+
+    def replaceAllText(self, body: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        target: str = body["containsText"]["text"]
+        replace: str = body.get("replaceText", "")
+        count: int = 0
+        for slide in self.pages(body):
+            for element in slide["pageElements"]:
+                holders: List[Dict[str, Any]] = []
+                if "shape" in element:
+                    holders.append(element["shape"])
+                if "table" in element:
+                    holders.extend(cell for row in element["table"]["tableRows"] for cell in row["tableCells"])
+                for holder in holders:
+                    content: str = _content(holder.get("text"))
+                    if target in content:
+                        count += content.count(target)
+                        holder["text"] = _text(content.replace(target, replace))
+        return {"replaceAllText": {"occurrencesChanged": count}}
+
+    def replaceAllShapesWithImage(self, body: Dict[str, Any]) -> Dict[str, Any]:  # noqa: N802
+        target: str = body["containsText"]["text"]
+        url: str = body.get("imageUrl", "")
+        count: int = 0
+        for slide in self.pages(body):
+            for i, element in enumerate(slide["pageElements"]):
+                if "shape" in element and target in _content(element["shape"].get("text")):
+                    image: Dict[str, Any] = {"objectId": token_hex(8), "image": {"sourceUrl": url, "contentUrl": url}}
+                    for key in ("size", "transform"):
+                        if key in element:
+                            image[key] = element[key]
+                    slide["pageElements"][i] = image
+                    count += 1
+        return {"replaceAllShapesWithImage": {"occurrencesChanged": count}}
+
+
+def _error(status: int, message: str) -> Dict[str, Any]:
+    return {"error": {"code": status, "message": message, "status": http.client.responses.get(status, "ERROR")}}
+
+
+class FakeHttp:
+    """httplib2.Http compatible transport which passes requests to `FakeBackend`."""
+
+    def __init__(self, backend: FakeBackend) -> None:
+        self.backend: FakeBackend = backend
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        redirections: int = 5,
+        connection_type: Optional[Any] = None,
+    ) -> Tuple[httplib2.Response, bytes]:
+        if isinstance(body, bytes):
+            body = body.decode("utf-8")
+        status, response_headers, result = self.backend.handle(uri, method, body)
+        content: bytes = json.dumps(result).encode("utf-8")
+        response = httplib2.Response(
+            {
+                "status": str(status),
+                "content-type": "application/json",
+                "content-length": str(len(content)),
+                **response_headers,
+            }
+        )
+        return response, content
+
+    def close(self) -> None:
+        pass
@@ -1,16 +1,28 @@
-from .credential import get_credential
+from typing import TYPE_CHECKING, Dict
+
 from .format import class2str, dict2list, dict2str
-from .logger import get_logger
+from .lazy import lazy_attributes
+from .logger import configure_logging, get_logger
 from .types import CredentialType, InsertType, ScopeType, SlideLayout
 
+if TYPE_CHECKING:
+    from .credential import CredentialProvider, get_credential
+
 __all__ = (
     "get_credential",
+    "CredentialProvider",
     "class2str",
     "dict2str",
     "dict2list",
     "get_logger",
+    "configure_logging",
     "CredentialType",
     "InsertType",
     "ScopeType",
     "SlideLayout",
 )
+
+# NOTE: Credential helpers are imported on first access, because google-auth and oauthlib take long to import.
+_LAZY_ATTRS: Dict[str, str] = {"get_credential": ".credential", "CredentialProvider": ".credential"}
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRS)
@@ -0,0 +1,395 @@
+import math
+import re
+from functools import lru_cache
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+__all__ = (
+    "A1Range",
+    "merge_ranges",
+    "column_to_letter",
+    "letter_to_column",
+    "split_sheet",
+    "parse_cell",
+    "parse_range",
+    "format_range",
+)
+
+_CELL_PATTERN = re.compile(r"^\$?([A-Za-z]+)\$?([0-9]*)$")
+_R1C1_PATTERN = re.compile(r"^R([0-9]+)C([0-9]+)$", re.IGNORECASE)
+# End of R1C1 range, whose row may be omitted for unbounded rows, e.g. 'C3' of 'R2C1:C3'.
+_R1C1_END_PATTERN = re.compile(r"^(?:R([0-9]*))?C([0-9]+)$", re.IGNORECASE)
+_PLAIN_SHEET_PATTERN = re.compile(r"^[A-Za-z0-9_]+$")
+
+#: Max number of columns in a sheet, i.e. column 'ZZZ'.
+MAX_COLUMNS: int = 18278
+
+
+@lru_cache(maxsize=MAX_COLUMNS)
+def column_to_letter(column: int) -> str:
+    """Convert 1-based column index to column letters. Results are cached, as it is called in write loops.
+
+    Args:
+        column (int): 1-based column index, e.g. 1 -> 'A', 27 -> 'AA'.
+
+    Returns:
+        str: Column letters.
+    """
+    if column < 1:
+        raise ValueError(f"Column index must be >= 1, but got {column}")
+
+    letters: str = ""
+    while column > 0:
+        column, rem = divmod(column - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+@lru_cache(maxsize=MAX_COLUMNS)
+def letter_to_column(letters: str) -> int:
+    """Convert column letters to 1-based column index.
+
+    Args:
+        letters (str): Column letters, e.g. 'A' -> 1, 'AA' -> 27.
+
+    Returns:
+        int: 1-based column index.
+    """
+    column: int = 0
+    for char in letters.upper():
+        if not "A" <= char <= "Z":
+            raise ValueError(f"Invalid column letters: {letters}")
+        column = column * 26 + (ord(char) - 64)
+    return column
+
+
+def split_sheet(range_name: str) -> Tuple[Optional[str], str]:
+    """Split sheet name from range.
+
+    Args:
+        range_name (str): Range of cells, e.g. 'Sheet1!A1:C3'.
+
+    Returns:
+        Tuple[Optional[str], str]: Sheet name (None if not specified) and range without sheet name.
+    """
+    if "!" not in range_name:
+        return None, range_name
+    sheet, cells = range_name.rsplit("!", 1)
+    return sheet, cells
+
+
+def parse_cell(cell: str) -> Tuple[int, int]:
+    """Parse a cell in A1 notation.
+
+    Args:
+        cell (str): Cell in A1 notation, e.g. 'B3'. If row is omitted, row 1 is used.
+
+    Returns:
+        Tuple[int, int]: 1-based (row, column).
+    """
+    match = _CELL_PATTERN.match(cell.strip())
+    if match is None:
+        raise ValueError(f"Invalid cell: {cell}")
+    letters, digits = match.groups()
+    row: int = int(digits) if digits else 1
+    return row, letter_to_column(letters)
+
+
+def parse_range(range_name: str) -> Tuple[Optional[str], int, int, Optional[int], int]:
+    """Parse a range in A1 notation.
+
+    Args:
+        range_name (str): Range of cells, e.g. 'Sheet1!A1:C3', 'A2:C' or 'B3'.
+
+    Returns:
+        Tuple[Optional[str], int, int, Optional[int], int]: Sheet name, 1-based top row, left column,
+            bottom row and right column. Bottom row is None if the range is unbounded, e.g. 'A2:C'.
+    """
+    sheet, cells = split_sheet(range_name)
+    start, _, end = cells.partition(":")
+    row, column = parse_cell(start)
+    if not end:
+        if start.strip().isalpha():
+            # Single column, e.g. 'A' means 'A:A'
+            return sheet, row, column, None, column
+        return sheet, row, column, row, column
+
+    match = _CELL_PATTERN.match(end.strip())
+    if match is None:
+        raise ValueError(f"Invalid range: {range_name}")
+    letters, digits = match.groups()
+    return sheet, row, column, int(digits) if digits else None, letter_to_column(letters)
+
+
+def format_range(
+    row: int,
+    column: int,
+    num_rows: int,
+    num_cols: int,
+    sheet: Optional[str] = None,
+) -> str:
+    """Format a rectangular range in A1 notation.
+
+    Args:
+        row (int): 1-based top row.
+        column (int): 1-based left column.
+        num_rows (int): The number of rows.
+        num_cols (int): The number of columns.
+        sheet (Optional[str]): Sheet name. Defaults to None.
+
+    Returns:
+        str: Range in A1 notation, e.g. 'Sheet1!A1:C3'.
+    """
+    start: str = f"{column_to_letter(column)}{row}"
+    end: str = f"{column_to_letter(column + max(num_cols, 1) - 1)}{row + max(num_rows, 1) - 1}"
+    cells: str = start if start == end else f"{start}:{end}"
+    return cells if sheet is None else f"{sheet}!{cells}"
+
+
+def _quote_sheet(sheet: str) -> str:
+    if _PLAIN_SHEET_PATTERN.match(sheet):
+        return sheet
+    return "'" + sheet.replace("'", "''") + "'"
+
+
+def _unquote_sheet(sheet: str) -> str:
+    if len(sheet) >= 2 and sheet[0] == sheet[-1] == "'":
+        return sheet[1:-1].replace("''", "'")
+    return sheet
+
+
+def _parse_r1c1(cells: str) -> Optional[Tuple[int, int, Optional[int], int]]:
+    start, _, end = cells.partition(":")
+    start_match = _R1C1_PATTERN.match(start.strip())
+    end_match = _R1C1_END_PATTERN.match(end.strip()) if end else start_match
+    if start_match is None or end_match is None:
+        return None
+    row, column = int(start_match.group(1)), int(start_match.group(2))
+    end_row: Optional[int] = int(end_match.group(1)) if end_match.group(1) else None
+    return row, column, end_row, int(end_match.group(2))
+
+
+class A1Range(NamedTuple):
+    """Rectangular range of cells. Rows and columns are 1-based and inclusive.
+
+    Examples:
+        >>> r = A1Range.parse("'My Sheet'!A1:C1000")
+        >>> [str(tile) for tile in r.split(max_rows=500)]
+        ["'My Sheet'!A1:C500", "'My Sheet'!A501:C1000"]
+        >>> str(A1Range.cell(2, 2).resize(3, 2))
+        'B2:C4'
+
+    Attributes:
+        row (int): Top row.
+        column (int): Left column.
+        end_row (Optional[int]): Bottom row. None if rows are unbounded, e.g. 'A2:C'.
+        end_column (int): Right column.
+        sheet (Optional[str]): Sheet name without quotes. Defaults to None.
+    """
+
+    row: int
+    column: int
+    end_row: Optional[int]
+    end_column: int
+    sheet: Optional[str] = None
+
+    @classmethod
+    def parse(cls, range_name: str) -> "A1Range":
+        """Parse a range in A1 or R1C1 notation.
+
+        Args:
+            range_name (str): Range of cells, e.g. 'Sheet1!A1:C3', 'A2:C', 'B3' or 'R1C1:R3C3'.
+
+        Returns:
+            A1Range: Range.
+        """
+        sheet, cells = split_sheet(range_name)
+        if sheet is not None:
+            sheet = _unquote_sheet(sheet)
+        r1c1 = _parse_r1c1(cells) if cells[:1] in ("R", "r") else None
+        if r1c1 is not None:
+            return cls(*r1c1, sheet)
+        _, row, column, end_row, end_column = parse_range(cells)
+        return cls(row, column, end_row, end_column, sheet)
+
+    @classmethod
+    def cell(cls, row: int, column: int, sheet: Optional[str] = None) -> "A1Range":
+        """Returns the range of a single cell."""
+        return cls(row, column, row, column, sheet)
+
+    @property
+    def num_rows(self) -> Optional[int]:
+        """Returns the number of rows. None if rows are unbounded."""
+        return None if self.end_row is None else self.end_row - self.row + 1
+
+    @property
+    def num_cols(self) -> int:
+        return self.end_column - self.column + 1
+
+    @property
+    def start(self) -> "A1Range":
+        """Returns the range of the top-left cell."""
+        return self._replace(end_row=self.row, end_column=self.column)
+
+    def offset(self, rows: int = 0, cols: int = 0) -> "A1Range":
+        """Returns the range moved by rows and columns.
+
+        Args:
+            rows (int): The number of rows to move down. Defaults to 0.
+            cols (int): The number of columns to move right. Defaults to 0.
+
+        Returns:
+            A1Range: Moved range.
+        """
+        if self.row + rows < 1 or self.column + cols < 1:
+            raise ValueError(f"Range {self} moved by ({rows}, {cols}) is out of the sheet")
+        end_row: Optional[int] = None if self.end_row is None else self.end_row + rows
+        return A1Range(self.row + rows, self.column + cols, end_row, self.end_column + cols, self.sheet)
+
+    def resize(self, num_rows: Optional[int], num_cols: int) -> "A1Range":
+        """Returns the range of the size from the same top-left cell.
+
+        Args:
+            num_rows (Optional[int]): The number of rows. If None, rows are unbounded.
+            num_cols (int): The number of columns.
+
+        Returns:
+            A1Range: Resized range.
+        """
+        end_row: Optional[int] = None if num_rows is None else self.row + max(num_rows, 1) - 1
+        return A1Range(self.row, self.column, end_row, self.column + max(num_cols, 1) - 1, self.sheet)
+
+    def split(self, max_rows: Optional[int] = None, max_cols: Optional[int] = None) -> Iterator["A1Range"]:
+        """Split the range into tiles in row-major order.
+
+        Args:
+            max_rows (Optional[int]): Max number of rows of a tile. If None, rows are not split. Defaults to None.
+            max_cols (Optional[int]): Max number of columns of a tile. If None, columns are not split.
+                Defaults to None.
+
+        Yields:
+            A1Range: Tile.
+        """
+        if self.end_row is None and max_rows is not None:
+            raise ValueError(f"Cannot split unbounded range {self} by rows")
+        row_step: int = max_rows or self.num_rows or 1
+        col_step: int = max_cols or self.num_cols
+        for row in range(self.row, (self.end_row or self.row) + 1, row_step):
+            end_row: Optional[int] = None if self.end_row is None else min(row + row_step - 1, self.end_row)
+            for column in range(self.column, self.end_column + 1, col_step):
+                yield A1Range(row, column, end_row, min(column + col_step - 1, self.end_column), self.sheet)
+
+    def contains(self, other: "A1Range") -> bool:
+        """Returns whether the range contains the other range on the same sheet."""
+        return (
+            self.sheet == other.sheet
+            and self.row <= other.row
+            and self.column <= other.column
+            and _bottom(other) <= _bottom(self)
+            and other.end_column <= self.end_column
+        )
+
+    def intersects(self, other: "A1Range") -> bool:
+        """Returns whether the range shares any cell with the other range on the same sheet."""
+        return (
+            self.sheet == other.sheet
+            and self.row <= _bottom(other)
+            and other.row <= _bottom(self)
+            and self.column <= other.end_column
+            and other.column <= self.end_column
+        )
+
+    def merge(self, other: "A1Range") -> "A1Range":
+        """Returns the range which covers both ranges.
+
+        Raises:
+            ValueError: When the union of ranges is not rectangular.
+        """
+        merged: List[A1Range] = merge_ranges([self, other])
+        if len(merged) != 1:
+            raise ValueError(f"Union of {self} and {other} is not a range")
+        return merged[0]
+
+    def to_a1(self) -> str:
+        """Format the range in A1 notation, e.g. 'Sheet1!A1:C3'."""
+        if self.end_row is None:
+            cells: str = f"{column_to_letter(self.column)}{self.row}:{column_to_letter(self.end_column)}"
+        else:
+            cells = format_range(self.row, self.column, self.end_row - self.row + 1, self.num_cols)
+        return cells if self.sheet is None else f"{_quote_sheet(self.sheet)}!{cells}"
+
+    def to_r1c1(self) -> str:
+        """Format the range in R1C1 notation, e.g. 'Sheet1!R1C1:R3C3'."""
+        end: str = f"C{self.end_column}" if self.end_row is None else f"R{self.end_row}C{self.end_column}"
+        cells: str = f"R{self.row}C{self.column}:{end}"
+        return cells if self.sheet is None else f"{_quote_sheet(self.sheet)}!{cells}"
+
+    def __str__(self) -> str:
+        return self.to_a1()
+
+
+def _bottom(r: A1Range) -> float:
+    return math.inf if r.end_row is None else r.end_row
+
+
+def _drop_contained(ranges: Iterable[A1Range]) -> List[A1Range]:
+    # NOTE: Taller and then wider ones come first, so a range can only be contained in one already kept.
+    kept: List[A1Range] = []
+    for r in sorted(set(ranges), key=lambda r: (r.row - _bottom(r), -r.num_cols)):
+        if not any(k.contains(r) for k in kept):
+            kept.append(r)
+    return kept
+
+
+def _merge_vertical(ranges: Iterable[A1Range]) -> List[A1Range]:
+    merged: List[A1Range] = []
+    for r in sorted(ranges, key=lambda r: (r.sheet or "", r.column, r.end_column, r.row)):
+        last: Optional[A1Range] = merged[-1] if merged else None
+        if (
+            last is not None
+            and (last.sheet, last.column, last.end_column) == (r.sheet, r.column, r.end_column)
+            and r.row <= _bottom(last) + 1
+        ):
+            end_row: Optional[int] = None if None in (last.end_row, r.end_row) else max(last.end_row, r.end_row)
+            merged[-1] = last._replace(end_row=end_row)
+        else:
+            merged.append(r)
+    return merged
+
+
+def _merge_horizontal(ranges: Iterable[A1Range]) -> List[A1Range]:
+    merged: List[A1Range] = []
+    for r in sorted(ranges, key=lambda r: (r.sheet or "", r.row, _bottom(r), r.column)):
+        last: Optional[A1Range] = merged[-1] if merged else None
+        if (
+            last is not None
+            and (last.sheet, last.row, last.end_row) == (r.sheet, r.row, r.end_row)
+            and r.column <= last.end_column + 1
+        ):
+            merged[-1] = last._replace(end_column=max(last.end_column, r.end_column))
+        else:
+            merged.append(r)
+    return merged
+
+
+def merge_ranges(ranges: Iterable[A1Range]) -> List[A1Range]:
+    """Merge overlapping or adjacent ranges which form a rectangle together, e.g. 'A1:B2' and 'A3:B5'.
+
+    Ranges contained in another are dropped, ranges stacked vertically with the same columns are merged,
+    and then ranges side by side with the same rows. These are repeated until nothing is merged,
+    so e.g. 'A1:A2', 'B1:B2' and 'A3:B3' result in 'A1:B3'.
+
+    Args:
+        ranges (Iterable[A1Range]): Ranges.
+
+    Returns:
+        List[A1Range]: Merged ranges, sorted by sheet, row and column.
+    """
+    result: List[A1Range] = list(ranges)
+    while True:
+        # NOTE: Every merge or drop reduces the number of ranges, so the same number means nothing changed.
+        merged: List[A1Range] = _merge_horizontal(_merge_vertical(_drop_contained(result)))
+        if len(merged) == len(result):
+            break
+        result = merged
+    merged.sort(key=lambda r: (r.sheet or "", r.row, r.column))
+    return merged
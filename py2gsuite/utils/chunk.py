@@ -0,0 +1,56 @@
+import json
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+__all__ = ("iter_chunks", "json_size")
+
+T = TypeVar("T")
+
+
+def json_size(obj: Any) -> int:
+    """Returns the size of object in bytes when it is serialized as JSON.
+
+    Args:
+        obj (Any): JSON serializable object.
+
+    Returns:
+        int: The number of bytes.
+    """
+    return len(json.dumps(obj).encode("utf-8"))
+
+
+def iter_chunks(
+    items: Iterable[T],
+    max_items: int,
+    max_bytes: Optional[int] = None,
+    size_fn: Callable[[T], int] = json_size,
+) -> Iterator[Tuple[List[T], int]]:
+    """Split items into size-bounded chunks lazily.
+
+    Items are pulled from the iterable one by one, so only one chunk is kept in memory at once.
+    A single item whose size exceeds `max_bytes` is yielded as a chunk by itself.
+
+    Args:
+        items (Iterable[T]): Items to be split.
+        max_items (int): Max number of items in a chunk.
+        max_bytes (Optional[int]): Max total size of items in a chunk. If None, chunks are bounded
+            only by `max_items`. Defaults to None.
+        size_fn (Callable[[T], int]): Function to compute the size of an item. Defaults to json_size.
+
+    Yields:
+        Tuple[List[T], int]: Chunk of items and its total size in bytes.
+    """
+    if max_items < 1:
+        raise ValueError(f"`max_items` must be >= 1, but got {max_items}")
+
+    chunk: List[T] = []
+    chunk_bytes: int = 0
+    for item in items:
+        item_bytes: int = size_fn(item)
+        if chunk and (len(chunk) >= max_items or (max_bytes is not None and chunk_bytes + item_bytes > max_bytes)):
+            yield chunk, chunk_bytes
+            chunk, chunk_bytes = [], 0
+        chunk.append(item)
+        chunk_bytes += item_bytes
+
+    if chunk:
+        yield chunk, chunk_bytes
@@ -1,34 +1,367 @@
+import datetime
+import hashlib
+import json
+import os
 import os.path as osp
 import sys
+import threading
+from typing import Any, Dict, Mapping, Optional, Tuple
 
+import google_auth_httplib2
+import httplib2
+from google.auth import credentials as auth_credentials
+from google.auth.exceptions import RefreshError, TransportError
+from google.oauth2 import service_account
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
 
 from .logger import get_logger
 from .types import CredentialType, ScopeType
 
+__all__ = (
+    "ApiKeyCredentials",
+    "CredentialProvider",
+    "ServiceAccountCredentials",
+    "SharedTokenStore",
+    "get_credential",
+    "get_credential_from_token",
+    "get_token_dir",
+    "set_token_dir",
+)
+
 logger = get_logger()
 
+# Directory to store tokens. If None, `$XDG_CACHE_HOME/py2gsuite` (or `~/.cache/py2gsuite`) is used.
+_token_dir: Optional[str] = os.environ.get("PY2GSUITE_TOKEN_DIR")
+
+_lock = threading.Lock()
+_providers: Dict[Tuple[str, Tuple[str, ...]], "CredentialProvider"] = {}
+
+
+def set_token_dir(token_dir: Optional[str]) -> None:
+    """Set directory to store cached tokens.
+
+    Args:
+        token_dir (Optional[str]): Path of directory. If None, the default user cache directory is used.
+    """
+    global _token_dir
+    _token_dir = token_dir
+
+
+def get_token_dir() -> str:
+    """Returns directory to store cached tokens.
+
+    Returns:
+        str: Path of directory.
+    """
+    if _token_dir is not None:
+        return _token_dir
+    cache_home: str = os.environ.get("XDG_CACHE_HOME") or osp.join(osp.expanduser("~"), ".cache")
+    return osp.join(cache_home, "py2gsuite")
+
+
+def _default_token_path(scope: ScopeType) -> str:
+    # NOTE: Shared by `get_credential()` and `get_credential_from_token()`, so that a cached token is found again.
+    return osp.join(get_token_dir(), f"token.{scope.name.lower()}.json")
+
+
+def _utcnow() -> datetime.datetime:
+    # NOTE: Credentials.expiry is naive datetime in UTC.
+    return datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+
+
+def _write_private(path: str, data: str) -> None:
+    os.makedirs(osp.dirname(osp.abspath(path)), mode=0o700, exist_ok=True)
+    tmp_path: str = f"{path}.{os.getpid()}.tmp"
+    fd: int = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class SharedTokenStore:
+    """Store of access tokens shared by processes on the same host.
+
+    A token is fetched by only one process at a time under a file lock, and others reuse it until it is about
+    to expire, so many workers started at once cause a single token exchange.
+
+    Attributes:
+        directory (str): Directory to store tokens.
+        margin (float): Seconds before expiry that a stored token is regarded as expired.
+    """
+
+    def __init__(self, directory: Optional[str] = None, margin: float = 300.0) -> None:
+        """
+        Args:
+            directory (Optional[str]): Directory to store tokens. Defaults to `get_token_dir()`.
+            margin (float): Seconds before expiry that a stored token is regarded as expired. Defaults to 300.
+        """
+        self.directory: str = directory if directory is not None else get_token_dir()
+        self.margin: float = margin
+
+    def refresh(self, key: str, creds: auth_credentials.Credentials, fetch: Any) -> None:
+        """Set a stored token to credentials, or fetch new one with `fetch()` and store it.
+
+        Args:
+            key (str): Key of the token.
+            creds (auth_credentials.Credentials): Credentials to set the token to.
+            fetch (Any): Function to fetch new token into `creds`.
+        """
+        path: str = osp.join(self.directory, f"{key}.json")
+        os.makedirs(self.directory, mode=0o700, exist_ok=True)
+        with open(f"{path}.lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if osp.exists(path):
+                    with open(path, "r") as f:
+                        stored: Dict[str, str] = json.load(f)
+                    expiry = datetime.datetime.fromisoformat(stored["expiry"])
+                    if (expiry - _utcnow()).total_seconds() > self.margin:
+                        creds.token, creds.expiry = stored["token"], expiry
+                        return
+
+                fetch()
+                _write_private(path, json.dumps({"token": creds.token, "expiry": creds.expiry.isoformat()}))
+                logger.info("Fetched new token, expires at %s", creds.expiry)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+class ServiceAccountCredentials(service_account.Credentials):
+    """Service account credentials whose tokens are shared by processes via `SharedTokenStore`."""
+
+    _store: Optional[SharedTokenStore] = None
+
+    def with_store(self, store: SharedTokenStore) -> "ServiceAccountCredentials":
+        """Set the token store.
+
+        Args:
+            store (SharedTokenStore): Token store.
+
+        Returns:
+            ServiceAccountCredentials: self.
+        """
+        self._store = store
+        return self
+
+    @property
+    def _store_key(self) -> str:
+        # NOTE: Derived on each use, since copies made by `with_subject()` or `with_scopes()` change the identity.
+        identity: str = f"{self.service_account_email}:{self._subject}:{' '.join(sorted(self._scopes or []))}"
+        return f"sa.{hashlib.sha256(identity.encode()).hexdigest()[:16]}"
+
+    def _make_copy(self) -> "ServiceAccountCredentials":
+        cred: ServiceAccountCredentials = super()._make_copy()
+        cred._store = self._store
+        return cred
+
+    def refresh(self, request: Any) -> None:
+        if self._store is None:
+            super().refresh(request)
+            return
+        self._store.refresh(self._store_key, self, lambda: super(ServiceAccountCredentials, self).refresh(request))
+
+
+class ApiKeyCredentials(auth_credentials.Credentials):
+    """Credentials which send an API key instead of an access token. Only public files can be read.
+
+    Attributes:
+        api_key (str): The API key.
+    """
+
+    def __init__(self, api_key: str) -> None:
+        super().__init__()
+        self.api_key: str = api_key
+
+    @property
+    def expired(self) -> bool:
+        return False
+
+    @property
+    def valid(self) -> bool:
+        return True
+
+    def refresh(self, request: Any) -> None:
+        pass
+
+    def apply(self, headers: Mapping[str, str], token: Optional[str] = None) -> None:
+        headers["x-goog-api-key"] = self.api_key
+
+
+def _read_api_key(credential_file: str) -> str:
+    with open(credential_file, "r") as f:
+        content: str = f.read().strip()
+    if content.startswith("{"):
+        data: Dict[str, str] = json.loads(content)
+        return data.get("api_key") or data["key"]
+    return content
+
+
+class CredentialProvider:
+    """Provider of OAuth2.0 credentials, cached in memory and on disk and refreshed in background.
+
+    The same Credentials instance is returned on every call, so API instances built with it share the token.
+    Tokens are refreshed in place, so refreshed token is used by all of them without rebuilding.
+
+    Attributes:
+        credential_file (str): The json file of client secrets.
+        scope (ScopeType): The type of scope.
+        token_path (Optional[str]): The json file of cached token. If None, token is cached only in memory.
+        refresh_margin (float): Seconds before expiry to refresh the token in background.
+    """
+
+    def __init__(
+        self,
+        credential_file: str,
+        scope: ScopeType = ScopeType.DRIVE,
+        token_path: Optional[str] = None,
+        host: str = "localhost",
+        port: int = 8080,
+        refresh_margin: float = 300.0,
+    ) -> None:
+        """
+        Args:
+            credential_file (str): The json file of client secrets.
+            scope (ScopeType): The type of scope. Defaults to ScopeType.DRIVE.
+            token_path (Optional[str]): The json file of cached token. If None, token is cached only in memory.
+                Defaults to None.
+            host (str): Host of local server for the authorization flow. Defaults to "localhost".
+            port (int): Port of local server for the authorization flow. Defaults to 8080.
+            refresh_margin (float): Seconds before expiry to refresh the token in background. Defaults to 300.
+        """
+        self.credential_file: str = credential_file
+        self.scope: ScopeType = scope
+        self.token_path: Optional[str] = token_path
+        self.host: str = host
+        self.port: int = port
+        self.refresh_margin: float = refresh_margin
+        self._creds: Optional[Credentials] = None
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def get(self) -> Credentials:
+        """Returns credentials. The authorization flow runs only if no valid or refreshable token is cached.
+
+        Returns:
+            Credentials: Credential instance.
+        """
+        with self._lock:
+            if self._creds is None and self.token_path is not None and osp.exists(self.token_path):
+                self._creds = Credentials.from_authorized_user_file(self.token_path, scopes=self.scope.value)
+
+            if self._creds is not None and not self._creds.valid and self._creds.refresh_token:
+                try:
+                    self.refresh()
+                except RefreshError as err:
+                    logger.warning("Failed to refresh cached token, authorizing again: %s", err)
+                    self._creds = None
+
+            if self._creds is None or not (self._creds.valid or self._creds.refresh_token):
+                # NOTE: oauthlib takes long to import and is needed only for the interactive flow.
+                from google_auth_oauthlib.flow import InstalledAppFlow
+
+                flow: InstalledAppFlow = InstalledAppFlow.from_client_secrets_file(
+                    self.credential_file,
+                    self.scope.value,
+                )
+                self._creds = flow.run_local_server(host=self.host, port=self.port)
+                self.save()
+            return self._creds
+
+    def refresh(self) -> None:
+        """Refresh the token in place and save it."""
+        with self._lock:
+            if self._creds is None:
+                return
+            self._creds.refresh(google_auth_httplib2.Request(httplib2.Http()))
+            logger.info("Refreshed token, expires at %s", self._creds.expiry)
+            self.save()
+
+    def save(self) -> None:
+        """Save the token to `token_path` with permission only for the owner."""
+        if self.token_path is None or self._creds is None:
+            return
+        _write_private(self.token_path, self._creds.to_json())
+
+    def seconds_until_refresh(self) -> Optional[float]:
+        """Returns seconds until the token should be refreshed. If the token does not expire, returns None."""
+        expiry: Optional[datetime.datetime] = None if self._creds is None else self._creds.expiry
+        if expiry is None:
+            return None
+        return max(0.0, (expiry - _utcnow()).total_seconds() - self.refresh_margin)
+
+    def start_refresh(self, retry_interval: float = 30.0) -> None:
+        """Start a daemon thread that refreshes the token `refresh_margin` seconds before it expires,
+        so that requests never wait for a synchronous refresh.
+
+        Args:
+            retry_interval (float): Seconds to wait before retrying a failed refresh. Defaults to 30.
+        """
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self.__refresh_loop, args=(retry_interval,), name="py2gsuite-token-refresh", daemon=True
+            )
+            self._thread.start()
+
+    def stop_refresh(self) -> None:
+        """Stop the background refresh."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __refresh_loop(self, retry_interval: float) -> None:
+        while not self._stop.is_set():
+            wait: Optional[float] = self.seconds_until_refresh()
+            if wait is None:
+                return
+            if self._stop.wait(wait):
+                return
+            try:
+                self.refresh()
+            except (RefreshError, TransportError, OSError) as err:
+                logger.error("Failed to refresh token in background: %s", err)
+                self._stop.wait(retry_interval)
+
 
 def get_credential(
     credential_file: str,
     credential_type: CredentialType = CredentialType.OAUTH,
     scope: ScopeType = ScopeType.DRIVE,
     **kwargs,
-) -> Credentials:
+) -> auth_credentials.Credentials:
     """[summary]
     Returns Credentials instance.
+    OAuth credentials are reused in memory for the same credential file and scope, so the authorization flow runs
+    once per process (or once per token if `cache_token` is True).
 
     Args:
-        credential_file (str): The json file of credential.
-        credential_type (CredentialType): The type of Credential.
-            For Sheets/SlidesAPI only allows OAuth2.0 or API Keys. Defaults to CredentialType.OAUTH.
+        credential_file (str): The json file of credential. For API keys, a file of the key itself or
+            JSON with 'api_key'.
+        credential_type (CredentialType): The type of Credential. Defaults to CredentialType.OAUTH.
         scope (ScopeType): The type of scope. Defaults to ScopeType.DRIVE.
 
     **kwargs:
         host (str): Defaults to "localhost".
         port (int): Defaults to 8080.
-        cache_token (bool): Defaults to False.
+        cache_token (bool): Whether to cache token on disk. Defaults to False.
+        token_path (str): The json file of cached token. Defaults to `token.<scope>.json` in `get_token_dir()`,
+            which `get_credential_from_token()` reads by default.
+        background_refresh (bool): Whether to refresh token in background before it expires. Defaults to False.
+        subject (str): Email of user to impersonate with domain-wide delegation of service account.
+            Defaults to None.
+        token_store (SharedTokenStore): Store of service account tokens shared by processes.
+            Defaults to a store in `get_token_dir()`.
 
     Returns:
         creds (Credentials): Credential instance.
@@ -39,58 +372,66 @@ def get_credential(
     if not osp.exists(credential_file):
         raise FileNotFoundError(f"Cannot find {credential_file}")
 
-    host: str = kwargs.get("host", "localhost")
-    port: int = kwargs.get("port", 8080)
-    cache_token: bool = kwargs.get("cache_token", False)
+    if credential_type == CredentialType.API_KEYS:
+        return ApiKeyCredentials(_read_api_key(credential_file))
+    elif credential_type == CredentialType.SERVICE_ACCOUNT:
+        sa_creds: ServiceAccountCredentials = ServiceAccountCredentials.from_service_account_file(
+            credential_file, scopes=scope.value, subject=kwargs.get("subject")
+        )
+        return sa_creds.with_store(kwargs.get("token_store") or SharedTokenStore())
+    elif credential_type != CredentialType.OAUTH:
+        raise TypeError(f"`credential_type` must be an element of py2gsuite.Type, but got {credential_type}")
 
-    creds: Credentials
-    try:
-        if credential_type == CredentialType.API_KEYS:
-            # TODO
-            raise NotImplementedError("Only support CredentialType.OAUTH")
-        elif credential_type == CredentialType.OAUTH:
-            flow: InstalledAppFlow = InstalledAppFlow.from_client_secrets_file(
+    token_path: Optional[str] = None
+    if kwargs.get("cache_token", False):
+        token_path = kwargs.get("token_path") or _default_token_path(scope)
+
+    key: Tuple[str, Tuple[str, ...]] = (osp.abspath(credential_file), tuple(scope.value))
+    with _lock:
+        provider: Optional[CredentialProvider] = _providers.get(key)
+        if provider is None or (token_path is not None and provider.token_path != token_path):
+            provider = CredentialProvider(
                 credential_file,
-                scope.value,
+                scope,
+                token_path=token_path,
+                host=kwargs.get("host", "localhost"),
+                port=kwargs.get("port", 8080),
             )
-            creds: Credentials = flow.run_local_server(host=host, port=port)
-        elif credential_type == CredentialType.SERVICE_ACCOUNT:
-            raise ValueError("Only support OAuth2.0 or API keys")
-        else:
-            raise TypeError(f"`credential_type` must be an element of py2gsuite.Type, but got {credential_type}")
+            _providers[key] = provider
+
+    try:
+        creds: Credentials = provider.get()
     except OSError as err:
         logger.error(err)
         sys.exit(1)
 
-    if cache_token:
-        logger.warn("Important personal info is included in the token.json. Please keep it safe.")
-        with open(osp.join(osp.dirname(__file__), "token.json"), "w") as token:
-            token.write(creds.to_json())
-
+    if kwargs.get("background_refresh", False):
+        provider.start_refresh()
     return creds
 
 
-def get_credential_from_token(scope: ScopeType):
+def get_credential_from_token(scope: ScopeType, token_path: Optional[str] = None) -> Credentials:
     """[summary]
-    Get Credentials instance from cached token.json.
+    Get Credentials instance from cached token.
 
     Args:
         scope (ScopeType): The ScopeType instance.
+        token_path (Optional[str]): The json file of cached token. Defaults to `token.<scope>.json`
+            in `get_token_dir()`, where `get_credential(..., cache_token=True)` saves it.
 
     Returns:
-        creds (Credentials): The Credentials instance loaded from token.json.
+        creds (Credentials): The Credentials instance loaded from the token file.
 
     Raises:
-        FileNotFoundError: When there is no token.json.
+        FileNotFoundError: When there is no token file.
     """
-    if not osp.exists(osp.basename(__file__), "token.json"):
-        raise FileNotFoundError("Cannot find token.json")
+    if token_path is None:
+        token_path = _default_token_path(scope)
+    if not osp.exists(token_path):
+        raise FileNotFoundError(f"Cannot find {token_path}")
 
     try:
-        creds: Credentials = Credentials.from_authorized_user_file(
-            "token.json",
-            scopes=scope,
-        )
+        creds: Credentials = Credentials.from_authorized_user_file(token_path, scopes=scope.value)
     except OSError as err:
         logger.error(err)
         sys.exit(1)
@@ -0,0 +1,144 @@
+import json
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from .format import class2dict
+
+__all__ = ("flatten_record", "RecordFlattener")
+
+# Types of values which are written to a cell as they are.
+_CELL_TYPES = (str, int, float, bool)
+
+
+def _cell(value: Any) -> Any:
+    if value is None or isinstance(value, _CELL_TYPES):
+        return "" if value is None else value
+    if isinstance(value, list):
+        return json.dumps(value, default=str, ensure_ascii=False)
+    return str(value)
+
+
+def flatten_record(record: Any, sep: str = ".") -> Dict[str, Any]:
+    """Flatten a record into a dict of cell values keyed by dotted names of nested keys.
+
+    Objects are converted by `class2dict()`. Lists are written as JSON text, and None and empty dicts as empty cells.
+
+    Args:
+        record (Any): Dict or object.
+        sep (str): Separator of nested keys. Defaults to '.'.
+
+    Returns:
+        Dict[str, Any]: Flat record, e.g. {'user.name': 'Bob', 'user.age': 50}.
+
+    Raises:
+        TypeError: When the record is not converted to a dict.
+    """
+    data: Any = class2dict(record)
+    if not isinstance(data, dict):
+        raise TypeError(f"Record must be a dict or an object with attributes, but got {type(record).__name__}")
+
+    flat: Dict[str, Any] = {}
+    # NOTE: A stack of iterators keeps keys in the order of the record without recursion.
+    stack: List[Any] = [("", iter(data.items()))]
+    while stack:
+        prefix, items = stack[-1]
+        for key, value in items:
+            if isinstance(value, dict):
+                if value:
+                    stack.append((f"{prefix}{key}{sep}", iter(value.items())))
+                    break
+                value = None
+            flat[f"{prefix}{key}"] = _cell(value)
+        else:
+            stack.pop()
+    return flat
+
+
+class RecordFlattener:
+    """Flatten a stream of records into rows of a stable column schema.
+
+    Columns are inferred from the first `sample` records in order of appearance. Keys which appear later are
+    appended as new columns, so rows written earlier keep their column positions. Only the sample is held in
+    memory, so records can be a generator of any length.
+
+    Examples:
+        >>> flattener = RecordFlattener(sample=1)
+        >>> list(flattener.rows([{"a": 1, "b": {"c": 2}}, {"a": 3, "d": 4}], header=True))
+        [['a', 'b.c'], [1, 2], [3, '', 4]]
+        >>> flattener.columns
+        ['a', 'b.c', 'd']
+
+    Attributes:
+        columns (List[str]): Column names.
+        header (Optional[List[str]]): Header row yielded by `rows()`, which may be shorter than `columns`.
+    """
+
+    def __init__(
+        self,
+        columns: Optional[Sequence[str]] = None,
+        sample: int = 100,
+        sep: str = ".",
+        extend: bool = True,
+        missing: Any = "",
+    ) -> None:
+        """
+        Args:
+            columns (Optional[Sequence[str]]): Column names. If None, inferred from records. Defaults to None.
+            sample (int): The number of records to infer columns from. Defaults to 100.
+            sep (str): Separator of nested keys. Defaults to '.'.
+            extend (bool): Whether to append keys not in columns as new columns. If False, they are dropped.
+                Defaults to True.
+            missing (Any): Value of cells whose key is not in the record. Defaults to ''.
+        """
+        self.columns: List[str] = []
+        self.header: Optional[List[str]] = None
+        self.sample: int = sample if columns is None else 0
+        self.sep: str = sep
+        self.extend: bool = extend
+        self.missing: Any = missing
+        self._index: Dict[str, int] = {}
+        self._add(columns or ())
+
+    def _add(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            if key not in self._index:
+                self._index[key] = len(self.columns)
+                self.columns.append(key)
+
+    def row(self, flat: Dict[str, Any]) -> List[Any]:
+        """Returns a row of the flat record in order of columns.
+
+        Args:
+            flat (Dict[str, Any]): Record flattened by `flatten_record()`.
+
+        Returns:
+            List[Any]: Row of cell values.
+        """
+        if self.extend and not flat.keys() <= self._index.keys():
+            self._add(flat)
+        missing: Any = self.missing
+        return [flat.get(column, missing) for column in self.columns]
+
+    def rows(self, records: Iterable[Any], header: bool = False) -> Iterator[List[Any]]:
+        """Yields rows of records.
+
+        Args:
+            records (Iterable[Any]): Dicts or objects.
+            header (bool): Whether to yield column names as the first row. Defaults to False.
+
+        Yields:
+            List[Any]: Row of cell values.
+        """
+        records = iter(records)
+        sampled: List[Dict[str, Any]] = [flatten_record(record, self.sep) for record in islice(records, self.sample)]
+        for flat in sampled:
+            self._add(flat)
+
+        if header:
+            self.header = list(self.columns)
+            yield self.header
+        for flat in sampled:
+            yield self.row(flat)
+        del sampled
+        for record in records:
+            yield self.row(flatten_record(record, self.sep))
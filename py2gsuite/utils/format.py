@@ -1,6 +1,7 @@
+import dataclasses
 import pprint
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 
 def class2str(
@@ -24,44 +25,146 @@ def class2str(
     return dict2str(class2dict(obj, abbreviation), format=format)
 
 
+# Kinds of objects, which decide how class2dict converts them.
+_SCALAR, _ENUM, _AST, _DICT, _NAMEDTUPLE, _ITERABLE, _DATACLASS, _OBJECT, _SLOTS = range(9)
+
+# Kinds keyed by type, filled on the first object of each type.
+_kinds: Dict[type, int] = {str: _SCALAR, int: _SCALAR, float: _SCALAR, bool: _SCALAR, type(None): _SCALAR}
+
+# Names of slots keyed by type.
+_slots: Dict[type, Tuple[str, ...]] = {}
+
+_MISSING = object()
+
+
+def _kind(obj: object) -> int:
+    cls: type = type(obj)
+    kind: Optional[int] = _kinds.get(cls)
+    if kind is not None:
+        return kind
+
+    if isinstance(obj, dict):
+        kind = _DICT
+    elif isinstance(obj, Enum):
+        kind = _ENUM
+    elif hasattr(obj, "_ast"):
+        kind = _AST
+    elif isinstance(obj, tuple) and hasattr(cls, "_fields"):
+        kind = _NAMEDTUPLE
+    elif isinstance(obj, (str, bytes, bytearray)):
+        kind = _SCALAR
+    elif hasattr(obj, "__iter__"):
+        kind = _ITERABLE
+    elif dataclasses.is_dataclass(obj):
+        kind = _DATACLASS
+    elif hasattr(obj, "__dict__"):
+        kind = _OBJECT
+    elif hasattr(cls, "__slots__"):
+        kind = _SLOTS
+        names: List[str] = []
+        for base in reversed(cls.__mro__):
+            slots = base.__dict__.get("__slots__", ())
+            names.extend([slots] if isinstance(slots, str) else slots)
+        _slots[cls] = tuple(dict.fromkeys(n for n in names if n not in ("__dict__", "__weakref__")))
+    else:
+        kind = _SCALAR
+    _kinds[cls] = kind
+    return kind
+
+
+def _attributes(obj: object, kind: int) -> Iterable[Tuple[str, Any]]:
+    if kind == _OBJECT:
+        return obj.__dict__.items()
+    if kind == _NAMEDTUPLE:
+        return zip(type(obj)._fields, obj)
+    if kind == _DATACLASS:
+        names: Iterable[str] = (field.name for field in dataclasses.fields(obj))
+    else:
+        names = _slots[type(obj)]
+    return ((name, value) for name in names for value in [getattr(obj, name, _MISSING)] if value is not _MISSING)
+
+
 def class2dict(
     obj: object,
     abbreviation: Optional[int] = None,
     class_key: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """[summary]
+    """Convert class object to dict, recursively converting attributes, dicts and iterables.
+
+    Objects are traversed with an explicit stack, so deep graphs do not hit the recursion limit.
+    Public attributes of `__dict__`, `__slots__`, dataclasses and namedtuples are converted.
+    An object which refers to its ancestor is replaced with '<cycle: ClassName>'.
 
     Args:
         obj (object): Class object which you want to convert to dict.
         abbreviation (Optional[int]): If len(list_object) > abbreviation, abbreviate the result. Defaults to None.
         class_key (Optional[str]): Class key for dict. Defaults to None.
     """
-    if isinstance(obj, dict):
-        data: Dict[str, Any] = {}
-        for key, item in obj.items():
-            data[key] = class2dict(item, abbreviation, class_key)
-        return data
-    elif isinstance(obj, Enum):
-        return str(obj)
-    elif hasattr(obj, "_ast"):
-        return class2dict(obj._ast(), abbreviation)
-    elif hasattr(obj, "__iter__") and not isinstance(obj, str):
-        if abbreviation and len(obj) > abbreviation:
-            return f" --- length of element {len(object)} ---,"
-        return [class2dict(elem, abbreviation, class_key) for elem in obj]
-    elif hasattr(obj, "__dict__"):
-        data: Dict[str, Any] = dict(
-            [
-                (key, class2dict(item, abbreviation, class_key))
-                for key, item in obj.__dict__.items()
-                if not callable(item) and not key.startswith("_")
-            ]
-        )
-        if class_key is not None and hasattr(obj, "__class__"):
-            data[class_key] = obj.__class__.__name__
-        return data
-    else:
-        return obj
+    root: List[Any] = [None]
+    # Frames of (object, container of the result, key in the container). A frame with _MISSING object is pushed
+    # below children of a node and removes the node, whose ID is the key, from ancestors.
+    stack: List[Tuple[Any, Any, Any]] = [(obj, root, 0)]
+    ancestors: Set[int] = set()
+    # NOTE: Hot names are bound to locals, as this loop runs once per node.
+    push = stack.append
+    pop = stack.pop
+    kind_of = _kinds.get
+    while stack:
+        value, target, key = pop()
+        if value is _MISSING:
+            ancestors.discard(key)
+            continue
+
+        kind: Optional[int] = kind_of(type(value))
+        if kind is None:
+            kind = _kind(value)
+        if kind == _SCALAR:
+            target[key] = value
+            continue
+        if kind == _ENUM:
+            target[key] = str(value)
+            continue
+        if kind == _AST:
+            push((value._ast(), target, key))
+            continue
+        node: int = id(value)
+        if node in ancestors:
+            target[key] = f"<cycle: {type(value).__name__}>"
+            continue
+
+        # NOTE: Results are shallow copies at first, and non-scalar children are replaced when they are popped.
+        result: Any
+        depth: int = len(stack)
+        push((_MISSING, None, node))
+        if kind == _ITERABLE:
+            # NOTE: Iterators such as generators are consumed only once here, as their length is unknown.
+            result = list(value)
+            if abbreviation and len(result) > abbreviation:
+                pop()
+                target[key] = f" --- length of element {len(result)} ---,"
+                continue
+            for i, child in enumerate(result):
+                if kind_of(type(child)) != _SCALAR:
+                    push((child, result, i))
+        elif kind == _DICT:
+            result = dict(value)
+            for child_key, child in result.items():
+                if kind_of(type(child)) != _SCALAR:
+                    push((child, result, child_key))
+        else:
+            result = {k: v for k, v in _attributes(value, kind) if k[:1] != "_" and not callable(v)}
+            for child_key, child in result.items():
+                if kind_of(type(child)) != _SCALAR:
+                    push((child, result, child_key))
+            if class_key is not None:
+                result[class_key] = type(value).__name__
+
+        target[key] = result
+        if len(stack) == depth + 1:
+            pop()  # no child refers back, so the closing frame is not needed
+        else:
+            ancestors.add(node)
+    return root[0]
 
 
 def dict2str(dict_obj: Dict[str, Any], format: bool = False) -> str:
@@ -75,6 +178,8 @@ def dict2str(dict_obj: Dict[str, Any], format: bool = False) -> str:
     Returns:
         str_ (str)
     """
+    # NOTE: pprint is kept on purpose. This is for human-readable output, and its sorted keys and line wrapping
+    # are the format of `class2str()`. Converting objects for upload uses `class2dict()`, which does not print.
     str_: str = pprint.pformat(
         dict_obj,
         indent=1,
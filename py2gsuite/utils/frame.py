@@ -0,0 +1,140 @@
+from typing import Any, Iterator, List, Optional, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+__all__ = ("array_to_rows", "dataframe_to_rows")
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Inferred types of object array which can be sent as is.
+_TYPED_INFERENCES = frozenset({"string", "integer", "floating", "boolean", "mixed-integer-float", "empty"})
+
+
+def _require(module: Any, name: str) -> None:
+    if module is None:
+        raise ImportError(f"{name} is required. Please install with `pip install py2gsuite[pandas]`")
+
+
+def _array_to_list(values: "np.ndarray") -> List[Any]:
+    """Convert 1-D array to list of JSON serializable cell values without per-cell str().
+    Numbers are kept as numbers, dates are formatted as text and NaN/NaT/None are converted to empty.
+
+    Args:
+        values (np.ndarray): 1-D array.
+
+    Returns:
+        List[Any]: Cell values.
+    """
+    kind: str = values.dtype.kind
+    if kind in "iub":
+        return values.tolist()
+    if kind == "f":
+        invalid = ~np.isfinite(values)
+        if not invalid.any():
+            return values.tolist()
+        out = values.astype(object)
+        out[invalid] = ""
+        return out.tolist()
+    if kind == "M":
+        out = np.char.replace(np.datetime_as_string(values, unit="s"), "T", " ").astype(object)
+        out[np.isnat(values)] = ""
+        return out.tolist()
+    if kind == "m":
+        out = values.astype(str).astype(object)
+        out[np.isnat(values)] = ""
+        return out.tolist()
+    if kind in "US":
+        return values.astype(str).tolist()
+
+    # Object array: keep str and numbers as is, and convert others to str at once.
+    out = values.astype(object)
+    missing = pd.isna(out) if pd is not None else out == None  # noqa: E711
+    if pd is not None:
+        typed: bool = pd.api.types.infer_dtype(out, skipna=True) in _TYPED_INFERENCES
+    else:
+        typed = np.frompyfunc(lambda v: v is None or isinstance(v, (str, int, float)), 1, 1)(out).all()
+    if not typed:
+        out[~missing] = out[~missing].astype(str)
+    out[missing] = ""
+    return out.tolist()
+
+
+def _series_to_list(series: "pd.Series") -> List[Any]:
+    if isinstance(series.dtype, pd.DatetimeTZDtype) or pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return series.dt.strftime(DATETIME_FORMAT).fillna("").tolist()
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return _array_to_list(series.astype(object).to_numpy())
+    if pd.api.types.is_extension_array_dtype(series.dtype):
+        return _array_to_list(series.to_numpy(dtype=object, na_value=None))
+    return _array_to_list(series.to_numpy())
+
+
+def array_to_rows(
+    array: "np.ndarray",
+    header: Optional[Sequence[str]] = None,
+    block_rows: int = 10000,
+) -> Iterator[List[Any]]:
+    """Convert 2-D array to rows of cell values lazily.
+    Columns are converted in vectorized form block by block, so only a block is kept as lists at once.
+
+    Args:
+        array (np.ndarray): 2-D array, in shape (rows, cols). 1-D array is treated as a column.
+        header (Optional[Sequence[str]]): Header row. Defaults to None.
+        block_rows (int): The number of rows converted at once. Defaults to 10000.
+
+    Yields:
+        List[Any]: Row of cell values.
+    """
+    _require(np, "numpy")
+    array = np.asarray(array)
+    if array.ndim == 1:
+        array = array[:, None]
+    if array.ndim != 2:
+        raise ValueError(f"Expected 1-D or 2-D array, but got {array.ndim}-D")
+
+    if header is not None:
+        yield list(header)
+
+    for start in range(0, array.shape[0], block_rows):
+        block = array[start : start + block_rows]
+        columns = [_array_to_list(block[:, j]) for j in range(block.shape[1])]
+        yield from map(list, zip(*columns))
+
+
+def dataframe_to_rows(
+    df: "pd.DataFrame",
+    header: bool = True,
+    index: bool = False,
+    block_rows: int = 10000,
+) -> Iterator[List[Any]]:
+    """Convert DataFrame to rows of cell values lazily.
+    Columns are converted in vectorized form block by block, so only a block is kept as lists at once.
+
+    Args:
+        df (pd.DataFrame): DataFrame.
+        header (bool): Whether to yield column names as the first row. Defaults to True.
+        index (bool): Whether to include index as the first column. Defaults to False.
+        block_rows (int): The number of rows converted at once. Defaults to 10000.
+
+    Yields:
+        List[Any]: Row of cell values.
+    """
+    _require(pd, "pandas")
+    if index:
+        df = df.reset_index()
+
+    if header:
+        yield [str(c) for c in df.columns]
+
+    for start in range(0, len(df), block_rows):
+        block = df.iloc[start : start + block_rows]
+        columns = [_series_to_list(block.iloc[:, j]) for j in range(block.shape[1])]
+        yield from map(list, zip(*columns))
@@ -0,0 +1,239 @@
+import math
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+__all__ = ("Box", "element_box", "grid_layout", "flow_layout", "pack_layout", "layout", "EMU_PER_PT", "PAGE_SIZE")
+
+EMU_PER_PT: int = 12700
+
+#: Default page size of Google Slides (16:9) in EMU, as (width, height).
+PAGE_SIZE: Tuple[int, int] = (9144000, 5143500)
+
+#: Default margin and gap in EMU (0.25 inch).
+SPACING: int = 228600
+
+
+class Box(NamedTuple):
+    """Rectangle on a page in EMU.
+
+    Attributes:
+        x (int): Left.
+        y (int): Top.
+        width (int): Width.
+        height (int): Height.
+    """
+
+    x: int
+    y: int
+    width: int
+    height: int
+
+    @property
+    def right(self) -> int:
+        return self.x + self.width
+
+    @property
+    def bottom(self) -> int:
+        return self.y + self.height
+
+    def overlaps(self, other: "Box") -> bool:
+        return self.x < other.right and other.x < self.right and self.y < other.bottom and other.y < self.bottom
+
+
+def _emu(dimension: Optional[Dict[str, Any]]) -> float:
+    if not dimension:
+        return 0.0
+    magnitude: float = dimension.get("magnitude", 0.0)
+    return magnitude * EMU_PER_PT if dimension.get("unit") == "PT" else magnitude
+
+
+def element_box(size: Optional[Dict[str, Any]], transform: Optional[Dict[str, Any]]) -> Optional[Box]:
+    """Returns the bounding box of a page element from its size and transform.
+
+    Args:
+        size (Optional[Dict[str, Any]]): Size of the element.
+        transform (Optional[Dict[str, Any]]): Affine transform of the element. Shear is ignored.
+
+    Returns:
+        Optional[Box]: Bounding box. If the element has no size, e.g. a group, returns None.
+    """
+    if not size:
+        return None
+    transform = transform or {}
+    scale: float = EMU_PER_PT if transform.get("unit") == "PT" else 1
+    width: float = _emu(size.get("width")) * abs(transform.get("scaleX", 1))
+    height: float = _emu(size.get("height")) * abs(transform.get("scaleY", 1))
+    x: float = transform.get("translateX", 0) * scale
+    y: float = transform.get("translateY", 0) * scale
+    return Box(int(x), int(y), int(math.ceil(width)), int(math.ceil(height)))
+
+
+def _fits(box: Box, page: Box, boxes: Iterable[Box]) -> bool:
+    if box.x < page.x or box.y < page.y or box.right > page.right or box.bottom > page.bottom:
+        return False
+    return not any(box.overlaps(other) for other in boxes)
+
+
+def _area(page_size: Tuple[int, int], margin: int) -> Box:
+    return Box(margin, margin, page_size[0] - 2 * margin, page_size[1] - 2 * margin)
+
+
+def grid_layout(
+    count: int,
+    page_size: Tuple[int, int] = PAGE_SIZE,
+    occupied: Sequence[Box] = (),
+    cols: Optional[int] = None,
+    margin: int = SPACING,
+    gap: int = SPACING,
+) -> List[Box]:
+    """Split the page into a grid of equal cells, skipping cells that overlap occupied boxes.
+
+    Args:
+        count (int): The number of elements.
+        page_size (Tuple[int, int]): Page size in EMU. Defaults to 16:9 slide.
+        occupied (Sequence[Box]): Boxes of existing elements. Defaults to ().
+        cols (Optional[int]): The number of columns. If None, as square as possible. Defaults to None.
+        margin (int): Margin of the page in EMU. Defaults to 0.25 inch.
+        gap (int): Gap between cells in EMU. Defaults to 0.25 inch.
+
+    Returns:
+        List[Box]: Cells in row-major order, one for each element. Empty if `count` is 0.
+
+    Raises:
+        ValueError: When cells become too small to place elements.
+    """
+    if count <= 0:
+        return []
+    area: Box = _area(page_size, margin)
+    cells: int = count
+    while True:
+        num_cols: int = cols if cols is not None else math.ceil(math.sqrt(cells))
+        num_rows: int = math.ceil(cells / num_cols)
+        width: int = (area.width - (num_cols - 1) * gap) // num_cols
+        height: int = (area.height - (num_rows - 1) * gap) // num_rows
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Cannot place {count} elements in grid")
+
+        boxes: List[Box] = []
+        for i in range(num_rows * num_cols):
+            row, col = divmod(i, num_cols)
+            box = Box(area.x + col * (width + gap), area.y + row * (height + gap), width, height)
+            if not any(box.overlaps(other) for other in occupied):
+                boxes.append(box)
+            if len(boxes) == count:
+                return boxes
+        cells += count - len(boxes)
+
+
+def flow_layout(
+    sizes: Sequence[Tuple[int, int]],
+    page_size: Tuple[int, int] = PAGE_SIZE,
+    occupied: Sequence[Box] = (),
+    margin: int = SPACING,
+    gap: int = SPACING,
+) -> List[Box]:
+    """Place elements from left to right, wrapping into rows like text, and skipping occupied boxes.
+
+    Args:
+        sizes (Sequence[Tuple[int, int]]): (width, height) of elements in EMU.
+        page_size (Tuple[int, int]): Page size in EMU. Defaults to 16:9 slide.
+        occupied (Sequence[Box]): Boxes of existing elements. Defaults to ().
+        margin (int): Margin of the page in EMU. Defaults to 0.25 inch.
+        gap (int): Gap between elements in EMU. Defaults to 0.25 inch.
+
+    Returns:
+        List[Box]: Boxes of elements.
+
+    Raises:
+        ValueError: When elements overflow the page.
+    """
+    area: Box = _area(page_size, margin)
+    boxes: List[Box] = []
+    x, y, row_bottom = area.x, area.y, area.y
+    for width, height in sizes:
+        while True:
+            if x + width > area.right and x > area.x:
+                x, y = area.x, row_bottom + gap
+            box = Box(x, y, width, height)
+            if box.bottom > area.bottom or box.right > area.right:
+                raise ValueError(f"Element of size {(width, height)} overflows the page")
+            blocker: Optional[Box] = next((b for b in (*occupied, *boxes) if box.overlaps(b)), None)
+            if blocker is None:
+                break
+            x = blocker.right + gap
+            row_bottom = max(row_bottom, blocker.bottom)
+        boxes.append(box)
+        x = box.right + gap
+        row_bottom = max(row_bottom, box.bottom)
+    return boxes
+
+
+def pack_layout(
+    sizes: Sequence[Tuple[int, int]],
+    page_size: Tuple[int, int] = PAGE_SIZE,
+    occupied: Sequence[Box] = (),
+    margin: int = SPACING,
+    gap: int = SPACING,
+) -> List[Box]:
+    """Place each element at the top-most, then left-most free position (bottom-left fill).
+
+    Args:
+        sizes (Sequence[Tuple[int, int]]): (width, height) of elements in EMU.
+        page_size (Tuple[int, int]): Page size in EMU. Defaults to 16:9 slide.
+        occupied (Sequence[Box]): Boxes of existing elements. Defaults to ().
+        margin (int): Margin of the page in EMU. Defaults to 0.25 inch.
+        gap (int): Gap between elements in EMU. Defaults to 0.25 inch.
+
+    Returns:
+        List[Box]: Boxes of elements.
+
+    Raises:
+        ValueError: When an element cannot be placed without overlap.
+    """
+    area: Box = _area(page_size, margin)
+    placed: List[Box] = list(occupied)
+    candidates: List[Tuple[int, int]] = [(area.y, area.x)]
+    for box in occupied:
+        candidates.extend([(box.y, box.right + gap), (box.bottom + gap, box.x), (box.bottom + gap, area.x)])
+
+    boxes: List[Box] = []
+    for width, height in sizes:
+        candidates.sort()
+        box: Optional[Box] = next(
+            (Box(x, y, width, height) for y, x in candidates if _fits(Box(x, y, width, height), area, placed)), None
+        )
+        if box is None:
+            raise ValueError(f"No space for element of size {(width, height)}")
+        boxes.append(box)
+        placed.append(box)
+        candidates.extend([(box.y, box.right + gap), (box.bottom + gap, box.x), (box.bottom + gap, area.x)])
+    return boxes
+
+
+def layout(
+    sizes: Sequence[Tuple[int, int]],
+    mode: str = "pack",
+    page_size: Tuple[int, int] = PAGE_SIZE,
+    occupied: Sequence[Box] = (),
+    margin: int = SPACING,
+    gap: int = SPACING,
+) -> List[Box]:
+    """Compute non-overlapping boxes of elements.
+
+    Args:
+        sizes (Sequence[Tuple[int, int]]): (width, height) of elements in EMU. Ignored except count in grid mode.
+        mode (str): 'grid', 'flow' or 'pack'. Defaults to 'pack'.
+        page_size (Tuple[int, int]): Page size in EMU. Defaults to 16:9 slide.
+        occupied (Sequence[Box]): Boxes of existing elements. Defaults to ().
+        margin (int): Margin of the page in EMU. Defaults to 0.25 inch.
+        gap (int): Gap between elements in EMU. Defaults to 0.25 inch.
+
+    Returns:
+        List[Box]: Boxes of elements.
+    """
+    if mode == "grid":
+        return grid_layout(len(sizes), page_size, occupied, margin=margin, gap=gap)
+    if mode == "flow":
+        return flow_layout(sizes, page_size, occupied, margin=margin, gap=gap)
+    if mode == "pack":
+        return pack_layout(sizes, page_size, occupied, margin=margin, gap=gap)
+    raise ValueError(f"Unknown layout mode: {mode}")
@@ -0,0 +1,35 @@
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+__all__ = ("lazy_attributes",)
+
+
+def lazy_attributes(module_name: str, attrs: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Returns `__getattr__` and `__dir__` of the module which import attributes on first access (PEP 562).
+
+    Args:
+        module_name (str): Name of the module, i.e. `__name__`.
+        attrs (Dict[str, str]): Relative names of submodules to import from, keyed by attribute names,
+            e.g. {'SheetsAPI': '.sheets'}.
+
+    Returns:
+        Tuple[Callable[[str], Any], Callable[[], List[str]]]: `__getattr__` and `__dir__` of the module.
+
+    Examples:
+        >>> __getattr__, __dir__ = lazy_attributes(__name__, {"SheetsAPI": ".sheets"})
+    """
+
+    def __getattr__(name: str) -> Any:
+        submodule: Optional[str] = attrs.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        value: Any = getattr(importlib.import_module(submodule, module_name), name)
+        # NOTE: Cached in the module, so that later access does not call `__getattr__`.
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[module_name])) | set(attrs))
+
+    return __getattr__, __dir__
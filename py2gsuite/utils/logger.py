@@ -1,51 +1,226 @@
+import atexit
+import json
 import logging
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+from typing import IO, Any, Dict, List, Optional, Tuple
 
-import coloredlogs
+__all__ = ("get_logger", "configure_logging", "JsonFormatter", "SamplingFilter")
+
+FORMAT: str = "[%(asctime)s] [%(levelname)s] [func] %(funcName)s [line] %(lineno)d: %(message)s"
+DATE_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+
+LEVEL_STYLES: Dict[str, Dict[str, Any]] = {
+    "critical": {"color": "red", "bold": True},
+    "error": {"color": "red"},
+    "warning": {"color": "yellow"},
+    "notice": {"color": "magenta"},
+    "info": {},
+    "debug": {"color": "green"},
+    "spam": {"color": "green", "faint": True},
+    "success": {"color": "green", "bold": True},
+    "verbose": {"color": "blue"},
+}
+
+FIELD_STYLES: Dict[str, Dict[str, Any]] = {
+    "asctime": {"color": "green"},
+    "levelname": {"color": "cyan", "bold": True},
+    "funcName": {"color": "blue"},
+    "lineno": {"color": "blue", "bold": True},
+}
+
+# Attributes of LogRecord, which are not passed by `extra`.
+_RECORD_ATTRS = frozenset(logging.makeLogRecord({}).__dict__) | {"message", "asctime", "suppressed"}
+
+
+class _LazyColoredFormatter(logging.Formatter):
+    """Formatter which imports coloredlogs on the first record, so that creating loggers costs no import."""
+
+    def __init__(self) -> None:
+        super().__init__(fmt=FORMAT, datefmt=DATE_FORMAT)
+        self._formatter: Optional[logging.Formatter] = None
+
+    def format(self, record: logging.LogRecord) -> str:
+        if self._formatter is None:
+            import coloredlogs
+
+            self._formatter = coloredlogs.ColoredFormatter(
+                fmt=FORMAT, datefmt=DATE_FORMAT, level_styles=LEVEL_STYLES, field_styles=FIELD_STYLES
+            )
+        return self._formatter.format(record)
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter which writes a record as a line of JSON. Fields passed by `extra` are included.
+
+    Examples:
+        >>> logger.info("%d cells updated.", 10, extra={"cells": 10})
+        {"time": 1650000000.0, "level": "INFO", "logger": "...", "func": "...", "line": 1, "message": "10 cells updated.", "cells": 10}
+    """  # noqa: E501
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: Dict[str, Any] = {
+            "time": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "func": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        data.update((k, v) for k, v in record.__dict__.items() if k not in _RECORD_ATTRS)
+        if getattr(record, "suppressed", 0):
+            data["suppressed"] = record.suppressed
+        if record.exc_info:
+            data["exc"] = self.formatException(record.exc_info)
+        return json.dumps(data, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """Filter which passes at most one record per message template in each interval.
+
+    Records are keyed by logger name, level and the template before %-formatting, so repetitive per-request
+    messages like "%d cells updated." are dropped without being formatted. The number of dropped records is
+    appended to the next passed one. Records of `max_level` or above, e.g. warnings, are always passed.
+    """
+
+    def __init__(self, interval: float = 1.0, max_level: int = logging.INFO) -> None:
+        """
+        Args:
+            interval (float): Seconds in which one record per template is passed. Defaults to 1.0.
+            max_level (int): Records below this level are sampled. Defaults to logging.INFO, i.e. INFO and DEBUG.
+        """
+        super().__init__()
+        self.interval: float = interval
+        self.max_level: int = max_level
+        self._last: Dict[Tuple[str, int, Any], Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        key = (record.name, record.levelno, record.msg)
+        now: float = time.monotonic()
+        with self._lock:
+            last, suppressed = self._last.get(key, (-self.interval, 0))
+            if now - last < self.interval:
+                self._last[key] = (last, suppressed + 1)
+                return False
+            self._last[key] = (now, 0)
+        if suppressed:
+            record.suppressed = suppressed
+            record.msg = f"{record.msg} ({suppressed} similar messages suppressed)"
+        return True
+
+
+class _QueueHandler(QueueHandler):
+    """QueueHandler which defers formatting to the listener thread.
+
+    NOTE: The default `prepare` formats the message in the calling thread. Arguments of records are passed
+    to the listener as they are, so they should not be mutated after logging.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_lock = threading.RLock()
+_loggers: List[logging.Logger] = []
+_handler: Optional[logging.Handler] = None
+_listener: Optional[QueueListener] = None
+_level: Optional[int] = None
+
+
+def _stream_handler(stream: Optional[IO[str]] = None, structured: bool = False) -> logging.Handler:
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(JsonFormatter() if structured else _LazyColoredFormatter())
+    return handler
+
+
+def _stop_listener() -> None:
+    global _listener
+    with _lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def get_logger(name=__name__, level=logging.INFO):
     """Returns logger.
 
+    All loggers share a single handler, which is configured by `configure_logging()`.
+
     Args:
         name (str): module name.
-        level (int): logging level.
+        level (int): logging level. Ignored if a level is set by `configure_logging()`.
 
     Returns:
-        logger (logging.RootLogger): logger.
+        logger (logging.Logger): logger.
     """
+    global _handler
     logger = logging.getLogger(name)
-    logger.handlers.clear()
-    logger.propagate = False
-    logger.setLevel(level)
-
-    # log handler
-    handler = logging.StreamHandler()
-    handler.setLevel(level)
-
-    # formatter
-    formatter = coloredlogs.ColoredFormatter(
-        fmt="[%(asctime)s] [%(levelname)s] [func] %(funcName)s [line] %(lineno)d: %(message)s",
-        datefmt="%Y-%d-%d %H:%M:%S",
-        level_styles={
-            "critical": {"color": "red", "bold": True},
-            "error": {"color": "red"},
-            "warning": {"color": "yellow"},
-            "notice": {"color": "magenta"},
-            "info": {},
-            "debug": {"color": "green"},
-            "spam": {"color": "green", "faint": True},
-            "success": {"color": "green", "bold": True},
-            "verbose": {"color": "blue"},
-        },
-        field_styles={
-            "asctime": {"color": "green"},
-            "levelname": {"color": "cyan", "bold": True},
-            "funcName": {"color": "blue"},
-            "lineno": {"color": "blue", "bold": True},
-        },
-    )
-
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
-
+    with _lock:
+        if _handler is None:
+            _handler = _stream_handler()
+        if logger not in _loggers:
+            _loggers.append(logger)
+            logger.propagate = False
+        if _handler not in logger.handlers:
+            logger.addHandler(_handler)
+        logger.setLevel(level if _level is None else _level)
     return logger
+
+
+def configure_logging(
+    level: Optional[int] = None,
+    structured: bool = False,
+    use_queue: bool = False,
+    sample_interval: Optional[float] = None,
+    stream: Optional[IO[str]] = None,
+) -> None:
+    """Configure the handler shared by all loggers of py2gsuite.
+
+    Args:
+        level (Optional[int]): Logging level of all loggers. If None, levels are unchanged. Defaults to None.
+        structured (bool): Whether to write records as lines of JSON instead of colored text. Defaults to False.
+        use_queue (bool): Whether to write records in a background thread, so that logging never blocks on
+            the stream. Defaults to False.
+        sample_interval (Optional[float]): If specified, INFO and DEBUG records are passed at most once per
+            message template in this many seconds. Defaults to None.
+        stream (Optional[IO[str]]): Stream to write. Defaults to None, i.e. stderr.
+
+    Examples:
+        >>> configure_logging(logging.WARNING)  # quiet
+        >>> configure_logging(structured=True, use_queue=True, sample_interval=5.0)  # high-rate batch jobs
+    """
+    global _handler, _listener, _level
+    with _lock:
+        listener: Optional[QueueListener] = _listener
+        handler: logging.Handler = _stream_handler(stream or sys.stderr, structured)
+        if use_queue:
+            queue: SimpleQueue = SimpleQueue()
+            _listener = QueueListener(queue, handler)
+            _listener.start()
+            handler = _QueueHandler(queue)
+        else:
+            _listener = None
+        if sample_interval is not None:
+            handler.addFilter(SamplingFilter(sample_interval))
+
+        if level is not None:
+            _level = level
+        for logger in _loggers:
+            if _handler is not None:
+                logger.removeHandler(_handler)
+            logger.addHandler(handler)
+            if _level is not None:
+                logger.setLevel(_level)
+        _handler = handler
+        # NOTE: The old listener is stopped after swapping handlers, so that queued records are not lost.
+        if listener is not None:
+            listener.stop()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import os.path as osp
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+__all__ = ("Snapshot", "Block")
+
+#: Changed rectangle, as (row offset, column offset, values). Offsets are 0-based from the origin of snapshot.
+Block = Tuple[int, int, List[List[Any]]]
+
+
+def _hash_cells(cells: Sequence[Any]) -> str:
+    data: bytes = json.dumps(cells, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+class Snapshot:
+    """Hashes of the values last written to a range, used to send only changed cells.
+
+    Each row is split into blocks of `block_cols` columns, and a hash is kept for each block.
+    Values themselves are not kept, so the size of snapshot is independent of the size of cells.
+
+    Attributes:
+        key (str): Key of the written range, e.g. '<spreadsheet id>:Sheet1!A1'.
+        block_cols (int): The number of columns in a block.
+        widths (List[int]): The number of cells in each row.
+        hashes (List[List[str]]): Hashes of blocks in each row.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        block_cols: int = 16,
+        widths: Optional[List[int]] = None,
+        hashes: Optional[List[List[str]]] = None,
+    ) -> None:
+        if block_cols < 1:
+            raise ValueError(f"`block_cols` must be >= 1, but got {block_cols}")
+        self.key: str = key
+        self.block_cols: int = block_cols
+        self.widths: List[int] = widths if widths is not None else []
+        self.hashes: List[List[str]] = hashes if hashes is not None else []
+
+    def __len__(self) -> int:
+        return len(self.widths)
+
+    @classmethod
+    def load(cls, path: str, key: str, block_cols: int = 16) -> Snapshot:
+        """Load snapshot from JSON file. If the file does not exist or was taken for other range, returns empty one.
+
+        Args:
+            path (str): Path to JSON file.
+            key (str): Key of the range.
+            block_cols (int): The number of columns in a block. Defaults to 16.
+
+        Returns:
+            Snapshot: Loaded snapshot.
+        """
+        if osp.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data: Dict[str, Any] = json.load(f)
+            if data.get("key") == key and data.get("block_cols") == block_cols:
+                return cls(key, block_cols, data["widths"], data["hashes"])
+        return cls(key, block_cols)
+
+    def save(self, path: str) -> None:
+        """Save snapshot as JSON file atomically.
+
+        Args:
+            path (str): Path to JSON file.
+        """
+        data: Dict[str, Any] = {
+            "key": self.key,
+            "block_cols": self.block_cols,
+            "widths": self.widths,
+            "hashes": self.hashes,
+        }
+        tmp_path: str = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    def diff(self, rows: Sequence[Sequence[Any]]) -> Tuple[Snapshot, List[Block]]:
+        """Compare new rows with the snapshot, and returns changed rectangles.
+
+        Cells which were written before but are out of new rows are returned as empty strings to clear them.
+        Changed blocks in adjacent rows with the same columns are merged into one rectangle.
+
+        Args:
+            rows (Sequence[Sequence[Any]]): New rows of cell values.
+
+        Returns:
+            Tuple[Snapshot, List[Block]]: Snapshot of new rows, and changed rectangles.
+        """
+        bc: int = self.block_cols
+        widths: List[int] = []
+        hashes: List[List[str]] = []
+        # Open rectangles keyed by (first block, last block), as [first row, last row].
+        opened: Dict[Tuple[int, int], List[int]] = {}
+        spans: List[Tuple[int, int, int, int]] = []
+
+        num_rows: int = max(len(rows), len(self.widths))
+        for i in range(num_rows):
+            row: Sequence[Any] = rows[i] if i < len(rows) else ()
+            old_hashes: List[str] = self.hashes[i] if i < len(self.hashes) else []
+            width: int = max(len(row), self.widths[i] if i < len(self.widths) else 0)
+
+            row_hashes: List[str] = [_hash_cells(list(row[b : b + bc])) for b in range(0, len(row), bc)]
+            if i < len(rows):
+                widths.append(len(row))
+                hashes.append(row_hashes)
+
+            changed: List[int] = [
+                b
+                for b in range((width + bc - 1) // bc)
+                if (row_hashes[b] if b < len(row_hashes) else None) != (old_hashes[b] if b < len(old_hashes) else None)
+            ]
+
+            row_spans: List[Tuple[int, int]] = []
+            for b in changed:
+                if row_spans and row_spans[-1][1] == b - 1:
+                    row_spans[-1] = (row_spans[-1][0], b)
+                else:
+                    row_spans.append((b, b))
+
+            for span in list(opened):
+                if span not in row_spans:
+                    first, last = opened.pop(span)
+                    spans.append((first, last, span[0], span[1]))
+            for span in row_spans:
+                if span in opened:
+                    opened[span][1] = i
+                else:
+                    opened[span] = [i, i]
+        spans.extend((first, last, span[0], span[1]) for span, (first, last) in opened.items())
+
+        blocks: List[Block] = []
+        for first, last, b0, b1 in sorted(spans):
+            c0: int = b0 * bc
+            c1: int = (b1 + 1) * bc
+            c1 = min(
+                c1,
+                max(
+                    max(len(rows[i]) if i < len(rows) else 0, self.widths[i] if i < len(self.widths) else 0)
+                    for i in range(first, last + 1)
+                ),
+            )
+            values: List[List[Any]] = []
+            for i in range(first, last + 1):
+                cells: List[Any] = list(rows[i][c0:c1]) if i < len(rows) else []
+                cells.extend([""] * (c1 - c0 - len(cells)))
+                values.append(cells)
+            blocks.append((first, c0, values))
+
+        return Snapshot(self.key, bc, widths, hashes), blocks
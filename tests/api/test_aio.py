@@ -0,0 +1,186 @@
+import asyncio
+import json
+from urllib.parse import urlparse
+
+import pytest
+from google.oauth2.credentials import Credentials
+
+from py2gsuite.api.aio import AsyncClient, AsyncSheetsAPI, AsyncSlidesAPI
+from py2gsuite.api.retry import RetryPolicy
+from py2gsuite.api.slides import create_table_requests, insert_table_requests
+
+web = pytest.importorskip("aiohttp.web")
+test_utils = pytest.importorskip("aiohttp.test_utils")
+
+
+class DummyServer:
+    """Records requests and responds like Sheets and Slides APIs. Statuses in `failures` are returned first."""
+
+    def __init__(self):
+        self.requests = []
+        self.failures = []
+
+    async def handle(self, request):
+        body = json.loads(await request.read() or b"null")
+        self.requests.append((request.method, request.path, list(request.query.items()), body))
+        assert request.headers["authorization"] == "Bearer dummy"
+
+        if self.failures:
+            status, headers = self.failures.pop(0)
+            return web.json_response({"error": {"code": status}}, status=status, headers=headers)
+
+        path = request.path
+        if path.endswith(":append"):
+            return web.json_response({"updates": {"updatedCells": sum(len(r) for r in body["values"])}})
+        if path.endswith(":batchUpdate") and path.startswith("/slides/"):
+            replies = [{kind: {"objectId": r.get("objectId")}} for req in body["requests"] for kind, r in req.items()]
+            return web.json_response({"replies": replies})
+        if request.method == "GET" and path.startswith("/slides/v1/presentations/"):
+            element = {"objectId": "e", "size": {"width": {"magnitude": 1000000, "unit": "EMU"}}}
+            return web.json_response({"slides": [{"objectId": "first", "pageElements": [element]}, {"objectId": "p"}]})
+        if path.endswith(":batchGet"):
+            # NOTE: The last range is dropped to check that results are aligned with requested ranges.
+            ranges = request.query.getall("ranges")[:-1]
+            return web.json_response({"valueRanges": [{"range": r, "values": [[r]]} for r in ranges]})
+        if request.method == "PUT":
+            return web.json_response({"updatedRange": path.rsplit("/", 1)[1], "updatedCells": 1})
+        return web.json_response({})
+
+
+class DummySession:
+    """Sends requests for https://{api}.googleapis.com/{path} to the test server as /{api}/{path}."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def request(self, method, url, **kwargs):
+        parsed = urlparse(url)
+        return self.client.request(method, f"/{parsed.hostname.split('.')[0]}{parsed.path}", **kwargs)
+
+
+def _run(func, failures=(), policy=None):
+    server = DummyServer()
+    server.failures.extend(failures)
+
+    async def main():
+        app = web.Application()
+        app.router.add_route("*", "/{path:.*}", server.handle)
+        async with test_utils.TestClient(test_utils.TestServer(app)) as client:
+            async with AsyncClient(Credentials(token="dummy"), session=DummySession(client)) as async_client:
+                async_client.retry_policy = RetryPolicy(backoff_base=0.0) if policy is None else policy
+                return await func(async_client)
+
+    return asyncio.run(main()), server.requests
+
+
+def test_async_values():
+    async def func(client):
+        api = AsyncSheetsAPI(None, "sid", client=client)
+        return await api.add_values([["a", "b"]], "S!A1:B1"), await api.update_values([["c"]], "S!A2")
+
+    result, requests = _run(func)
+    assert result == (True, True)
+    assert [(method, path) for method, path, _, _ in requests] == [
+        ("POST", "/sheets/v4/spreadsheets/sid/values/S!A1:B1:append"),
+        ("PUT", "/sheets/v4/spreadsheets/sid/values/S!A2"),
+    ]
+    assert requests[0][2] == [("valueInputOption", "USER_ENTERED")]
+    assert requests[1][3] == {"values": [["c"]]}
+
+
+def test_async_batch_get_values():
+    async def func(client):
+        return await AsyncSheetsAPI(None, "sid", client=client).batch_get_values(["A1", "A2", "A3"], max_ranges=2)
+
+    result, requests = _run(func)
+    assert result == [[["A1"]], None, None]
+    assert requests[0][2] == [("ranges", "A1"), ("ranges", "A2"), ("valueRenderOption", "FORMATTED_VALUE")]
+
+
+def test_async_write_rows():
+    reports = []
+
+    async def func(client):
+        api = AsyncSheetsAPI(None, "sid", client=client)
+        rows = [[i, i * 2] for i in range(5)]
+        return await api.write_rows(rows, "S!B2", chunk_rows=2, callback=reports.append)
+
+    result, requests = _run(func)
+    assert result
+    assert [path.rsplit("/", 1)[1] for _, path, _, _ in requests] == ["S!B2:C3", "S!B4:C5", "S!B6:C6"]
+    assert requests[2][3] == {"values": [[4, 8]]}
+    assert [r.rows for r in reports] == [2, 2, 1]
+
+    result, requests = _run(func, failures=[(400, None)])
+    assert not result
+    assert len(requests) == 1
+
+
+def test_async_retry():
+    async def update(client):
+        return await AsyncSheetsAPI(None, "sid", client=client).update_values([["a"]], "A1")
+
+    result, requests = _run(update, failures=[(429, {"Retry-After": "0"}), (503, None)])
+    assert result
+    assert len(requests) == 3
+
+    result, requests = _run(update, failures=[(503, None)] * 2, policy=RetryPolicy(max_attempts=2, backoff_base=0.0))
+    assert not result
+    assert len(requests) == 2
+
+    async def append(client):
+        return await AsyncSheetsAPI(None, "sid", client=client).add_values([["a"]], "A1")
+
+    # Appending is not idempotent, so it is not retried unless opted in.
+    result, requests = _run(append, failures=[(503, None)])
+    assert not result
+    assert len(requests) == 1
+
+    result, requests = _run(
+        append, failures=[(503, None)], policy=RetryPolicy(backoff_base=0.0, retry_non_idempotent=True)
+    )
+    assert result
+    assert len(requests) == 2
+
+
+def test_async_add_table():
+    values = [["a", "b"], ["c", "d"]]
+
+    async def func(client):
+        api = AsyncSlidesAPI(None, "pid", client=client)
+        return await api.add_table(values, table_id=None, page_id="p2", max_requests=3)
+
+    result, requests = _run(func)
+    assert result
+    assert all(
+        method == "POST" and path == "/slides/v1/presentations/pid:batchUpdate" for method, path, _, _ in requests
+    )
+    sent = [r for _, _, _, body in requests for r in body["requests"]]
+    table_id = sent[0]["createTable"]["objectId"]
+    assert sent == create_table_requests(table_id, 2, 2, "p2") + insert_table_requests(values, table_id)
+    sizes = [len(body["requests"]) for _, _, _, body in requests]
+    assert len(sizes) > 1
+    assert all(size == 3 for size in sizes[:-1])
+
+
+def test_async_first_page():
+    async def func(client):
+        api = AsyncSlidesAPI(None, "pid", client=client)
+        return [
+            await api.add_text("a", element_id="t"),
+            await api.add_image("http://x/a.png"),
+            await api.create_empty_table("t2", 1, 1),
+            await api.add_table([["a"]]),
+            await api.create_slide("s", insertion_index=1),
+        ]
+
+    result, requests = _run(func)
+    assert all(result)
+    # The index is loaded once and the first slide is used instead of a fixed ID.
+    assert [method for method, _, _, _ in requests].count("GET") == 1
+    bodies = [body["requests"][0] for method, _, _, body in requests if method == "POST"]
+    assert bodies[0]["createShape"]["elementProperties"]["pageObjectId"] == "first"
+    assert bodies[1]["createImage"]["elementProperties"]["pageObjectId"] == "first"
+    assert bodies[2]["createTable"]["elementProperties"]["pageObjectId"] == "first"
+    assert bodies[3]["createTable"]["elementProperties"]["pageObjectId"] == "first"
+    assert bodies[4]["createSlide"]["insertionIndex"] == 1
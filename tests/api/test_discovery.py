@@ -0,0 +1,63 @@
+import os
+
+import httplib2
+import pytest
+from google.oauth2.credentials import Credentials
+from googleapiclient.errors import HttpError
+
+from py2gsuite.api import discovery
+
+
+def test_build_service_cached(tmp_path):
+    discovery.set_cache_dir(str(tmp_path))
+    try:
+        creds = Credentials(token="dummy")
+        service1 = discovery.build_service("sheets", "v4", creds)
+        service2 = discovery.build_service("sheets", "v4", creds)
+        assert service1 is service2
+        assert discovery.is_cached_service(service1)
+        assert os.listdir(str(tmp_path)) == ["sheets.v4.json"]
+
+        other = discovery.build_service("sheets", "v4", Credentials(token="other"))
+        assert other is not service1
+
+        uncached = discovery.build_service("sheets", "v4", creds, cache=False)
+        assert uncached is not service1
+        assert not discovery.is_cached_service(uncached)
+    finally:
+        discovery.clear_cache()
+        discovery.set_cache_dir(None)
+
+
+def test_get_collection_cached():
+    creds = Credentials(token="dummy")
+    service = discovery.build_service("sheets", "v4", creds, cache=False)
+    values = discovery.get_collection(service, "spreadsheets", "values")
+    assert values is discovery.get_collection(service, "spreadsheets", "values")
+    assert hasattr(values, "batchUpdate")
+
+
+def test_build_service_bounded(monkeypatch):
+    monkeypatch.setattr(discovery, "_max_services", 2)
+    try:
+        creds = [Credentials(token=f"dummy{i}") for i in range(3)]
+        service0 = discovery.build_service("sheets", "v4", creds[0])
+        service1 = discovery.build_service("sheets", "v4", creds[1])
+        assert discovery.build_service("sheets", "v4", creds[0]) is service0
+        discovery.build_service("sheets", "v4", creds[2])
+        assert discovery.is_cached_service(service0)
+        assert not discovery.is_cached_service(service1)
+    finally:
+        discovery.clear_cache()
+
+
+def test_get_document_error(monkeypatch):
+    class DummyHttp:
+        def request(self, uri):
+            return httplib2.Response({"status": "503"}), b"unavailable"
+
+    monkeypatch.setattr(discovery, "get_static_doc", lambda api, version: None)
+    monkeypatch.setattr(discovery.httplib2, "Http", DummyHttp)
+    with pytest.raises(HttpError):
+        discovery.get_document("unknown", "v1")
+    assert ("unknown", "v1") not in discovery._documents
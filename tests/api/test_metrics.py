@@ -0,0 +1,98 @@
+from py2gsuite.api.aio import _method_name
+from py2gsuite.api.metrics import (
+    InMemorySink,
+    OpenTelemetrySink,
+    PrometheusSink,
+    add_sink,
+    remove_sink,
+)
+from py2gsuite.api.retry import CallRecord, RetryPolicy
+from py2gsuite.testing import FakeBackend
+
+
+def test_in_memory_sink():
+    sink = InMemorySink()
+    add_sink(sink)
+    try:
+        backend = FakeBackend(quota=(2, 60.0))
+        api = backend.sheets_api()
+        api.retry_policy = RetryPolicy(max_attempts=1)
+        for _ in range(3):
+            api.update_values([["a", "b"]], "A1:B1")
+    finally:
+        remove_sink(sink)
+
+    stats = sink.stats()["sheets.spreadsheets.values.update"]
+    assert stats.count == 3
+    assert stats.errors == 1
+    assert stats.quota_errors == 1
+    assert stats.bytes_sent > 0
+    assert stats.bytes_received > 0
+    assert sum(stats.buckets) == 3
+    assert stats.quantile(0.5) <= 0.005
+
+
+def test_prometheus_sink():
+    sink = PrometheusSink()
+    sink.record(CallRecord("sheets.spreadsheets.get", 200, 1, 0.02, 10, 20, 1))
+    sink.record(CallRecord("sheets.spreadsheets.get", 503, 0, 100.0))
+    text = sink.render()
+    assert 'py2gsuite_request_duration_seconds_bucket{method="sheets.spreadsheets.get",le="0.01"} 0' in text
+    assert 'py2gsuite_request_duration_seconds_bucket{method="sheets.spreadsheets.get",le="0.025"} 1' in text
+    assert 'py2gsuite_request_duration_seconds_bucket{method="sheets.spreadsheets.get",le="+Inf"} 2' in text
+    assert 'py2gsuite_errors_total{method="sheets.spreadsheets.get"} 1' in text
+    assert 'py2gsuite_retries_total{method="sheets.spreadsheets.get"} 1' in text
+    assert 'py2gsuite_quota_errors_total{method="sheets.spreadsheets.get"} 1' in text
+    assert 'py2gsuite_sent_bytes_total{method="sheets.spreadsheets.get"} 10' in text
+
+
+def test_opentelemetry_sink():
+    class Span:
+        def __init__(self, name, start_time):
+            self.name, self.start_time, self.attributes, self.end_time = name, start_time, {}, None
+
+        def set_attribute(self, key, value):
+            self.attributes[key] = value
+
+        def end(self, end_time=None):
+            self.end_time = end_time
+
+    class Tracer:
+        spans = []
+
+        def start_span(self, name, start_time=None):
+            self.spans.append(Span(name, start_time))
+            return self.spans[-1]
+
+    sink = OpenTelemetrySink(Tracer())
+    sink.record(CallRecord("slides.presentations.batchUpdate", 200, 2, 1.5, 100, 50))
+    span = Tracer.spans[0]
+    assert span.name == "slides.presentations.batchUpdate"
+    assert span.end_time - span.start_time == 1_500_000_000
+    assert span.attributes["py2gsuite.retries"] == 2
+    assert span.attributes["py2gsuite.bytes_sent"] == 100
+
+
+def test_failing_sink_is_ignored():
+    class Broken(InMemorySink):
+        def record(self, record):
+            raise RuntimeError("broken")
+
+    sink = Broken()
+    add_sink(sink)
+    try:
+        api = FakeBackend().sheets_api()
+        assert api.update_values([["a"]], "A1")
+    finally:
+        remove_sink(sink)
+
+
+def test_async_method_name():
+    base = "https://sheets.googleapis.com/v4/spreadsheets/abc"
+    assert _method_name("sheets", "POST", f"{base}/values:batchUpdate") == "sheets.spreadsheets.values.batchUpdate"
+    assert _method_name("sheets", "POST", f"{base}/values/A1%3AB2:append") == "sheets.spreadsheets.values.append"
+    assert _method_name("sheets", "PUT", f"{base}/values/A1%3AB2") == "sheets.spreadsheets.values.update"
+    assert _method_name("sheets", "GET", base) == "sheets.spreadsheets.get"
+    assert _method_name("slides", "POST", "https://slides.googleapis.com/v1/presentations") == (
+        "slides.presentations.create"
+    )
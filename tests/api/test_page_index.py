@@ -0,0 +1,44 @@
+from py2gsuite.api.page_index import PageIndex
+from py2gsuite.api.slides import add_text_requests, create_slide_requests
+
+PRESENTATION = {
+    "slides": [
+        {"objectId": "s1", "pageElements": [{"objectId": "e1", "shape": {"shapeType": "TEXT_BOX"}}]},
+        {"objectId": "s2", "pageElements": [{"objectId": "e2", "table": {"rows": 2}}]},
+        {"objectId": "s3"},
+    ]
+}
+
+
+def test_load():
+    index = PageIndex()
+    index.load(PRESENTATION)
+    assert index.slides == ["s1", "s2", "s3"]
+    assert index.first_slide == "s1"
+    assert index.elements["e2"].kind == "table" and index.elements["e2"].page_id == "s2"
+    assert "e1" in index and "s3" in index and "x" not in index
+
+
+def test_apply():
+    index = PageIndex()
+    index.load(PRESENTATION)
+    index.apply(create_slide_requests("s4") + create_slide_requests("s0", insertion_index=0))
+    assert index.slides == ["s0", "s1", "s2", "s3", "s4"]
+
+    index.apply(add_text_requests("Hello", "s4", "t1"))
+    assert index.elements["t1"].page_id == "s4" and index.elements["t1"].kind == "shape"
+    assert not index.stale
+
+    index.apply([{"updateSlidesPosition": {"slideObjectIds": ["s0", "s1"], "insertionIndex": 4}}])
+    assert index.slides == ["s2", "s3", "s0", "s1", "s4"]
+
+    index.apply([{"deleteObject": {"objectId": "s4"}}, {"deleteObject": {"objectId": "e1"}}])
+    assert index.slides == ["s2", "s3", "s0", "s1"]
+    assert "t1" not in index and "e1" not in index
+
+    index.apply(
+        [{"duplicateObject": {"objectId": "s2"}}],
+        [{"duplicateObject": {"objectId": "copy"}}],
+    )
+    assert index.slides[:2] == ["s2", "copy"]
+    assert index.stale
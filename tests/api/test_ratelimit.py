@@ -0,0 +1,43 @@
+import time
+
+from py2gsuite.api.ratelimit import RateLimiter, TokenBucket
+
+
+def test_token_bucket_reserve():
+    bucket = TokenBucket(rate=10.0, capacity=2.0)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    delay = bucket.reserve()
+    assert 0.0 < delay <= 0.1
+
+
+def test_token_bucket_adaptive():
+    bucket = TokenBucket(rate=10.0)
+    bucket.slow_down()
+    assert bucket.rate == 5.0
+    for _ in range(100):
+        bucket.slow_down()
+    assert bucket.rate == bucket.min_rate
+    for _ in range(100):
+        bucket.speed_up()
+    assert bucket.rate == bucket.max_rate
+
+
+def test_rate_limiter():
+    limiter = RateLimiter({"sheets": (600.0, 60.0)}, burst_seconds=1.0)
+    assert limiter.bucket("unknown", "read") is None
+    assert limiter.acquire("unknown", "read") == 0.0
+
+    read = limiter.bucket("sheets", "read")
+    write = limiter.bucket("sheets", "write")
+    assert read.rate == 10.0 and write.rate == 1.0
+    assert limiter.bucket("sheets", "read") is read
+
+    start = time.monotonic()
+    for _ in range(12):
+        limiter.acquire("sheets", "read")
+    assert time.monotonic() - start >= 0.1
+
+    limiter.feedback("sheets", "write", 429)
+    assert write.rate == 0.5
+    assert read.rate == 10.0
@@ -0,0 +1,72 @@
+import httplib2
+import pytest
+from googleapiclient.errors import HttpError
+
+from py2gsuite.api.base import execute
+from py2gsuite.api.retry import RetryPolicy
+
+
+class DummyRequest:
+    method = "POST"
+    methodId = "sheets.spreadsheets.values.update"
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+
+    def execute(self):
+        status = self.statuses.pop(0)
+        if status >= 400:
+            raise HttpError(httplib2.Response({"status": status}), b"{}")
+        return {"status": status}
+
+
+def test_backoff():
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=False)
+    assert [policy.backoff(i) for i in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+    assert policy.backoff(1, retry_after=3.0) == 3.0
+    jittered = RetryPolicy(backoff_base=1.0)
+    assert all(0.0 <= jittered.backoff(3) <= 4.0 for _ in range(100))
+
+
+def test_next_delay():
+    policy = RetryPolicy(max_attempts=3, backoff_base=1.0, jitter=False, deadline=2.5)
+    assert policy.next_delay(503, 1, 0.0) == 1.0
+    assert policy.next_delay(404, 1, 0.0) is None
+    assert policy.next_delay(503, 3, 0.0) is None
+    assert policy.next_delay(503, 2, 1.0) is None
+    assert policy.next_delay(0, 1, 0.0) == 1.0
+    assert policy.next_delay(503, 1, 0.0, idempotent=False) is None
+
+
+def test_execute_retries():
+    records = []
+    policy = RetryPolicy(backoff_base=0.001)
+    response = execute(DummyRequest([503, 429, 200]), "sheets", policy=policy, record=records.append)
+    assert response == {"status": 200}
+    assert records[0].retries == 2
+    assert records[0].method == "sheets.spreadsheets.values.update"
+
+
+def test_execute_gives_up():
+    records = []
+    policy = RetryPolicy(max_attempts=2, backoff_base=0.001)
+    with pytest.raises(HttpError):
+        execute(DummyRequest([503, 503, 200]), "sheets", policy=policy, record=records.append)
+    assert records[0].retries == 1
+    assert records[0].status == 503
+
+    with pytest.raises(HttpError):
+        execute(DummyRequest([400]), "sheets", policy=policy, record=records.append)
+    assert records[1].retries == 0
+
+
+def test_execute_non_idempotent():
+    class AppendRequest(DummyRequest):
+        methodId = "sheets.spreadsheets.values.append"
+
+    policy = RetryPolicy(backoff_base=0.001)
+    with pytest.raises(HttpError):
+        execute(AppendRequest([503, 200]), "sheets", policy=policy)
+
+    policy = RetryPolicy(backoff_base=0.001, retry_non_idempotent=True)
+    assert execute(AppendRequest([503, 200]), "sheets", policy=policy) == {"status": 200}
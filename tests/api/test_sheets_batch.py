@@ -0,0 +1,62 @@
+from py2gsuite.testing import FakeBackend
+
+
+def _batch_calls(backend, kind):
+    return [path for method, path in backend.calls if path.endswith(f":{kind}")]
+
+
+def test_batch_update_values_chunks():
+    backend = FakeBackend()
+    api = backend.sheets_api()
+    data = [(f"A{i + 1}", [[i]]) for i in range(5)]
+    results = api.batch_update_values(data, max_ranges=2)
+    assert len(_batch_calls(backend, "batchUpdate")) == 3
+    assert [r["updatedRange"] for r in results] == [f"Sheet1!A{i + 1}" for i in range(5)]
+    assert backend.values(api.id, "A1:A5") == [[0], [1], [2], [3], [4]]
+
+    backend = FakeBackend()
+    api = backend.sheets_api()
+    data = [("A1", [["x" * 100]]), ("A2", [["y" * 100]]), ("A3", [["z"]])]
+    assert all(api.batch_update_values(data, max_bytes=200))
+    assert len(_batch_calls(backend, "batchUpdate")) == 2
+
+
+def test_batch_update_values_partial_failure():
+    backend = FakeBackend()
+    api = backend.sheets_api()
+    backend.fail_next(400)
+    results = api.batch_update_values([("A1", [[1]]), ("A2", [[2]]), ("A3", [[3]])], max_ranges=2)
+    assert results[:2] == [None, None]
+    assert results[2]["updatedCells"] == 1
+    assert backend.values(api.id, "A1:A3") == [[], [], [3]]
+
+
+def test_batch_get_values_chunks():
+    backend = FakeBackend()
+    api = backend.sheets_api()
+    assert api.update_values([[1], [2], [3]], "A1:A3")
+    assert api.batch_get_values(["A1", "A2", "A3", "B1"], max_ranges=3) == [[["1"]], [["2"]], [["3"]], []]
+    assert len(_batch_calls(backend, "batchGet")) == 2
+
+
+def test_batch_get_values_partial_failure():
+    backend = FakeBackend()
+    api = backend.sheets_api()
+    assert api.update_values([[1], [2], [3]], "A1:A3")
+    backend.fail_next(400)
+    assert api.batch_get_values(["A1", "A2", "A3"], max_ranges=2) == [None, None, [["3"]]]
+
+
+def test_batch_get_values_missing_range():
+    backend = FakeBackend()
+    api = backend.sheets_api()
+    assert api.update_values([[1], [2]], "A1:A2")
+    execute = api._execute
+
+    def truncated(request):
+        result = execute(request)
+        result["valueRanges"] = result["valueRanges"][:1]
+        return result
+
+    api._execute = truncated
+    assert api.batch_get_values(["A1", "A2"]) == [[["1"]], None]
@@ -0,0 +1,53 @@
+from py2gsuite.api.sheets import SheetsAPI
+
+
+def _api(pages):
+    api = SheetsAPI.__new__(SheetsAPI)
+    api.id = "dummy"
+    requested = []
+
+    def batch_get_values(ranges, **kwargs):
+        # NOTE: Each page is fetched with its own call, so the size of a response is bounded by a page.
+        assert len(ranges) == 1
+        requested.extend(ranges)
+        return [pages.get(r, []) for r in ranges]
+
+    api.batch_get_values = batch_get_values
+    api._grid_size = lambda sheet, sheet_id: (7, 26)
+    return api, requested
+
+
+def test_read_columns():
+    pages = {
+        "S!A1:C3": [["a", "a", None], [1, "x"], []],
+        "S!A4:C6": [[3, "z", True]],
+    }
+    api, requested = _api(pages)
+    data = api.read_columns("S!A1:C", page_rows=3)
+    assert requested == ["S!A1:C3", "S!A4:C6", "S!A7:C7"]
+    assert data == {"a": [1, None, 3], "a.1": ["x", None, "z"], "C": [None, None, True]}
+
+    data = api.read_columns("S!A1:C", header=False, page_rows=3)
+    assert list(data) == ["A", "B", "C"]
+    assert data["A"] == ["a", 1, None, 3]
+
+
+def test_read_columns_empty_rows():
+    pages = {
+        "A1:B2": [["x", "y"]],
+        "A5:B6": [[], [1]],
+        "A7:B8": [[2, 3]],
+    }
+    api, requested = _api(pages)
+    data = api.read_columns("A1:B10", page_rows=2)
+    assert len(requested) == 5
+    assert data == {"x": [None, None, None, None, 1, 2], "y": [None, None, None, None, None, 3]}
+
+
+def test_read_frame():
+    api, _ = _api({"A1:B4": [["n", "s"], [1, "x"], ["", "y"], [2.5]]})
+    df = api.read_frame("A1:B4")
+    assert list(df.columns) == ["n", "s"]
+    assert df["n"].dtype.kind == "f"
+    assert df["n"].isna().tolist() == [False, True, False]
+    assert df["s"].tolist()[:2] == ["x", "y"]
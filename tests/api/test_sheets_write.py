@@ -0,0 +1,30 @@
+from py2gsuite.testing import FakeBackend
+
+
+def test_write_rows():
+    backend = FakeBackend()
+    api = backend.sheets_api()
+    reports = []
+    rows = ([i, f"r{i}"] if i % 2 else [i] for i in range(5))
+    assert api.write_rows(rows, "Sheet1!B2:D", chunk_rows=2, callback=reports.append)
+    assert [r.range_name for r in reports] == ["Sheet1!B2:C3", "Sheet1!B4:C5", "Sheet1!B6"]
+    assert [(r.index, r.rows) for r in reports] == [(0, 2), (1, 2), (2, 1)]
+    assert backend.values(api.id, "Sheet1!B2:C6") == [[0], [1, "r1"], [2], [3, "r3"], [4]]
+    assert len([method for method, _ in backend.calls if method == "PUT"]) == 3
+
+
+def test_write_rows_stops_on_failure():
+    backend = FakeBackend()
+    api = backend.sheets_api()
+    pulled = []
+
+    def rows():
+        for i in range(6):
+            pulled.append(i)
+            yield [i]
+
+    # The second chunk fails, so the cursor stops there and the last row is never pulled.
+    assert not api.write_rows(rows(), "A1", chunk_rows=2, callback=lambda report: backend.fail_next(400))
+    assert backend.values(api.id, "A1:A6") == [[0], [1]]
+    assert len([method for method, _ in backend.calls if method == "PUT"]) == 2
+    assert 5 not in pulled
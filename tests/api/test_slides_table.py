@@ -0,0 +1,56 @@
+from py2gsuite.api.slides import (
+    CellStyle,
+    SlidesAPI,
+    insert_table_requests,
+    style_table_requests,
+)
+
+
+def _api():
+    api = SlidesAPI.__new__(SlidesAPI)
+    api.id = "dummy"
+    api._batch = None
+    api._index = None
+    api._placed = {}
+    posted = []
+
+    def post(requests):
+        posted.append(requests)
+        return {"replies": [{"createTable": {"objectId": "t"}}] + [{}] * (len(requests) - 1)}
+
+    api._SlidesAPI__post_update = post
+    return api, posted
+
+
+def test_insert_table_requests():
+    requests = insert_table_requests([["a", ""], [None, 1]], "t")
+    assert [r["insertText"]["cellLocation"] for r in requests] == [
+        {"rowIndex": 0, "columnIndex": 0},
+        {"rowIndex": 1, "columnIndex": 1},
+    ]
+    assert requests[1]["insertText"]["text"] == "1"
+
+
+def test_style_table_requests():
+    styles = [CellStyle({"contentAlignment": "MIDDLE"}), CellStyle({"contentAlignment": "TOP"}, row=1, col_span=2)]
+    requests = style_table_requests(styles, "t", rows=4, cols=3)
+    ranges = [r["updateTableCellProperties"]["tableRange"] for r in requests]
+    assert [(r["rowSpan"], r["columnSpan"]) for r in ranges] == [(4, 3), (3, 2)]
+    assert requests[0]["updateTableCellProperties"]["fields"] == "contentAlignment"
+
+
+def test_add_table_single_request():
+    api, posted = _api()
+    values = [[f"{i}-{j}" for j in range(20)] for i in range(40)]
+    assert api.add_table(values, page_id="p1", styles=[CellStyle({"contentAlignment": "MIDDLE"}, row=0, row_span=1)])
+    assert len(posted) == 1
+    assert "createTable" in posted[0][0]
+    assert len(posted[0]) == 1 + 800 + 1
+
+
+def test_add_table_split():
+    api, posted = _api()
+    values = [[str(j) for j in range(10)] for _ in range(10)]
+    assert api.add_table(values, page_id="p1", max_requests=40)
+    assert [len(r) for r in posted] == [40, 40, 21]
+    assert "createTable" in posted[0][0]
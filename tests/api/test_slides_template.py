@@ -0,0 +1,132 @@
+from py2gsuite.api.slides import SlideElement, SlidesAPI, template_requests
+from py2gsuite.utils.layout import element_box
+
+
+class DummyPresentations:
+    def get(self, presentationId, fields):
+        return {"slides": [{"objectId": "cover"}, {"objectId": "tmpl"}, {"objectId": "end"}]}
+
+
+def _api():
+    api = SlidesAPI.__new__(SlidesAPI)
+    api.id = "dummy"
+    api._batch = None
+    api._index = None
+    api._placed = {}
+    api._SlidesAPI__presentations = DummyPresentations()
+    api._execute = lambda request: request
+    posted = []
+
+    def post(requests):
+        posted.append(requests)
+        return {"replies": [{kind: {"objectId": body.get("objectId")}} for r in requests for kind, body in r.items()]}
+
+    api._SlidesAPI__post_update = post
+    return api, posted
+
+
+def test_template_requests():
+    requests = template_requests("tmpl", "new", {"name": "Alice", "logo": "http://x/logo.png", "note": None}, ["logo"])
+    assert requests[0] == {"duplicateObject": {"objectId": "tmpl", "objectIds": {"tmpl": "new"}}}
+    assert requests[1]["replaceAllText"]["containsText"]["text"] == "{{name}}"
+    assert requests[1]["replaceAllText"]["pageObjectIds"] == ["new"]
+    assert requests[2]["replaceAllShapesWithImage"]["imageUrl"] == "http://x/logo.png"
+    assert requests[3]["replaceAllText"]["replaceText"] == ""
+
+
+def test_render_template():
+    api, posted = _api()
+    records = ({"name": str(i)} for i in range(1000))
+    page_ids = api.render_template("tmpl", records, max_requests=500, delete_template=True)
+    assert len(page_ids) == 1000
+    assert len(posted) == 5 + 1
+    assert all(len(requests) <= 500 for requests in posted)
+
+    moves = [requests[-1]["updateSlidesPosition"] for requests in posted[:-1]]
+    assert moves[0]["slideObjectIds"] == page_ids[:249]
+    assert moves[0]["insertionIndex"] == 2 + 249
+    assert moves[1]["insertionIndex"] == 2 + 249 + 249
+    assert posted[-1] == [{"deleteObject": {"objectId": "tmpl"}}]
+
+
+def test_render_template_order():
+    api, posted = _api()
+    page_ids = api.render_template("tmpl", [{"name": str(i)} for i in range(3)])
+    requests = posted[0]
+
+    # Each duplicate is inserted right after the template, as the Slides API does.
+    slides = ["cover", "tmpl", "end"]
+    for request in requests:
+        if "duplicateObject" in request:
+            slides.insert(slides.index("tmpl") + 1, request["duplicateObject"]["objectIds"]["tmpl"])
+    assert slides == ["cover", "tmpl"] + page_ids + ["end"]
+
+    # slideObjectIds must be in existing presentation order.
+    move = requests[-1]["updateSlidesPosition"]
+    assert move["slideObjectIds"] == page_ids
+    assert move["insertionIndex"] == 2 + 3
+
+
+def test_render_template_not_found():
+    api, posted = _api()
+    assert api.render_template("missing", [{"name": "a"}]) is None
+    assert posted == []
+
+
+def test_exists_page_and_first_page():
+    api, posted = _api()
+    assert api.exists_page("tmpl") and not api.exists_page("missing")
+    assert api.add_text("Hello", element_id="t1")
+    assert posted[0][0]["createShape"]["elementProperties"]["pageObjectId"] == "cover"
+
+
+def test_add_elements():
+    api, posted = _api()
+    elements = [SlideElement("text", str(i)) for i in range(5)] + [SlideElement("image", "http://x/a.png")]
+    assert api.add_elements(elements, page_id="cover")
+    assert len(posted) == 1
+
+    boxes = [
+        element_box(r[k]["elementProperties"]["size"], r[k]["elementProperties"]["transform"])
+        for r in posted[0]
+        for k in r
+        if k in ("createShape", "createImage")
+    ]
+    assert len(boxes) == 6
+    assert not any(a.overlaps(b) for i, a in enumerate(boxes) for b in boxes[i + 1 :])
+
+
+def test_add_text_no_overlap_in_batch():
+    api, posted = _api()
+    with api.batch():
+        api.add_text("a", page_id="cover")
+        api.add_text("b", page_id="cover")
+    transforms = [r["createShape"]["elementProperties"]["transform"] for r in posted[0] if "createShape" in r]
+    assert transforms[0] != transforms[1]
+
+
+def test_batch_handles():
+    api, posted = _api()
+    with api.batch(max_requests=3) as batch:
+        assert api.create_slide("s1")
+        assert api.add_text("a", page_id="s1", element_id="t1")
+        assert api.create_slide("s2")
+        assert not posted
+    # Requests of an operation are never split, so calls are cut at max_requests on operation boundaries.
+    assert [len(requests) for requests in posted] == [3, 1]
+    assert [handle.ok for handle in batch.handles] == [True, True, True]
+    assert [handle.object_id for handle in batch.handles] == ["s1", "t1", "s2"]
+    assert batch.handles[1].replies == [{"createShape": {"objectId": "t1"}}, {"insertText": {"objectId": "t1"}}]
+
+
+def test_batch_failure(caplog):
+    api, posted = _api()
+    post = api._SlidesAPI__post_update
+    api._SlidesAPI__post_update = lambda requests: None if len(posted) == 1 else post(requests)
+    with api.batch(max_requests=2) as batch:
+        api.create_slide("s1")
+        api.create_slide("s2")
+        api.create_slide("s3")
+    assert [handle.ok for handle in batch.handles] == [True, True, False]
+    assert batch.handles[2].object_id is None
+    assert "1 of 3 queued operations failed" in caplog.text
@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+
+from py2gsuite.api.transport import HttpPool, PooledHttp
+
+
+class DummyHttp:
+    def __init__(self):
+        self.requests = []
+        self.closed = 0
+
+    def request(self, uri, method="GET", *args, **kwargs):
+        self.requests.append((uri, method))
+        return {"status": "200"}, b"{}"
+
+    def close(self):
+        self.closed += 1
+
+
+def test_pool_reuses_instances():
+    pool = HttpPool(max_size=2, factory=DummyHttp)
+    http = PooledHttp(pool)
+    for _ in range(5):
+        http.request("https://example.com")
+    assert pool.size == 1
+
+
+def test_pool_is_bounded():
+    pool = HttpPool(max_size=2, timeout=0.01, factory=DummyHttp)
+    with pool.checkout() as h1, pool.checkout() as h2:
+        assert h1 is not h2
+        with pytest.raises(TimeoutError):
+            with pool.checkout():
+                pass
+    assert pool.size == 2
+
+
+def test_pool_threads():
+    pool = HttpPool(max_size=4, factory=DummyHttp)
+    http = PooledHttp(pool)
+
+    def run():
+        for _ in range(50):
+            http.request("https://example.com")
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert pool.size <= 4
+
+
+def test_pool_discards_connections_on_error():
+    pool = HttpPool(max_size=1, factory=DummyHttp)
+    with pytest.raises(RuntimeError):
+        with pool.checkout() as http:
+            raise RuntimeError
+    assert http.closed == 1
+    with pool.checkout() as reused:
+        assert reused is http
@@ -0,0 +1,87 @@
+"""Offline throughput benchmarks on the fake backend. Run with `pytest tests/benchmarks --benchmark-only`."""
+
+import subprocess
+import sys
+
+import pytest
+
+from py2gsuite.testing import FakeBackend
+from py2gsuite.utils.format import class2dict
+
+pytest.importorskip("pytest_benchmark")
+
+ROWS = [[f"r{i}", i, i * 0.5, i % 2 == 0, "x" * 20] for i in range(20000)]
+
+
+@pytest.fixture
+def sheets():
+    return FakeBackend().sheets_api()
+
+
+@pytest.fixture
+def slides():
+    return FakeBackend().slides_api()
+
+
+def test_write_rows(benchmark, sheets):
+    reports = []
+    assert benchmark(sheets.write_rows, ROWS, "Sheet1!A1", chunk_rows=5000, callback=reports.append)
+    assert sum(r.rows for r in reports[-4:]) == len(ROWS)
+
+
+def test_batch_update_values(benchmark, sheets):
+    data = [(f"A{i * 10 + 1}:E{i * 10 + 10}", ROWS[i * 10 : i * 10 + 10]) for i in range(500)]
+    results = benchmark(sheets.batch_update_values, data)
+    assert all(results)
+
+
+def test_sync_values(benchmark, sheets, tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    rows = [list(row) for row in ROWS[:5000]]
+    sheets.sync_values(rows, path)
+    rows[100][1] = "changed"
+    assert benchmark(sheets.sync_values, rows, path) is not None
+
+
+def test_add_table(benchmark, slides):
+    values = [[f"{i}-{j}" for j in range(20)] for i in range(40)]
+    assert benchmark(slides.add_table, values)
+
+
+def test_render_template(benchmark, slides):
+    slides.add_text("{{name}} - {{score}}", element_id="title")
+    records = [{"name": f"user{i}", "score": i} for i in range(1000)]
+    page_ids = benchmark.pedantic(slides.render_template, args=("p", records), rounds=1, iterations=1)
+    assert len(page_ids) == len(records)
+
+
+def test_import_time(benchmark):
+    # Import in a fresh interpreter, as the package is already imported here.
+    code = "import py2gsuite, py2gsuite.utils"
+    benchmark.pedantic(subprocess.run, ([sys.executable, "-c", code],), {"check": True}, rounds=5)
+    # Regression guard: the interpreter itself takes ~20ms, eager imports of google libraries take ~500ms.
+    if not benchmark.disabled:
+        assert benchmark.stats.stats.min < 0.3
+
+
+def test_class2dict(benchmark):
+    class Node:
+        def __init__(self, i):
+            self.id = i
+            self.name = f"n{i}"
+            self.tags = ["a", "b"]
+            self.children = []
+
+    nodes = [Node(i) for i in range(100000)]
+    for i in range(1, len(nodes)):
+        nodes[(i - 1) // 10].children.append(nodes[i])
+    out = benchmark(class2dict, nodes[0])
+    assert len(out["children"]) == 10
+
+
+def test_write_records(benchmark, sheets):
+    def records():
+        for i in range(20000):
+            yield {"id": i, "user": {"name": f"u{i}", "age": i % 100}, "tags": ["a", "b"]}
+
+    assert benchmark(sheets.write_records, records(), "Sheet1!A1", chunk_rows=5000)
@@ -0,0 +1,41 @@
+import subprocess
+import sys
+
+import pytest
+
+import py2gsuite
+
+HEAVY_MODULES = (
+    "googleapiclient",
+    "google_auth_oauthlib",
+    "google.oauth2",
+    "coloredlogs",
+    "pkg_resources",
+    "opentelemetry",
+)
+
+
+def _imported_modules(statement: str):
+    code = f"import sys; {statement}; print(' '.join(sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return set(out.split())
+
+
+def test_import_is_lazy():
+    modules = _imported_modules("import py2gsuite, py2gsuite.utils, py2gsuite.api.metrics")
+    assert not [name for name in HEAVY_MODULES if name in modules]
+
+    modules = _imported_modules("from py2gsuite import SheetsAPI")
+    assert "googleapiclient" in modules
+    assert "opentelemetry" not in modules
+
+
+def test_lazy_attributes():
+    assert py2gsuite.__version__
+    assert py2gsuite.SheetsAPI.__module__ == "py2gsuite.api.sheets"
+    assert "SlidesAPI" in dir(py2gsuite)
+    assert py2gsuite.utils.CredentialProvider.__module__ == "py2gsuite.utils.credential"
+    assert "get_credential" in dir(py2gsuite.utils)
+
+    with pytest.raises(AttributeError, match="has no attribute 'missing'"):
+        py2gsuite.api.missing
@@ -0,0 +1,84 @@
+import json
+import threading
+
+import httplib2
+import pytest
+from google.oauth2.credentials import Credentials
+
+from py2gsuite.api.retry import get_default_retry_policy, set_default_retry_policy
+from py2gsuite.api.transport import HttpPool
+from py2gsuite.parallel import map_sheets
+
+
+class DummyHttp:
+    def request(self, uri, method="GET", body=None, headers=None, **kwargs):
+        if "/fail/" in uri:
+            return httplib2.Response({"status": "500"}), b"{}"
+        return httplib2.Response({"status": "200"}), json.dumps({"updatedCells": 1}).encode()
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def no_retry():
+    policy = get_default_retry_policy()
+    set_default_retry_policy(None)
+    yield
+    set_default_retry_policy(policy)
+
+
+def test_map_sheets(no_retry):
+    threads = set()
+
+    def func(api):
+        threads.add(threading.get_ident())
+        return api.update_values([["1"]], "A1")
+
+    ids = [f"sheet{i}" for i in range(20)] + ["fail"]
+    progress = []
+    result = map_sheets(
+        func,
+        Credentials(token="dummy"),
+        ids,
+        workers=4,
+        progress=lambda done, total: progress.append((done, total)),
+        pool=HttpPool(max_size=4, factory=DummyHttp),
+    )
+    assert len(result.successes) == 20
+    assert list(result.failures) == ["fail"]
+    assert not result.ok
+    assert progress[-1] == (21, 21)
+    assert 1 <= len(threads) <= 4
+
+
+def test_map_sheets_close_pool(monkeypatch):
+    closed = []
+
+    class Pool(HttpPool):
+        def __init__(self, max_size):
+            super().__init__(max_size=max_size, factory=DummyHttp)
+
+        def close(self):
+            closed.append(self)
+            super().close()
+
+    monkeypatch.setattr("py2gsuite.parallel.HttpPool", Pool)
+    result = map_sheets(lambda api: api.update_values([["1"]], "A1"), Credentials(token="dummy"), ["sheet"], workers=2)
+    assert result.ok
+    assert len(closed) == 1
+
+    map_sheets(lambda api: True, Credentials(token="dummy"), ["sheet"], pool=Pool(max_size=1))
+    assert len(closed) == 1
+
+
+def test_map_sheets_none_fails():
+    results = {"ok": 0, "false": False, "none": None}
+    result = map_sheets(
+        lambda api: results[api.id],
+        Credentials(token="dummy"),
+        list(results),
+        pool=HttpPool(max_size=1, factory=DummyHttp),
+    )
+    assert list(result.successes) == ["ok"]
+    assert sorted(result.failures) == ["false", "none"]
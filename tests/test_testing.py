@@ -0,0 +1,75 @@
+import pytest
+
+from py2gsuite.api.retry import RetryPolicy
+from py2gsuite.testing import FakeBackend
+
+
+def test_fake_sheets():
+    backend = FakeBackend()
+    api = backend.sheets_api()
+    assert api.update_values([["a", "b"], [1, 2]], "A1:B2")
+    assert api.add_values([["c", "d"]], "A1:B1")
+    assert backend.values(api.id, "A1:B5") == [["a", "b"], [1, 2], ["c", "d"]]
+    assert api.batch_get_values(["A2:B2", "A3"]) == [[["1", "2"]], [["c"]]]
+    assert api.read_columns("A1:B") == {"a": [1, "c"], "b": [2, "d"]}
+    assert api.is_empty("C1:D3")
+
+
+def test_fake_slides():
+    backend = FakeBackend()
+    api = backend.slides_api()
+    assert api.exists_page("p")
+    assert api.add_table([["a", "b"], ["c", "d"]])
+    page_ids = api.render_template("p", [{"name": "x"}, {"name": "y"}])
+    assert [s["objectId"] for s in backend.presentations[api.id]["slides"]] == ["p"] + page_ids
+
+    # batchUpdate is atomic: nothing is applied if a request is invalid.
+    assert not api.add_table([["a"]], table_id="missing")
+    assert len(backend.presentations[api.id]["slides"]) == 3
+
+
+def test_fake_errors_and_quota():
+    backend = FakeBackend(quota=(2, 60.0))
+    api = backend.sheets_api()
+    api.retry_policy = RetryPolicy(max_attempts=1)
+    assert api.update_values([["a"]], "A1")
+    assert api.update_values([["a"]], "A1")
+    assert not api.update_values([["a"]], "A1")
+    assert api.last_call.status == 429
+
+    backend = FakeBackend()
+    api = backend.sheets_api()
+    api.retry_policy = RetryPolicy(max_attempts=3, backoff_base=0.0)
+    backend.fail_next(503, count=2)
+    assert api.update_values([["a"]], "A1")
+    assert api.last_call.retries == 2
+
+
+def test_fake_latency():
+    backend = FakeBackend(latency=0.05)
+    api = backend.sheets_api()
+    assert api.update_values([["a"]], "A1")
+    assert api.last_call.elapsed == pytest.approx(0.05, abs=0.04)
+
+
+def test_fake_write_records():
+    backend = FakeBackend()
+    api = backend.sheets_api()
+    records = ({"id": i, "user": {"name": f"u{i}"}} for i in range(5))
+    extra = [{"id": 5, "user": {"name": "u5", "age": 20}}]
+    assert api.write_records(list(records) + extra, "A1", sample=2, chunk_rows=2)
+    values = backend.values(api.id, "A1:C7")
+    assert values[0] == ["id", "user.name", "user.age"]
+    assert values[1] == [0, "u0"]
+    assert values[6] == [5, "u5", 20]
+
+
+def test_fake_slides_position_order():
+    backend = FakeBackend()
+    api = backend.slides_api()
+    assert api.create_slide("s1") and api.create_slide("s2")
+    move = {"updateSlidesPosition": {"slideObjectIds": ["s2", "s1"], "insertionIndex": 0}}
+    assert api._SlidesAPI__post_update([move]) is None
+    move["updateSlidesPosition"]["slideObjectIds"] = ["s1", "s2"]
+    assert api._SlidesAPI__post_update([move]) is not None
+    assert [s["objectId"] for s in backend.presentations[api.id]["slides"]] == ["s1", "s2", "p"]
@@ -0,0 +1,99 @@
+import pytest
+
+from py2gsuite.utils.a1 import (
+    A1Range,
+    column_to_letter,
+    format_range,
+    letter_to_column,
+    merge_ranges,
+    parse_cell,
+    parse_range,
+    split_sheet,
+)
+
+
+def test_column_to_letter():
+    assert column_to_letter(1) == "A"
+    assert column_to_letter(26) == "Z"
+    assert column_to_letter(27) == "AA"
+    assert column_to_letter(703) == "AAA"
+    with pytest.raises(ValueError):
+        column_to_letter(0)
+
+
+def test_letter_to_column():
+    assert letter_to_column("A") == 1
+    assert letter_to_column("z") == 26
+    assert letter_to_column("AA") == 27
+    assert all(letter_to_column(column_to_letter(i)) == i for i in range(1, 1000))
+
+
+def test_split_sheet():
+    assert split_sheet("A1:C3") == (None, "A1:C3")
+    assert split_sheet("Sheet1!A1:C3") == ("Sheet1", "A1:C3")
+
+
+def test_parse_cell():
+    assert parse_cell("B3") == (3, 2)
+    assert parse_cell("$AA$10") == (10, 27)
+    assert parse_cell("C") == (1, 3)
+    with pytest.raises(ValueError):
+        parse_cell("3B")
+
+
+def test_format_range():
+    assert format_range(1, 1, 3, 3) == "A1:C3"
+    assert format_range(2, 2, 1, 1) == "B2"
+    assert format_range(1001, 1, 1000, 2, sheet="Sheet1") == "Sheet1!A1001:B2000"
+
+
+def test_parse_range():
+    assert parse_range("Sheet1!A1:C3") == ("Sheet1", 1, 1, 3, 3)
+    assert parse_range("A2:C") == (None, 2, 1, None, 3)
+    assert parse_range("B3") == (None, 3, 2, 3, 2)
+    assert parse_range("A:B") == (None, 1, 1, None, 2)
+
+
+def test_a1_range_parse():
+    assert A1Range.parse("Sheet1!A1:C3") == A1Range(1, 1, 3, 3, "Sheet1")
+    assert A1Range.parse("'My ''Sheet'''!B2") == A1Range(2, 2, 2, 2, "My 'Sheet'")
+    assert A1Range.parse("R2C1:R3C4") == A1Range(2, 1, 3, 4)
+    assert A1Range.parse("Sheet1!R2C1:C3") == A1Range(2, 1, None, 3, "Sheet1")
+    for name in ("A1:C3", "B2", "A2:C", "Sheet1!A1:B2", "'My Sheet'!A1:B2"):
+        assert str(A1Range.parse(name)) == name
+        assert A1Range.parse(A1Range.parse(name).to_r1c1()) == A1Range.parse(name)
+
+
+def test_a1_range_algebra():
+    r = A1Range.parse("Sheet1!B2:D5")
+    assert (r.num_rows, r.num_cols) == (4, 3)
+    assert str(r.start) == "Sheet1!B2"
+    assert str(r.offset(2, 1)) == "Sheet1!C4:E7"
+    assert str(r.start.resize(1, 3)) == "Sheet1!B2:D2"
+    assert [str(t) for t in r.split(max_rows=3, max_cols=2)] == [
+        "Sheet1!B2:C4",
+        "Sheet1!D2:D4",
+        "Sheet1!B5:C5",
+        "Sheet1!D5",
+    ]
+    assert r.contains(A1Range.parse("Sheet1!C3"))
+    assert not r.contains(A1Range.parse("C3"))
+    assert r.intersects(A1Range.parse("Sheet1!D5:F9"))
+    assert not r.intersects(A1Range.parse("Sheet1!E1:F9"))
+    with pytest.raises(ValueError):
+        r.offset(-2)
+    with pytest.raises(ValueError):
+        list(A1Range.parse("A2:C").split(max_rows=10))
+
+
+def test_merge_ranges():
+    ranges = [A1Range.parse(name) for name in ("A3:B5", "A1:B2", "C1:C5", "E1", "A7:A")]
+    assert [str(r) for r in merge_ranges(ranges)] == ["A1:C5", "E1", "A7:A"]
+    assert str(A1Range.parse("A1:B2").merge(A1Range.parse("C1:D2"))) == "A1:D2"
+    assert str(A1Range.parse("A1:B2").merge(A1Range.parse("A1"))) == "A1:B2"
+    assert str(A1Range.parse("B2").merge(A1Range.parse("A1:C3"))) == "A1:C3"
+    assert [str(r) for r in merge_ranges(A1Range.parse(r) for r in ["A1:A", "A1:B", "B3", "A1:B"])] == ["A1:B"]
+    assert [str(r) for r in merge_ranges(A1Range.parse(r) for r in ["A1:A2", "B1:B2", "A3:B3"])] == ["A1:B3"]
+    assert [str(r) for r in merge_ranges(A1Range.parse(r) for r in ["A1", "B1", "A2:B2"])] == ["A1:B2"]
+    with pytest.raises(ValueError):
+        A1Range.parse("A1:B2").merge(A1Range.parse("C1:D3"))
@@ -0,0 +1,22 @@
+from py2gsuite.utils.chunk import iter_chunks, json_size
+
+
+def test_json_size():
+    assert json_size(["a", 1]) == len('["a", 1]')
+
+
+def test_iter_chunks_by_items():
+    chunks = [c for c, _ in iter_chunks(range(10), max_items=4)]
+    assert chunks == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+
+def test_iter_chunks_by_bytes():
+    rows = (["x" * 8] for _ in range(5))  # 12 bytes per row
+    out = list(iter_chunks(rows, max_items=100, max_bytes=30))
+    assert [len(c) for c, _ in out] == [2, 2, 1]
+    assert [n for _, n in out] == [24, 24, 12]
+
+
+def test_iter_chunks_oversized_item():
+    out = [c for c, _ in iter_chunks(["x" * 100, "y"], max_items=10, max_bytes=10)]
+    assert out == [["x" * 100], ["y"]]
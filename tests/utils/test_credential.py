@@ -0,0 +1,151 @@
+import datetime
+import json
+import os
+import stat
+import threading
+
+from google.oauth2.credentials import Credentials
+
+from py2gsuite.utils import credential
+from py2gsuite.utils.credential import (
+    CredentialProvider,
+    SharedTokenStore,
+    get_credential,
+    get_credential_from_token,
+)
+from py2gsuite.utils.types import CredentialType, ScopeType
+
+
+class DummyCredentials(Credentials):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.refreshed = threading.Event()
+
+    def refresh(self, request):
+        self.token = "refreshed"
+        self.expiry = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+        self.refreshed.set()
+
+
+def _creds(cls=Credentials, seconds=3600):
+    return cls(
+        token="token",
+        refresh_token="refresh",
+        client_id="id",
+        client_secret="secret",
+        token_uri="https://oauth2.googleapis.com/token",
+        expiry=datetime.datetime.utcnow() + datetime.timedelta(seconds=seconds),
+    )
+
+
+def test_token_cache(tmp_path):
+    token_path = str(tmp_path / "tokens" / "token.json")
+    provider = CredentialProvider("unused.json", ScopeType.DRIVE, token_path=token_path)
+    provider._creds = _creds()
+    provider.save()
+    assert stat.S_IMODE(os.stat(token_path).st_mode) == 0o600
+
+    loaded = CredentialProvider("unused.json", ScopeType.DRIVE, token_path=token_path).get()
+    assert loaded.token == "token" and loaded.valid
+
+    creds = get_credential_from_token(ScopeType.DRIVE, token_path=token_path)
+    assert creds.refresh_token == "refresh"
+
+
+def test_default_token_path(tmp_path, monkeypatch):
+    class DummyFlow:
+        @classmethod
+        def from_client_secrets_file(cls, credential_file, scopes):
+            return cls()
+
+        def run_local_server(self, host, port):
+            return _creds()
+
+    monkeypatch.setattr("google_auth_oauthlib.flow.InstalledAppFlow", DummyFlow)
+    monkeypatch.setattr(credential, "_providers", {})
+    credential.set_token_dir(str(tmp_path))
+    try:
+        secrets = tmp_path / "secrets.json"
+        secrets.write_text("{}")
+        creds = get_credential(str(secrets), scope=ScopeType.SHEETS_EDITABLE, cache_token=True)
+        loaded = get_credential_from_token(ScopeType.SHEETS_EDITABLE)
+        assert loaded.token == creds.token and loaded.refresh_token == "refresh"
+    finally:
+        credential.set_token_dir(None)
+
+
+def test_background_refresh(tmp_path):
+    provider = CredentialProvider("unused.json", ScopeType.DRIVE, refresh_margin=0.5)
+    creds = _creds(DummyCredentials, seconds=1)
+    provider._creds = creds
+    assert provider.get() is creds
+    provider.start_refresh()
+    try:
+        assert creds.refreshed.wait(5)
+        assert creds.token == "refreshed"
+        assert provider.seconds_until_refresh() > 60
+    finally:
+        provider.stop_refresh()
+
+
+def test_api_key(tmp_path):
+    key_file = tmp_path / "key.json"
+    key_file.write_text('{"api_key": "secret-key"}')
+    creds = get_credential(str(key_file), CredentialType.API_KEYS)
+    headers = {}
+    creds.before_request(None, "GET", "https://sheets.googleapis.com", headers)
+    assert headers == {"x-goog-api-key": "secret-key"}
+    assert creds.valid
+
+
+def test_shared_token_store(tmp_path):
+    store = SharedTokenStore(str(tmp_path))
+    fetched = []
+
+    def fetch(creds):
+        def _fetch():
+            fetched.append(creds)
+            creds.token = "shared"
+            creds.expiry = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+
+        return _fetch
+
+    creds1, creds2 = _creds(), _creds()
+    store.refresh("key", creds1, fetch(creds1))
+    store.refresh("key", creds2, fetch(creds2))
+    assert fetched == [creds1]
+    assert creds2.token == "shared" and creds2.expiry == creds1.expiry
+
+
+def test_service_account(tmp_path):
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    pem = key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    info = {
+        "type": "service_account",
+        "client_email": "worker@project.iam.gserviceaccount.com",
+        "private_key": pem.decode(),
+        "private_key_id": "1",
+        "token_uri": "https://oauth2.googleapis.com/token",
+    }
+    key_file = tmp_path / "sa.json"
+    key_file.write_text(json.dumps(info))
+
+    store = SharedTokenStore(str(tmp_path / "store"))
+    creds = get_credential(
+        str(key_file), CredentialType.SERVICE_ACCOUNT, ScopeType.DRIVE, subject="user@example.com", token_store=store
+    )
+    assert creds._subject == "user@example.com"
+
+    # Token stored by another process is reused without token exchange.
+    other = _creds()
+    store.refresh(creds._store_key, other, lambda: setattr(other, "token", "from-other") or None)
+    creds.refresh(None)
+    assert creds.token == "from-other" and creds.valid
+
+    # Copies made by google-auth keep the store, under the key of their own identity.
+    copied = creds.with_subject("other@example.com")
+    assert copied._store is store
+    assert copied._store_key != creds._store_key
@@ -0,0 +1,56 @@
+import dataclasses
+from enum import Enum
+
+import pytest
+
+from py2gsuite.utils.flatten import RecordFlattener, flatten_record
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclasses.dataclass
+class User:
+    name: str
+    age: int
+
+
+@dataclasses.dataclass
+class Order:
+    id: int
+    user: User
+    items: list
+    color: Color = Color.RED
+    note: str = None
+
+
+def test_flatten_record():
+    record = Order(1, User("Bob", 50), ["a", "b"])
+    assert flatten_record(record) == {
+        "id": 1,
+        "user.name": "Bob",
+        "user.age": 50,
+        "items": '["a", "b"]',
+        "color": "Color.RED",
+        "note": "",
+    }
+    assert flatten_record({"a": {"b": {"c": 1}}, "d": {}}, sep="/") == {"a/b/c": 1, "d": ""}
+    with pytest.raises(TypeError):
+        flatten_record([1, 2])
+
+
+def test_rows():
+    def records():
+        yield {"a": 1, "b": {"c": 2}}
+        yield {"b": {"c": 3}, "a": 4}
+        yield {"a": 5, "d": 6}
+
+    flattener = RecordFlattener(sample=2)
+    rows = flattener.rows(records(), header=True)
+    assert next(rows) == ["a", "b.c"]
+    assert list(rows) == [[1, 2], [4, 3], [5, "", 6]]
+    assert flattener.columns == ["a", "b.c", "d"]
+
+    flattener = RecordFlattener(columns=["d", "a"], extend=False)
+    assert list(flattener.rows(records())) == [["", 1], ["", 4], [6, 5]]
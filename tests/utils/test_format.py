@@ -34,3 +34,60 @@ def test_dict2list():
     d = {"age": 50, "name": "Bob", "height": 180, "country": "USA"}
     out1 = dict2list(d, ["age", "height", "country"])
     assert out1 == ["50", "180", "USA"]
+
+
+def test_class2dict_types():
+    import dataclasses
+    from collections import namedtuple
+    from enum import Enum
+
+    class Color(Enum):
+        RED = "red"
+
+    @dataclasses.dataclass
+    class Item:
+        name: str
+        color: Color
+        _hidden: int = 0
+
+    class Slotted:
+        __slots__ = ("x", "y", "_z")
+
+        def __init__(self):
+            self.x = 1
+            self._z = 2
+
+    Point = namedtuple("Point", ["x", "y"])
+
+    out = class2dict({"item": Item("a", Color.RED), "slotted": Slotted(), "point": Point(1, 2)}, class_key="type")
+    assert out == {
+        "item": {"name": "a", "color": "Color.RED", "type": "Item"},
+        "slotted": {"x": 1, "type": "Slotted"},
+        "point": {"x": 1, "y": 2, "type": "Point"},
+    }
+    assert class2dict((i for i in range(3))) == [0, 1, 2]
+    assert class2dict([1, 2, 3], abbreviation=2) == " --- length of element 3 ---,"
+
+
+def test_class2dict_deep_and_cyclic():
+    c = DummyTestClass()
+    c.friend = DummyTestClass()
+    c.friend.friend = c
+    assert class2dict(c) == {
+        "name": "Bob",
+        "age": 50,
+        "friend": {"name": "Bob", "age": 50, "friend": "<cycle: DummyTestClass>"},
+    }
+
+    shared = [1]
+    assert class2dict({"a": shared, "b": shared}) == {"a": [1], "b": [1]}
+
+    deep = []
+    node = deep
+    for _ in range(10000):
+        node.append([])
+        node = node[0]
+    out = class2dict(deep)
+    for _ in range(10000):
+        out = out[0]
+    assert out == []
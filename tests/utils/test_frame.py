@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from py2gsuite.utils.frame import array_to_rows, dataframe_to_rows
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+
+
+def test_array_to_rows():
+    array = np.array([[1.0, np.nan], [2.0, np.inf]])
+    rows = list(array_to_rows(array, header=["a", "b"]))
+    assert rows == [["a", "b"], [1.0, ""], [2.0, ""]]
+
+    rows = list(array_to_rows(np.arange(3)))
+    assert rows == [[0], [1], [2]]
+
+
+def test_array_to_rows_datetime():
+    array = np.array(["2020-01-01T12:00", "NaT"], dtype="datetime64[s]")
+    assert list(array_to_rows(array)) == [["2020-01-01 12:00:00"], [""]]
+
+
+def test_dataframe_to_rows():
+    df = pd.DataFrame(
+        {
+            "i": [1, 2],
+            "f": [0.5, np.nan],
+            "s": ["a", None],
+            "d": pd.to_datetime(["2020-01-01", None]),
+            "n": pd.array([1, None], dtype="Int64"),
+            "o": [{"k": 1}, 3],
+        }
+    )
+    rows = list(dataframe_to_rows(df))
+    assert rows == [
+        ["i", "f", "s", "d", "n", "o"],
+        [1, 0.5, "a", "2020-01-01 00:00:00", 1, "{'k': 1}"],
+        [2, "", "", "", "", "3"],
+    ]
+    json.dumps(rows)
+
+
+def test_dataframe_to_rows_blocks():
+    df = pd.DataFrame({"x": range(25)}, index=range(100, 125))
+    rows = list(dataframe_to_rows(df, header=False, index=True, block_rows=10))
+    assert len(rows) == 25
+    assert rows[0] == [100, 0] and rows[-1] == [124, 24]
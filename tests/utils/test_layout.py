@@ -0,0 +1,56 @@
+import itertools
+
+import pytest
+
+from py2gsuite.utils.layout import (
+    PAGE_SIZE,
+    Box,
+    element_box,
+    flow_layout,
+    grid_layout,
+    layout,
+    pack_layout,
+)
+
+
+def _assert_valid(boxes, occupied=()):
+    for a, b in itertools.combinations(list(boxes) + list(occupied), 2):
+        assert not a.overlaps(b)
+    for box in boxes:
+        assert box.x >= 0 and box.y >= 0 and box.right <= PAGE_SIZE[0] and box.bottom <= PAGE_SIZE[1]
+
+
+def test_element_box():
+    size = {"width": {"magnitude": 100, "unit": "PT"}, "height": {"magnitude": 50, "unit": "PT"}}
+    transform = {"scaleX": 2, "scaleY": 1, "translateX": 10, "translateY": 20, "unit": "PT"}
+    assert element_box(size, transform) == Box(127000, 254000, 2540000, 635000)
+    assert element_box(None, transform) is None
+
+
+def test_grid_layout():
+    occupied = [Box(0, 0, 3000000, 2000000)]
+    boxes = grid_layout(6, occupied=occupied)
+    assert len(boxes) == 6
+    assert len({(b.width, b.height) for b in boxes}) == 1
+    _assert_valid(boxes, occupied)
+    assert grid_layout(0) == []
+
+
+def test_flow_layout():
+    occupied = [Box(2000000, 300000, 1000000, 1000000)]
+    boxes = flow_layout([(1500000, 800000)] * 8, occupied=occupied)
+    assert boxes[0].y == boxes[1].y
+    _assert_valid(boxes, occupied)
+
+    with pytest.raises(ValueError):
+        flow_layout([(3000000, 3000000)] * 10)
+
+
+def test_pack_layout():
+    occupied = [Box(228600, 228600, 4000000, 2000000)]
+    sizes = [(1000000, 1000000)] * 10 + [(2000000, 500000)] * 4
+    boxes = pack_layout(sizes, occupied=occupied)
+    _assert_valid(boxes, occupied)
+
+    with pytest.raises(ValueError):
+        layout([(1000000, 1000000)], mode="spiral")
@@ -0,0 +1,56 @@
+import io
+import json
+import logging
+
+import pytest
+
+from py2gsuite.utils import configure_logging, get_logger
+from py2gsuite.utils.logger import SamplingFilter
+
+
+@pytest.fixture
+def stream():
+    stream = io.StringIO()
+    yield stream
+    configure_logging(logging.INFO)
+
+
+def test_shared_handler():
+    a = get_logger("py2gsuite.test.a")
+    b = get_logger("py2gsuite.test.b")
+    get_logger("py2gsuite.test.a")
+    assert len(a.handlers) == 1
+    assert a.handlers == b.handlers
+
+
+def test_structured(stream):
+    configure_logging(structured=True, stream=stream)
+    logger = get_logger("py2gsuite.test.json")
+    logger.info("%d cells updated.", 10, extra={"cells": 10})
+    logger.debug("not shown")
+    record = json.loads(stream.getvalue())
+    assert record["message"] == "10 cells updated."
+    assert record["level"] == "INFO"
+    assert record["cells"] == 10
+
+
+def test_sampling(stream):
+    configure_logging(structured=True, sample_interval=60.0, stream=stream)
+    logger = get_logger("py2gsuite.test.sampling")
+    for i in range(100):
+        logger.info("%d rows written.", i)
+    logger.warning("kept")
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [line["message"] for line in lines] == ["0 rows written.", "kept"]
+
+    record = logging.makeLogRecord({"name": "x", "levelno": logging.INFO, "msg": "%d rows written.", "args": (1,)})
+    sampler = SamplingFilter(interval=0.0)
+    assert sampler.filter(record) and sampler.filter(record)
+
+
+def test_queue(stream):
+    configure_logging(logging.DEBUG, use_queue=True, stream=stream)
+    logger = get_logger("py2gsuite.test.queue")
+    logger.debug("queued %s", "message")
+    configure_logging(logging.INFO)  # stops the listener and flushes the queue
+    assert "queued message" in stream.getvalue()
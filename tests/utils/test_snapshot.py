@@ -0,0 +1,33 @@
+from py2gsuite.utils.snapshot import Snapshot
+
+
+def test_diff_changed_blocks():
+    rows = [[i * 10 + j for j in range(6)] for i in range(5)]
+    snapshot, blocks = Snapshot("key", block_cols=2).diff(rows)
+    assert blocks == [(0, 0, rows)]
+
+    new_rows = [list(r) for r in rows]
+    new_rows[1][3] = "x"
+    new_rows[2][2] = "y"
+    new_rows[4][0] = "z"
+    new_snapshot, blocks = snapshot.diff(new_rows)
+    assert blocks == [(1, 2, [[12, "x"], ["y", 23]]), (4, 0, [["z", 41]])]
+
+    _, blocks = new_snapshot.diff(new_rows)
+    assert blocks == []
+
+
+def test_diff_clears_removed_cells():
+    snapshot, _ = Snapshot("key", block_cols=2).diff([[1, 2, 3], [4, 5, 6]])
+    _, blocks = snapshot.diff([[1, 2]])
+    assert blocks == [(0, 2, [[""]]), (1, 0, [["", "", ""]])]
+
+
+def test_save_load(tmp_path):
+    path = str(tmp_path / "snapshot.json")
+    snapshot, _ = Snapshot("key", block_cols=2).diff([[1, 2, 3]])
+    snapshot.save(path)
+
+    loaded = Snapshot.load(path, "key", block_cols=2)
+    assert loaded.hashes == snapshot.hashes and loaded.widths == [3]
+    assert len(Snapshot.load(path, "other", block_cols=2)) == 0